@@ -46,6 +46,9 @@ modules = [
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/propeller/propeller.py',
     'scripts/aerodynamics/aerodynamics.py',
+    'scripts/aerodynamics/gridded_surrogate.py',
+    'scripts/avl/avl_workers.py',
+    'scripts/avl/avl_session.py',
     #'scripts/aerodynamics_super/aerodynamics_super.py',
     'scripts/battery/battery.py',
     'scripts/cmalpha/cmalpha.py',
@@ -55,6 +58,16 @@ modules = [
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',
     'scripts/variable_cruise_distance/variable_cruise_distance.py',
+    'scripts/mission_solvers/mission_solvers.py',
+    'scripts/mission_solvers/state_templates.py',
+    'scripts/mission_solvers/process_profiler.py',
+    'scripts/mission_solvers/incremental_process.py',
+    'scripts/carpet_plot/carpet_sweep.py',
+    'scripts/finite_difference/finite_difference.py',
+    'scripts/noise_footprint/noise_SAE_reference.py',
+    'scripts/noise_footprint/noise_footprint.py',
+    'scripts/noise_footprint/noise_metrics.py',
+    'scripts/noise_footprint/noise_resample.py',
     'scripts/noise_optimization/Optimize.py'
 ]
 
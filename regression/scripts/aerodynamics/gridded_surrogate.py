@@ -0,0 +1,154 @@
+# gridded_surrogate.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the gridded aerodynamics surrogate against the analysis it samples,
+    and the surrogate cache of the vortex lattice
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Core.filelock import filelock
+
+from mission_B737 import vehicle_setup
+
+import numpy as np
+
+import os
+import glob
+import shutil
+import tempfile
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    for wing in vehicle.wings:
+        wing.areas.wetted   = 2.0 * wing.areas.reference
+        wing.areas.exposed  = 0.8 * wing.areas.wetted
+        wing.areas.affected = 0.6 * wing.areas.wetted
+
+    cache_folder = tempfile.mkdtemp()
+
+    try:
+        for order in [1,3]:
+
+            surrogate = surrogate_setup(vehicle,order,cache_folder)
+            surrogate.initialize()
+
+            # at the grid points, the surrogate is the analysis
+            axes = surrogate.training.axes
+            grid = np.meshgrid(axes.mach_number,axes.angle_of_attack,axes.reynolds_number,indexing='ij')
+            grid = [ np.reshape(g,[-1,1]) for g in grid ]
+            check_points(surrogate,grid,1e-10)
+
+            # in between, a tolerance
+            rs   = np.random.RandomState(1)
+            mach = rs.uniform(0.1,0.7,[50,1])
+            aoa  = rs.uniform(-4.,10.,[50,1]) * Units.deg
+            re   = np.exp( rs.uniform(np.log(2.e6),np.log(4.e7),[50,1]) )
+            check_points(surrogate,[mach,aoa,re],{1:3e-2,3:1e-2}[order])
+
+            # a second build comes from the cache
+            cached = surrogate_setup(vehicle,order,cache_folder)
+            cached.initialize()
+            assert cached.cache.hits == 1 and cached.cache.misses == 0
+            for key,model in surrogate.surrogates.items():
+                assert np.all( cached.surrogates[key](mach,aoa,re) == model(mach,aoa,re) )
+
+        check_vortex_lattice_cache(vehicle,os.path.join(cache_folder,'vortex_lattice'))
+
+    finally:
+        shutil.rmtree(cache_folder)
+
+    return
+
+
+def surrogate_setup(vehicle,order,cache_folder):
+
+    surrogate = SUAVE.Analyses.Aerodynamics.Surrogates.Gridded()
+    surrogate.geometry = vehicle
+    surrogate.settings.interpolation_order = order
+    surrogate.cache.directory = cache_folder
+
+    surrogate.training.axes.mach_number     = np.linspace(0.1,0.7,7)
+    surrogate.training.axes.angle_of_attack = np.linspace(-4.,10.,8) * Units.deg
+    surrogate.training.axes.reynolds_number = np.array([1.e6,3.e6,1.e7,3.e7,1.e8])
+
+    return surrogate
+
+
+def check_vortex_lattice_cache(vehicle,cache_folder):
+
+    def vortex_lattice():
+        analysis = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+        analysis.geometry = vehicle
+        analysis.cache.directory    = cache_folder
+        analysis.cache.lock_timeout = 1.
+        return analysis
+
+    built = vortex_lattice()
+    built.initialize()
+    assert built.cache.hits == 0 and built.cache.misses == 1
+
+    # one complete entry, nothing left aside
+    entries = glob.glob(os.path.join(cache_folder,'*.pkl'))
+    assert len(entries) == 1
+    assert sorted(os.listdir(cache_folder)) == [os.path.basename(entries[0])]
+
+    # a hit loads the entry without waiting on its build lock
+    with filelock(entries[0] + '.build'):
+        cached = vortex_lattice()
+        cached.initialize()
+    assert cached.cache.hits == 1 and cached.cache.misses == 0
+
+    aoa = np.linspace(-5.,10.,7) * Units.deg
+    assert np.all( cached.training.lift_coefficient == built.training.lift_coefficient )
+    assert np.all( cached.surrogates.lift_coefficient(aoa) == built.surrogates.lift_coefficient(aoa) )
+
+    return
+
+
+def check_points(surrogate,points,tolerance):
+
+    mach, aoa, re = points
+    n = mach.shape[0]
+
+    # the analysis, at the training temperature
+    inputs = Data()
+    inputs.mach_number     = mach
+    inputs.angle_of_attack = aoa
+    inputs.reynolds_number = re
+    truth = surrogate.sample_points(inputs)
+
+    # the surrogate
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+    state.conditions.freestream.mach_number     = mach
+    state.conditions.freestream.reynolds_number = re
+    state.conditions.aerodynamics.angle_of_attack = aoa
+
+    results = surrogate.evaluate(state)
+
+    for key in ['lift_coefficient','drag_coefficient','induced_drag_coefficient']:
+        err = np.max( np.abs(results[key]-truth[key]) ) / np.max( np.abs(truth[key]) )
+        print '%-25s error: %.3e' % (key,err)
+        assert err < tolerance , 'Check Failed : %s' % key
+
+    assert np.all( state.conditions.aerodynamics.lift_coefficient == results.lift_coefficient )
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Gridded surrogate test passed!'
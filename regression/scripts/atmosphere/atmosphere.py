@@ -9,6 +9,7 @@
 
 import SUAVE
 import numpy as np
+import copy
 import matplotlib.pyplot as plt
 from SUAVE.Core import Units
 
@@ -86,6 +87,17 @@ def main():
     assert( T_err   < 1e-5 )
     assert( rho_err < 1e-5 )
     assert( a_err   < 1e-5 )    
+    
+    # outputs into given data, and from a copy
+    results = SUAVE.Core.Data()
+    atm.compute_values(z,results=results)
+    for key in ['pressure','temperature','density','speed_of_sound','dynamic_viscosity']:
+        assert np.all( results[key] == conditions[key] )
+    
+    atm_copy   = copy.deepcopy(atm)
+    atm_copy.breaks.temperature = atm.breaks.temperature + 10.
+    conditions = atm_copy.compute_values(z)
+    assert np.max( np.abs(conditions.temperature - results.temperature - 10.) ) < 1e-9
  
     return
 
@@ -0,0 +1,121 @@
+# avl_session.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks that a persistent avl session gives the same results as one
+    avl run per batch, with a stand-in for the avl binary
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.append('../B737')
+from mission_B737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    run_folder = tempfile.mkdtemp()
+
+    try:
+        batch = avl_setup(vehicle,os.path.join(run_folder,'batch'),False)
+        session = avl_setup(vehicle,os.path.join(run_folder,'session'),True)
+
+        # a few small batches, as in a mission
+        tic = time.time()
+        batch_results = [ batch.evaluate_conditions(conditions_setup(vehicle,i)) for i in range(5) ]
+        print 'batch runs   : %.2f s' % (time.time()-tic)
+
+        tic = time.time()
+        session_results = [ session.evaluate_conditions(conditions_setup(vehicle,i)) for i in range(5) ]
+        print 'session runs : %.2f s' % (time.time()-tic)
+
+        for res_batch,res_session in zip(batch_results,session_results):
+            check_results(res_batch,res_session)
+
+        # one process, one geometry load, the same files
+        process = session.session.process
+        assert session.session.is_running()
+        files = sorted(os.listdir(session.settings.filenames.run_folder))
+        session.evaluate_conditions(conditions_setup(vehicle,5))
+        assert session.session.process is process
+        assert sorted(os.listdir(session.settings.filenames.run_folder)) == files
+
+        # a new wing is loaded into the same process
+        vehicle.wings.main_wing.spans.projected *= 1.2
+        res_batch   = batch.evaluate_conditions(conditions_setup(vehicle,0))
+        res_session = session.evaluate_conditions(conditions_setup(vehicle,0))
+        assert session.session.process is process
+        assert np.all( res_session.aerodynamics.lift_coefficient != session_results[0].aerodynamics.lift_coefficient )
+        check_results(res_batch,res_session)
+
+        session.close_session()
+        assert not session.session.is_running()
+        assert not os.path.exists(session.settings.filenames.run_folder)
+
+    finally:
+        shutil.rmtree(run_folder)
+
+    return
+
+
+def avl_setup(vehicle,run_folder,persistent):
+
+    stand_in = os.path.join(os.path.dirname(os.path.abspath(__file__)),'avl_stand_in.py')
+
+    avl = SUAVE.Analyses.Aerodynamics.AVL()
+    avl.features   = vehicle
+    avl.keep_files = False
+    avl.settings.persistent_session = persistent
+    avl.settings.filenames.avl_bin_name = stand_in
+    avl.settings.filenames.run_folder   = run_folder
+    avl.initialize()
+
+    return avl
+
+
+def conditions_setup(vehicle,i):
+
+    n_cases = 4
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n_cases)
+    conditions.weights.total_mass[:,0]           = vehicle.mass_properties.max_takeoff
+    conditions.freestream.mach_number[:,0]       = 0.3 + 0.05 * i
+    conditions.freestream.velocity[:,0]          = conditions.freestream.mach_number[:,0] * 340.
+    conditions.freestream.density[:,0]           = 1.225
+    conditions.freestream.gravity[:,0]           = 9.81
+    conditions.aerodynamics.angle_of_attack[:,0] = np.linspace(-2.,6.,n_cases) * Units.deg + i * Units.deg
+
+    return conditions
+
+
+def check_results(res_batch,res_session):
+
+    for key in ['lift_coefficient','pitch_moment_coefficient','cm_alpha','neutral_point']:
+        assert np.all( res_batch.aerodynamics[key] == res_session.aerodynamics[key] ) , 'Check Failed : %s' % key
+    assert np.all( res_batch.aerodynamics.drag_breakdown.induced.total == res_session.aerodynamics.drag_breakdown.induced.total )
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'AVL session test passed!'
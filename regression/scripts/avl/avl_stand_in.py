@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# avl_stand_in.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" a stand-in for the avl binary, for testing the SUAVE avl interface
+    where avl is not installed
+
+    usage:
+        avl = SUAVE.Analyses.Aerodynamics.AVL()
+        avl.settings.filenames.avl_bin_name = '/path/to/avl_stand_in.py'
+
+    Reads the same command line and the same commands on stdin as avl
+    does from the SUAVE input decks and sessions (LOAD, CASE, OPER, case
+    index, x, st, a blank line to leave OPER, QUIT), and writes stability
+    derivative files in the avl format read by
+    SUAVE.Methods.Aerodynamics.AVL.read_results. Commands that are not
+    understood are echoed and skipped. Stdin is read a line at a time and
+    the avl prompts are printed after each command, results are written
+    as soon as they are asked for.
+
+    The numbers come from lifting line theory for a wing of the reference
+    area and span in the geometry file, they are only meant to be smooth
+    and repeatable:
+        CL  = CLa * alpha, with the Helmbold lift slope at the mach number
+        CDi = CL**2 / (pi * e * AR), with e = 0.95
+        Cm  = -CLa * alpha * 0.1, with the neutral point 0.1 cref aft of xref
+
+    Setting the environment variable AVL_STAND_IN_DELAY adds that many
+    seconds per executed case, to stand in for the cost of a real run.
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+import os
+import time
+import math
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    geometry = read_geometry(sys.argv[1])
+    delay    = float(os.environ.get('AVL_STAND_IN_DELAY',0.))
+
+    cases   = {}
+    current = 1
+    result  = None
+    menu    = 'AVL'
+
+    sys.stdout.write(' AVL stand-in\n')
+    prompt(menu)
+
+    line = sys.stdin.readline()
+    while line:
+
+        command = line.strip()
+        keyword = command.split(None,1)[0].upper() if command else ''
+
+        # top level
+        if menu == 'AVL':
+
+            if keyword == 'LOAD':
+                geometry = read_geometry(command.split(None,1)[1])
+
+            elif keyword == 'CASE':
+                cases = read_run_cases(command.split(None,1)[1])
+
+            elif keyword == 'OPER':
+                menu = 'OPER'
+
+            elif keyword == 'QUIT':
+                break
+
+            elif command:
+                sys.stdout.write(' ignored: %s\n' % command)
+
+        # operating points
+        else:
+
+            if not command:
+                menu = 'AVL'
+
+            elif command.isdigit():
+                current = int(command)
+
+            elif command == 'x':
+                time.sleep(delay)
+                result = solve(geometry,cases[current])
+                sys.stdout.write(' Run case %d: %s executed\n' % (current,result['tag']))
+
+            elif command == 'st':
+                file_name = sys.stdin.readline().strip()
+                write_results(file_name,geometry,result)
+
+            elif keyword == 'QUIT':
+                break
+
+            else:
+                sys.stdout.write(' ignored: %s\n' % command)
+
+        prompt(menu)
+        line = sys.stdin.readline()
+
+    return
+
+
+def prompt(menu):
+    """ asks for the next command, as avl does """
+
+    if menu == 'AVL':
+        sys.stdout.write('\n AVL   c>  ')
+    else:
+        sys.stdout.write('\n OPER (AVL)   c>  ')
+    sys.stdout.flush()
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Inputs
+# ----------------------------------------------------------------------
+
+def read_geometry(file_name):
+    """ the reference values from the header of an avl geometry file """
+
+    with open(file_name,'r') as geometry_file:
+        lines = geometry_file.readlines()
+
+    geometry = {'tag':lines[0].strip()}
+    for i,line in enumerate(lines):
+        if line.startswith('#Sref'):
+            geometry['Sref'],geometry['Cref'],geometry['Bref'] = [ float(v) for v in lines[i+1].split() ]
+        if line.startswith('#Xref'):
+            geometry['Xref'],geometry['Yref'],geometry['Zref'] = [ float(v) for v in lines[i+1].split() ]
+
+    return geometry
+
+
+def read_run_cases(file_name):
+    """ the conditions of each case in an avl run file, by case index """
+
+    cases = {}
+    case  = None
+
+    with open(file_name,'r') as run_file:
+        for line in run_file:
+            words = line.split()
+            if line.startswith(' Run case'):
+                index = int(words[2].rstrip(':'))
+                case  = {'tag':words[3],'alpha':0.,'beta':0.,'mach':0.}
+                cases[index] = case
+            elif case is None or '=' not in line:
+                continue
+            elif words[0] in ['alpha','beta'] and words[1] == '->':
+                case[words[0]] = float(words[-1])
+            elif words[0] == 'Mach':
+                case['mach'] = float(words[-1])
+
+    return cases
+
+
+# ----------------------------------------------------------------------
+#  Solution
+# ----------------------------------------------------------------------
+
+def solve(geometry,case):
+    """ lifting line coefficients of a case """
+
+    AR    = geometry['Bref']**2 / geometry['Sref']
+    beta  = math.sqrt(max(1. - case['mach']**2,0.01))
+    alpha = case['alpha'] * math.pi / 180.
+
+    CLa = 2. * math.pi * AR / (2. + math.sqrt(AR**2 * beta**2 + 4.))
+    e   = 0.95
+    CL  = CLa * alpha
+    CDi = CL**2 / (math.pi * e * AR)
+    Cma = -CLa * 0.1
+    Cm  = Cma * alpha
+
+    result = {
+        'tag'  : case['tag'],
+        'case' : case,
+        'CL'   : CL,
+        'CDi'  : CDi,
+        'Cm'   : Cm,
+        'e'    : e,
+        'CLa'  : CLa,
+        'Cma'  : Cma,
+        'Xnp'  : geometry['Xref'] + 0.1 * geometry['Cref'],
+    }
+
+    return result
+
+
+# ----------------------------------------------------------------------
+#  Outputs
+# ----------------------------------------------------------------------
+
+def write_results(file_name,geometry,result):
+    """ writes a stability derivative file in the avl layout """
+
+    case = result['case']
+
+    lines = [
+        ' ---------------------------------------------------------------',
+        ' Vortex Lattice Output -- Total Forces',
+        '',
+        ' Configuration: %s' % geometry['tag'],
+        '     # Surfaces =   0',
+        '     # Strips   =   0',
+        '     # Vortices =   0',
+        '',
+        fields(('  Sref =',8,18,geometry['Sref']),('  Cref =',26,36,geometry['Cref']),('  Bref =',44,54,geometry['Bref'])),
+        fields(('  Xref =',8,18,geometry['Xref']),('  Yref =',26,36,geometry['Yref']),('  Zref =',44,54,geometry['Zref'])),
+        '',
+        ' Standard axis orientation,  X fwd, Z down',
+        '',
+        ' Run case: %s' % result['tag'],
+        '',
+        fields(('  Alpha =',10,20,case['alpha']),('     pb/2V =',32,42,0.)),
+        fields(('  Beta  =',10,20,case['beta']) ,('     qc/2V =',32,42,0.)),
+        fields(('  Mach  =',10,20,case['mach']) ,('     rb/2V =',32,42,0.)),
+        '',
+        fields(('  CXtot =',10,20,0.)           ,('     Cltot =',32,42,0.)),
+        fields(('  CYtot =',10,20,0.)           ,('     Cmtot =',32,42,result['Cm'])),
+        fields(('  CZtot =',10,20,-result['CL']),('     Cntot =',32,42,0.)),
+        '',
+        fields(('  CLtot =',10,20,result['CL'])),
+        fields(('  CDtot =',10,20,result['CDi'])),
+        fields(('  CDvis =',10,20,0.)           ,('     CDind =',32,42,result['CDi'])),
+        fields(('  CLff  =',10,20,result['CL']) ,('     CDff  =',32,42,result['CDi'])),
+        fields(('  CYff  =',10,20,0.)           ,('         e =',32,42,result['e'])),
+        '',
+        ' ---------------------------------------------------------------',
+        '',
+        ' Stability-axis derivatives...',
+        '',
+        '                             alpha                beta',
+        '                  ----------------    ----------------',
+        '',
+        fields((" z' force CL |    CLa =",25,35,result['CLa']),('    CLb =',44,55,0.)),
+        fields((" y  force CY |    CYa =",25,35,0.)           ,('    CYb =',44,55,0.)),
+        fields((" x' mom.  Cl'|    Cla =",25,35,0.)           ,('    Clb =',44,55,0.)),
+        fields((" y  mom.  Cm |    Cma =",25,35,result['Cma']),('    Cmb =',44,55,0.)),
+        fields((" z' mom.  Cn'|    Cna =",25,35,0.)           ,('    Cnb =',44,55,0.)),
+    ]
+
+    # pad to the neutral point line
+    lines = lines + [''] * (50 - len(lines))
+    lines.append(fields((' Neutral point  Xnp =',22,33,result['Xnp'])))
+    lines.append('')
+
+    with open(file_name,'w') as results_file:
+        results_file.write('\n'.join(lines))
+
+    return
+
+
+def fields(*items):
+    """ a line of labels, each followed by its value right aligned in the columns start:end """
+
+    line = ''
+    for label,start,end,value in items:
+        line = (line + label).ljust(start)
+        line = line + ('%.5f' % value).rjust(end-start)
+
+    return line
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# avl_workers.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks that avl cases split over several worker processes give the
+    same results as one process, with a stand-in for the avl binary
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.append('../B737')
+from mission_B737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    stand_in = os.path.join(os.path.dirname(os.path.abspath(__file__)),'avl_stand_in.py')
+
+    # cases
+    n_cases = 7
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n_cases)
+    conditions.weights.total_mass[:,0]           = vehicle.mass_properties.max_takeoff
+    conditions.freestream.mach_number[:,0]       = np.linspace(0.3,0.7,n_cases)
+    conditions.freestream.velocity[:,0]          = conditions.freestream.mach_number[:,0] * 340.
+    conditions.freestream.density[:,0]           = 1.225
+    conditions.freestream.gravity[:,0]           = 9.81
+    conditions.aerodynamics.angle_of_attack[:,0] = np.linspace(-4.,10.,n_cases) * Units.deg
+
+    run_folder = tempfile.mkdtemp()
+    os.environ['AVL_STAND_IN_DELAY'] = '0.1'
+
+    try:
+        results = {}
+        for n_workers in [1,3]:
+
+            avl = SUAVE.Analyses.Aerodynamics.AVL()
+            avl.features = vehicle
+            avl.keep_files = False
+            avl.settings.number_of_workers = n_workers
+            avl.settings.filenames.avl_bin_name = stand_in
+            avl.settings.filenames.run_folder   = os.path.join(run_folder,'workers_%i' % n_workers)
+            avl.initialize()
+
+            tic = time.time()
+            results[n_workers] = avl.evaluate_conditions(conditions)
+            print '%i worker(s): %.2f s' % (n_workers,time.time()-tic)
+
+            assert not os.path.exists(avl.settings.filenames.run_folder)
+
+    finally:
+        del os.environ['AVL_STAND_IN_DELAY']
+        shutil.rmtree(run_folder)
+
+    serial   = results[1].aerodynamics
+    parallel = results[3].aerodynamics
+
+    # the stand-in lift, to check the cases kept their order
+    S     = vehicle.wings.main_wing.areas.reference
+    b     = vehicle.wings.main_wing.spans.projected
+    AR    = b**2 / S
+    beta  = np.sqrt(1. - conditions.freestream.mach_number**2)
+    CLa   = 2. * np.pi * AR / (2. + np.sqrt(AR**2 * beta**2 + 4.))
+    CL    = CLa * conditions.aerodynamics.angle_of_attack
+
+    err = np.max(np.abs(parallel.lift_coefficient - CL))
+    print 'lift coefficient error: %.3e' % err
+    assert err < 1e-4
+
+    for key in ['lift_coefficient','pitch_moment_coefficient','cm_alpha','neutral_point']:
+        assert np.all( serial[key] == parallel[key] ) , 'Check Failed : %s' % key
+    assert np.all( serial.drag_breakdown.induced.total == parallel.drag_breakdown.induced.total )
+    assert np.all( results[1].freestream.mach_number == results[3].freestream.mach_number )
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'AVL workers test passed!'
@@ -0,0 +1,144 @@
+# carpet_sweep.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the carpet plot sweep of a small analytic problem: in a pool
+    of processes, streamed to a table and resumed from it
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses import Process
+from SUAVE.Optimization import Nexus, carpet_plot
+from SUAVE.Optimization.carpet_plot import serpentine
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n = 5
+    table_file = 'carpet_sweep.dat'
+    if os.path.exists(table_file):
+        os.remove(table_file)
+
+    # the order of the points
+    runs = serpentine(3)
+    assert runs == [ [(0,0),(0,1),(0,2)] , [(1,2),(1,1),(1,0)] , [(2,0),(2,1),(2,2)] ]
+
+    # one point after the other
+    problem = setup()
+    serial  = carpet_plot(problem, n, plot_obj=0)
+    assert problem.evaluation_count == n*n
+
+    x, y = np.meshgrid(serial.inputs[0,:],serial.inputs[1,:])
+    assert np.allclose( serial.objective , (x-1.)**2 + (y-2.)**2 + 1. )
+    assert np.allclose( serial.constraint_val[0] , (x + y) / 2. )
+
+    # in a pool of processes, streamed to a table
+    problem  = setup()
+    parallel = carpet_plot(problem, n, plot_obj=0, workers=2, table_file=table_file)
+    assert problem.evaluation_count == 0
+    assert np.all( parallel.objective == serial.objective )
+    assert np.all( parallel.constraint_val == serial.constraint_val )
+
+    # interrupted half way, the last line cut short
+    lines = open(table_file).readlines()
+    assert len(lines) == n*n + 1
+    with open(table_file,'w') as table:
+        table.writelines(lines[:13])
+        table.write(lines[13][:10])
+
+    problem = setup()
+    resumed = carpet_plot(problem, n, plot_obj=0, table_file=table_file)
+    assert problem.evaluation_count == n*n - 12
+    assert np.all( resumed.objective == serial.objective )
+    assert np.all( resumed.constraint_val == serial.constraint_val )
+
+    # a table of another grid
+    try:
+        carpet_plot(setup(), n+1, plot_obj=0, table_file=table_file)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError , 'a table of another grid was used'
+
+    # tables of another problem, by their names or their columns
+    lines   = open(table_file).readlines()
+    renamed = [ lines[0].replace('\tg\n','\th\n') ] + lines[1:]
+    widened = lines[:5] + [ lines[5][:-1] + '\t0.0\n' ] + lines[6:]
+    for changed in [renamed,widened]:
+        with open(table_file,'w') as table:
+            table.writelines(changed)
+        try:
+            carpet_plot(setup(), n, plot_obj=0, table_file=table_file)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError , 'a table of another problem was used'
+
+    os.remove(table_file)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Problem
+# ----------------------------------------------------------------------
+
+def setup():
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    # [ tag , initial, [lb,ub], scaling, units ]
+    problem.inputs = np.array([
+        [ 'x' , 0. , ( -1. , 3. ) , 1. , Units.less ],
+        [ 'y' , 0. , (  0. , 4. ) , 1. , Units.less ],
+    ])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'f' , 1. , Units.less ],
+    ])
+
+    # [ tag, sense, edge, scaling, units ]
+    problem.constraints = np.array([
+        [ 'g' , '<' , 4. , 2. , Units.less ],
+    ])
+
+    # [ 'alias' , ['data.path1.name','data.path2.name'] ]
+    problem.aliases = [
+        [ 'x' , 'summary.x' ],
+        [ 'y' , 'summary.y' ],
+        [ 'f' , 'summary.f' ],
+        [ 'g' , 'summary.g' ],
+    ]
+
+    nexus.procedure = Process()
+    nexus.procedure.analytic = analytic
+
+    return nexus
+
+
+def analytic(nexus):
+    summary = nexus.summary
+    summary.f = (summary.x-1.)**2 + (summary.y-2.)**2 + 1.
+    summary.g = summary.x + summary.y
+    return nexus
+
+
+if __name__ == '__main__':
+    main()
+    print 'Carpet sweep test passed!'
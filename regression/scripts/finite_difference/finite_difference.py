@@ -0,0 +1,152 @@
+# finite_difference.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the gradients of a nexus: forward, central and complex step
+    differences, in a pool of processes, and SLSQP driven by them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses import Process
+from SUAVE.Optimization import Nexus
+import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+
+import numpy as np
+
+import gc
+import pickle
+from copy import deepcopy
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    problem = setup()
+    x = np.array([0.5,3.])
+
+    # the exact gradients, of the scaled inputs
+    grad_exact = np.array([ 2.*(x[0]*2.-1.)*2. , 2.*(x[1]-2.)*np.exp(x[1]-2.) + (x[1]-2.)**2*np.exp(x[1]-2.) ])
+    jac_exact  = np.array([[ 2./4. , 1./4. ],
+                           [ 0.    , 2.*x[1] ]])
+
+    settings = problem.finite_difference_settings
+
+    for method,step,tol in [('forward',1e-8,1e-6),('central',1e-6,1e-8),('complex',1e-20,1e-14)]:
+        settings.method = method
+        settings.step   = step
+        grad_obj, jac_con = problem.finite_difference(x)
+        print method, np.max(np.abs(grad_obj-grad_exact)), np.max(np.abs(jac_con-jac_exact))
+        assert np.allclose( grad_obj , grad_exact , rtol=tol , atol=tol )
+        assert np.allclose( jac_con  , jac_exact  , rtol=tol , atol=tol )
+
+        # the same in a pool
+        settings.workers = 2
+        grad_pool, jac_pool = problem.finite_difference(x)
+        settings.workers = 1
+        assert np.all( grad_pool == grad_obj )
+        assert np.all( jac_pool  == jac_con  )
+
+    # the pool is kept until closed
+    settings.workers = 2
+    workers = problem.pool()._pool
+    settings.workers = 1
+    assert all([ worker.is_alive() for worker in workers ])
+
+    problem.close_pool()
+    assert dict.get(problem,'_pool') is None
+    assert not any([ worker.is_alive() for worker in workers ])
+
+    # the pool belongs to its nexus, not to copies of it
+    nexus = Nexus()
+    nexus.finite_difference_settings.workers = 2
+    workers = nexus.pool()._pool
+    assert dict.get(deepcopy(nexus),'_pool') is None
+    assert dict.get(pickle.loads(pickle.dumps(nexus,2)),'_pool') is None
+
+    # and stops with it, if not closed
+    del nexus
+    gc.collect()
+    assert not any([ worker.is_alive() for worker in workers ])
+
+    # the complex step leaves the nexus at the real point
+    assert np.all( np.isreal( problem.summary.f ) )
+
+    # SLSQP with the gradients of the nexus
+    problem = setup()
+    problem.finite_difference_settings.workers = 2
+    problem.finite_difference_settings.method  = 'central'
+    outputs = scipy_setup.SciPy_Solve(problem,FD='parallel')
+
+    # which closes its pool
+    assert dict.get(problem,'_pool') is None
+
+    # as with the differences of SLSQP
+    outputs_single = scipy_setup.SciPy_Solve(setup())
+
+    print outputs, outputs_single
+    assert np.allclose( outputs , outputs_single , atol=1e-6 )
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Problem
+# ----------------------------------------------------------------------
+
+def setup():
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    # [ tag , initial, [lb,ub], scaling, units ]
+    problem.inputs = np.array([
+        [ 'x' , 2. , ( -4. , 4. ) , 2. , Units.less ],
+        [ 'y' , 3. , (  0. , 4. ) , 1. , Units.less ],
+    ])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'f' , 1. , Units.less ],
+    ])
+
+    # [ tag, sense, edge, scaling, units ]
+    problem.constraints = np.array([
+        [ 'g' , '<' , 2. , 4. , Units.less ],
+        [ 'h' , '>' , 4. , 1. , Units.less ],
+    ])
+
+    # [ 'alias' , ['data.path1.name','data.path2.name'] ]
+    problem.aliases = [
+        [ 'x' , 'summary.x' ],
+        [ 'y' , 'summary.y' ],
+        [ 'f' , 'summary.f' ],
+        [ 'g' , 'summary.g' ],
+        [ 'h' , 'summary.h' ],
+    ]
+
+    nexus.procedure = Process()
+    nexus.procedure.analytic = analytic
+
+    return nexus
+
+
+def analytic(nexus):
+    summary = nexus.summary
+    summary.f = (summary.x-1.)**2 + (summary.y-2.)**2*np.exp(summary.y-2.) + 1.
+    summary.g = summary.x + summary.y
+    summary.h = summary.y**2
+    return nexus
+
+
+if __name__ == '__main__':
+    main()
+    print 'Finite difference test passed!'
@@ -0,0 +1,132 @@
+# incremental_process.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the incremental evaluation of processes: steps that declare
+    what they read and write are skipped only when that is unchanged,
+    and the B737 mission gives the same results with it
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../B737')
+
+import mission_B737
+from mission_solvers import mission_setup, check_results
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+
+import numpy as np
+
+from copy import deepcopy
+from time import time
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_steps()
+
+    vehicle  = mission_B737.vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    mission_B737.simple_sizing(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    mission = mission_setup(analyses)
+
+    t0 = time()
+    results = mission.evaluate()
+    time_full = time() - t0
+
+    Process.incremental = True
+    try:
+        t0 = time()
+        results_incremental = mission.evaluate()
+        time_incremental = time() - t0
+    finally:
+        Process.incremental = False
+
+    print 'mission, full: %.2f s  incremental: %.2f s' % (time_full,time_incremental)
+
+    check_results(results_incremental,results)
+
+    return
+
+
+def check_steps():
+    """ a step counting its calls, in a process """
+
+    calls = []
+
+    def scale(segment,state):
+        calls.append(1)
+        state.outputs.y = state.inputs.x * segment.factor
+
+    scale.reads  = ['state.inputs.x','segment.factor']
+    scale.writes = ['state.outputs.y']
+
+    process = Process()
+    process.scale = scale
+
+    segment = Data()
+    segment.factor = 2.
+
+    state = Data()
+    state.inputs  = Data()
+    state.outputs = Data()
+    state.inputs.x = np.ones([4,1])
+
+    def count(*args):
+        del calls[:]
+        process(*args)
+        return len(calls)
+
+    # not incremental, always runs
+    assert count(segment,state) == 1
+    assert count(segment,state) == 1
+
+    Process.incremental = True
+    try:
+        assert count(segment,state) == 1
+        assert count(segment,state) == 0
+
+        # an input changed in place
+        state.inputs.x[2,0] = 3.
+        assert count(segment,state) == 1
+        assert count(segment,state) == 0
+
+        # a number changed
+        segment.factor = 3.
+        assert count(segment,state) == 1
+        assert np.all( state.outputs.y[:,0] == [3.,3.,9.,3.] )
+
+        # an output changed by someone else
+        state.outputs.y[0,0] = 0.
+        assert count(segment,state) == 1
+        assert state.outputs.y[0,0] == 3.
+
+        # another state
+        assert count(segment,deepcopy(state)) == 1
+        assert count(segment,state) == 1
+
+    finally:
+        Process.incremental = False
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Incremental process test passed!'
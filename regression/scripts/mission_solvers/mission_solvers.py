@@ -0,0 +1,214 @@
+# mission_solvers.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" compares the root finding options of an all at once mission
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../B737')
+
+import mission_B737
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+from time import time
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = mission_B737.vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    mission_B737.simple_sizing(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    # baseline, fsolve differences on its own
+    mission = mission_setup(analyses)
+    results_fd, time_fd = evaluate(mission)
+
+    # segment block structured jacobian
+    mission = mission_setup(analyses)
+    mission.state.numerics.solver_jacobian = 'block_sparse'
+    results_bs, time_bs = evaluate(mission)
+
+    # newton root finder, warm started with its jacobian reused on a second evaluation
+    mission = mission_setup(analyses)
+    mission.state.numerics.solver_jacobian = 'block_sparse'
+    mission.settings.root_finder = SUAVE.Methods.Missions.Segments.Newton_Root()
+    mission.warm_start.enabled = True
+    results_nr, time_nr = evaluate(mission)
+    results_nr, time_rr = evaluate(mission)
+
+    history = mission.settings.root_finder.history[mission.tag]
+
+    # another mission of the same tag, sharing the root finder, builds its own jacobian
+    other = mission_setup(analyses)
+    other.state.numerics.solver_jacobian = 'block_sparse'
+    other.segments.cruise.distance = 1000. * Units.km
+    other.settings.root_finder = mission.settings.root_finder
+    other.evaluate()
+
+    other_history = other.settings.root_finder.history[other.tag]
+
+    # conditions kept in one array per segment
+    mission = mission_setup(analyses)
+    mission.state.numerics.solver_jacobian = 'block_sparse'
+    for segment in mission.segments:
+        segment.state.numerics.contiguous_conditions = True
+    results_cc, time_cc = evaluate(mission)
+
+    # independent missions, in serial and in a process pool
+    missions = SUAVE.Analyses.Mission.Mission.Container()
+    for distance in [2000.,1000.]:
+        mission = mission_setup(analyses)
+        mission.tag = 'mission_%i_km' % distance
+        mission.state.numerics.solver_jacobian = 'block_sparse'
+        mission.segments.cruise.distance = distance * Units.km
+        missions.append(mission)
+
+    results_serial, time_serial = evaluate(missions)
+    missions.executor.mode = 'process'
+    results_pool, time_pool = evaluate(missions)
+    missions.executor.mode = 'batch'
+    missions.executor.shared_jacobian = True
+    results_batch, time_batch = evaluate(missions)
+
+    print 'fsolve differencing  : %.2f s' % time_fd
+    print 'block sparse jacobian: %.2f s' % time_bs
+    print 'newton root          : %.2f s' % time_nr
+    print 'newton root, reused  : %.2f s' % time_rr
+    print 'contiguous conditions: %.2f s' % time_cc
+    print 'newton iterations    : %i' % history.iterations
+    print 'jacobian evaluations : %i' % history.jacobian_evaluations
+    print 'missions in serial   : %.2f s' % time_serial
+    print 'missions in processes: %.2f s' % time_pool
+    print 'missions in a batch  : %.2f s' % time_batch
+
+    check_results(results_bs,results_fd)
+    check_results(results_nr,results_fd)
+    check_results(results_cc,results_bs)
+
+    # merged segments, the buffers stacked at once
+    merged    = results_cc.merged().conditions
+    reference = results_bs.merged().conditions
+    assert merged.keys() == reference.keys()
+    assert merged.buffer().shape[0] == 3 * mission.segments.cruise.state.numerics.number_control_points
+    assert np.allclose( merged.pack_array() , reference.pack_array() , rtol=1e-12 , atol=0. )
+
+    assert history.converged
+    assert history.jacobian_evaluations == 0
+    assert other_history.converged
+    assert other_history.jacobian_evaluations > 0
+
+    assert results_pool.keys() == missions.keys()
+    for key in missions.keys():
+        check_results(results_pool[key],results_serial[key])
+        check_results(results_batch[key],results_serial[key])
+    check_results(results_pool.mission_2000_km,results_bs)
+
+    return
+
+
+def evaluate(mission):
+    t0 = time()
+    results = mission.evaluate()
+    return results, time()-t0
+
+
+def check_results(new_results,old_results):
+
+    check_list = [
+        'segments.climb.conditions.propulsion.throttle',
+        'segments.cruise.conditions.aerodynamics.angle_of_attack',
+        'segments.cruise.conditions.propulsion.throttle',
+        'segments.descent.conditions.weights.total_mass',
+    ]
+
+    for k in check_list:
+        old_val = old_results.deep_get(k)
+        new_val = new_results.deep_get(k)
+        err = np.max( np.abs( (new_val-old_val)/old_val ) )
+        print k
+        print 'Error:' , err
+        assert err < 1e-6 , 'Check Failed : %s' % k
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Mission
+# ----------------------------------------------------------------------
+
+def mission_setup(analyses):
+
+    mission = SUAVE.Analyses.Mission.All_At_Once()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # ------------------------------------------------------------------
+    #   Climb Segment: constant speed, constant rate
+    # ------------------------------------------------------------------
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate()
+    segment.tag = "climb"
+
+    segment.analyses.extend( analyses.takeoff )
+
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 5.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment: constant mach, constant altitude
+    # ------------------------------------------------------------------
+
+    segment = Segments.Cruise.Constant_Mach_Constant_Altitude()
+    segment.tag = "cruise"
+
+    segment.analyses.extend( analyses.cruise )
+
+    segment.mach     = 0.78
+    segment.distance = 2000.00 * Units.km
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Descent Segment: constant speed, constant rate
+    # ------------------------------------------------------------------
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate()
+    segment.tag = "descent"
+
+    segment.analyses.extend( analyses.landing )
+
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+
+    mission.append_segment(segment)
+
+    return mission
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# process_profiler.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" profiles the B737 mission with the Process_Profiler, and checks that
+    the results are those of the mission without it
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../B737')
+
+import mission_B737
+from mission_solvers import mission_setup, check_results
+
+import SUAVE
+from SUAVE.Analyses import Process, Process_Profiler
+
+import os
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = mission_B737.vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    mission_B737.simple_sizing(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    mission = mission_setup(analyses)
+
+    results = mission.evaluate()
+
+    # the same mission, profiled
+    profiler = Process_Profiler()
+    with profiler:
+        results_profiled = mission.evaluate()
+
+    assert Process.profiler is None
+
+    check_results(results_profiled,results)
+
+    print profiler.table(n_rows=10)
+    print
+    print profiler.table(sort='self_time',n_rows=10)
+
+    records = profiler.records
+
+    # steps are keyed by their dotted path
+    path = 'the_mission.segments.cruise.process.iterate.conditions.aerodynamics'
+    assert records.has_key(path)
+    assert records[path].calls == records['the_mission.segments.climb.process.iterate.conditions.aerodynamics'].calls
+    assert records[path].time >= records[path + '.drag'].time >= records[path + '.drag'].self_time
+
+    # the self times of the stacks add up to the time of the outermost steps
+    total = sum([ records[stack[0]].time for stack in profiler.stacks.keys() if len(stack) == 1 ])
+    assert abs( sum(profiler.stacks.values()) - total ) < 1e-6 * len(records)
+
+    # collapsed stacks
+    filename = 'process_profiler.folded'
+    profiler.save_collapsed(filename)
+    with open(filename) as folded:
+        lines = folded.readlines()
+    os.remove(filename)
+
+    assert len(lines) == len(profiler.stacks)
+    for line in lines:
+        frames, microseconds = line.rsplit(' ',1)
+        assert int(microseconds) >= 0
+    assert any([ line.endswith(';aerodynamics;drag %s' % line.rsplit(' ',1)[1]) for line in lines ])
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Process profiler test passed!'
@@ -0,0 +1,87 @@
+# state_templates.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" compares segment states made from their templates by instantiate()
+    with deep copies of them, in time and in mission results
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../B737')
+
+import mission_B737
+from mission_solvers import mission_setup, check_results
+
+import SUAVE
+
+import numpy as np
+
+from copy import deepcopy
+from time import time
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = mission_B737.vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    mission_B737.simple_sizing(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    mission = mission_setup(analyses)
+
+    # the states of the segments, both ways
+    n_copies = 200
+    for segment in [mission] + mission.segments.values():
+
+        t0 = time()
+        for i in range(n_copies):
+            state = deepcopy(segment.state)
+        time_copy = (time()-t0) / n_copies
+
+        t0 = time()
+        for i in range(n_copies):
+            state = segment.state.instantiate()
+        time_template = (time()-t0) / n_copies
+
+        print '%-12s deepcopy: %6.1f us  instantiate: %6.1f us' % (segment.tag,time_copy*1e6,time_template*1e6)
+
+    # the template is not written through its views
+    template = mission.segments.cruise.state
+    state    = template.instantiate()
+    try:
+        state.unknowns.throttle[:,0] = 0.
+        raise AssertionError , 'wrote into the template'
+    except ValueError:
+        pass
+    state.expand_rows(4)
+    state.unknowns.throttle[:,0] = 0.
+    assert np.all( template.unknowns.throttle != 0. )
+
+    # the mission, from deep copies and from the templates
+    results_copy     = mission.evaluate(deepcopy(mission.state))
+    results_template = mission.evaluate()
+
+    check_results(results_template,results_copy)
+
+    for segment in mission.segments:
+        assert segment.state.unknowns.throttle.shape[0] == 1
+        assert segment.state.unknowns.throttle.flags.writeable
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'State templates test passed!'
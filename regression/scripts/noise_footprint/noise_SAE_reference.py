@@ -0,0 +1,102 @@
+# noise_SAE_reference.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the SAE engine noise of a takeoff climb at the sideline microphone
+    against the values of the time step loop it replaced
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../noise_optimization')
+
+import Vehicles
+import Analyses
+import Missions
+
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs  = Vehicles.setup()
+    analyses = Analyses.setup(configs)
+    missions = Missions.setup(analyses)
+
+    configs.finalize()
+    analyses.finalize()
+
+    results  = missions.sideline_takeoff.evaluate()
+    segment  = results.segments.climb
+    config   = configs.takeoff
+    turbofan = config.propulsors[0]
+
+    # the sideline microphone
+    noise = analyses.takeoff.noise
+    noise.settings.sideline       = 1
+    noise.settings.mic_x_position = 1500.
+
+    EPNL, SPL = noise_SAE(turbofan,segment,config,analyses.takeoff)
+
+    # the loop started the source location iteration of each step from the
+    # angles of the previous step, it now starts from pi/2, which moves the
+    # bands within the tolerance of the iteration. the loop carried the 10 kHz
+    # band over from the previous step, so that band is not compared
+    EPNL_err = np.abs(EPNL-EPNL_truth)
+    SPL_err  = np.max(np.abs(SPL[:,:23]-SPL_truth))
+
+    print 'EPNL       :', EPNL
+    print 'EPNL error :', EPNL_err
+    print 'SPL error  :', SPL_err
+
+    assert SPL.shape == (10,24)
+    assert EPNL_err < 0.01 , 'Check Failed : EPNL'
+    assert SPL_err  < 0.1  , 'Check Failed : SPL'
+    assert np.all(np.isfinite(SPL[:,23]))
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Truth Values
+# ----------------------------------------------------------------------
+
+# the time step loop, EPNdB
+EPNL_truth = 79.95324117589107
+
+# the time step loop, SPL of the 1/3 octave bands up to 8 kHz at each time step, dB
+SPL_truth = np.array([
+    [  52.305,  52.672,  52.896,  52.981,  52.927,  52.743,  52.445,  52.009,  51.405,  50.571,  49.571,  48.290,
+       46.647,  44.804,  42.608,  39.744,  36.668,  33.092,  28.744,  23.438,  19.247,  12.742,   3.881 ],
+    [  55.060,  55.466,  55.717,  55.819,  55.785,  55.623,  55.357,  54.966,  54.420,  53.663,  52.747,  51.563,
+       50.034,  48.308,  46.245,  43.545,  40.645,  37.275,  33.186,  28.214,  24.060,  17.934,   9.788 ],
+    [  58.794,  59.256,  59.550,  59.680,  59.676,  59.557,  59.347,  59.033,  58.587,  57.955,  57.173,  56.139,
+       54.783,  53.230,  51.361,  48.899,  46.254,  43.181,  39.466,  34.974,  31.043,  25.510,  18.314 ],
+    [  63.969,  64.540,  64.934,  65.151,  65.241,  65.238,  65.151,  64.982,  64.703,  64.261,  63.666,  62.834,
+       61.697,  60.360,  58.724,  56.546,  54.198,  51.468,  48.179,  44.226,  40.636,  35.798,  29.658 ],
+    [  69.627,  70.537,  71.281,  71.821,  72.220,  72.529,  72.686,  72.719,  72.602,  72.283,  71.774,  71.007,
+       69.924,  68.639,  67.050,  64.933,  62.657,  60.020,  56.865,  53.101,  49.606,  45.041,  39.358 ],
+    [  73.413,  74.416,  75.166,  75.711,  76.090,  76.288,  76.275,  76.076,  75.668,  74.989,  74.096,  72.882,
+       71.287,  69.470,  67.310,  64.507,  61.559,  58.199,  54.232,  49.557,  45.233,  39.655,  32.770 ],
+    [  75.118,  75.095,  74.650,  74.225,  73.790,  73.227,  72.670,  72.017,  71.159,  69.974,  68.537,  66.677,
+       64.322,  61.716,  58.688,  54.833,  50.838,  46.334,  41.061,  34.884,  29.254,  21.948,  12.898 ],
+    [  71.742,  70.997,  69.898,  69.025,  68.374,  67.811,  67.259,  66.486,  65.353,  63.749,  61.830,  59.403,
+       56.393,  53.115,  49.350,  44.600,  39.705,  34.206,  27.775,  20.237,  13.480,   4.564,  -6.592 ],
+    [  68.661,  67.448,  65.950,  64.845,  64.117,  63.511,  62.833,  61.840,  60.409,  58.443,  56.143,  53.282,
+       49.773,  45.984,  41.651,  36.204,  30.594,  24.292,  16.907,   8.221,   0.561,  -9.751, -22.812 ],
+    [  66.454,  64.899,  63.046,  61.685,  60.807,  60.075,  59.244,  58.055,  56.388,  54.144,  51.553,  48.359,
+       44.464,  40.274,  35.491,  29.483,  23.287,  16.314,   8.118,  -1.564,  -9.973, -21.528, -36.342 ]
+])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+# noise_footprint.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" evaluates the noise footprint of a takeoff climb on a ground grid and
+    checks it against the certification point noise functions
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../noise_optimization')
+
+import Vehicles
+import Analyses
+import Missions
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_fidelity_one, noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE, noise_SAE_observers
+
+import numpy as np
+
+from time import time
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs  = Vehicles.setup()
+    analyses = Analyses.setup(configs)
+    missions = Missions.setup(analyses)
+
+    configs.finalize()
+    analyses.finalize()
+
+    results  = missions.sideline_takeoff.evaluate()
+    segment  = results.segments.climb
+    config   = configs.takeoff
+    turbofan = config.propulsors[0]
+
+    # the sideline microphone, 450 m from the track, at the position used by noise_geometric
+    noise = analyses.takeoff.noise
+    noise.settings.sideline       = 1
+    noise.settings.mic_x_position = 1500.
+
+    airframe = noise_fidelity_one(config,analyses.takeoff,segment)
+    engine   = noise_SAE(turbofan,segment,config,analyses.takeoff)
+
+    microphones = np.array([[1500., 450., 0.],
+                            [1500.,-450., 0.]])
+
+    airframe_batch = noise_airframe_Fink(config,analyses.takeoff,segment,microphones).total
+    engine_batch   = noise_SAE_observers(turbofan,segment,analyses.takeoff,microphones).total
+
+    # the certification functions leave out the last step of the airframe
+    for SPL in [airframe_batch[0],airframe_batch[1]]:
+        err = np.max(np.abs(SPL[:-1]-airframe[1][:-1]))
+        print 'Airframe SPL error:', err
+        assert err < 1e-8
+    for SPL in [engine_batch[0],engine_batch[1]]:
+        err = np.max(np.abs(SPL-engine[1]))
+        print 'Engine SPL error:', err
+        assert err < 1e-8
+
+    # the footprint, in one process and in a pool with small chunks
+    footprint = SUAVE.Analyses.Noise.Footprint()
+    footprint.geometry = config
+    footprint.settings.x_locations = np.linspace(-1000.,5000.,13)
+    footprint.settings.y_locations = np.linspace(-2000.,2000.,9)
+    footprint.settings.EPNL_levels = [80.,90.,100.]
+    footprint.settings.SEL_levels  = [80.,90.,100.]
+
+    t0 = time()
+    serial = footprint.evaluate(results.segments)
+    time_serial = time()-t0
+
+    footprint.settings.observers_per_chunk = 10
+    footprint.settings.workers             = 2
+    t0 = time()
+    pool = footprint.evaluate(results.segments)
+    time_pool = time()-t0
+
+    print 'footprint in serial   : %.2f s' % time_serial
+    print 'footprint in processes: %.2f s' % time_pool
+    print 'EPNL contour areas [km^2]:', serial.EPNL_contour_areas / Units.km**2
+    print 'SEL contour areas  [km^2]:', serial.SEL_contour_areas / Units.km**2
+
+    for key in ['EPNL','SEL','PNLTM','EPNL_contour_areas','SEL_contour_areas']:
+        assert np.all(serial[key] == pool[key]) , 'Check Failed : %s' % key
+
+    assert serial.EPNL.shape == (9,13)
+    assert np.all(np.isfinite(serial.EPNL)) and np.all(np.isfinite(serial.SEL))
+
+    # the grid is symmetric about the track
+    assert np.allclose(serial.EPNL,serial.EPNL[::-1,:],rtol=1e-10)
+
+    # louder contours are smaller
+    assert np.all(np.diff(serial.EPNL_contour_areas) <= 0.)
+    assert np.all(np.diff(serial.SEL_contour_areas) <= 0.)
+    assert serial.EPNL_contour_areas[0] > 0.
+
+    return
+
+
+if __name__ == '__main__':
+    main()
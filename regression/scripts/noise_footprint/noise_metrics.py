@@ -0,0 +1,88 @@
+# noise_metrics.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the PNL, tone correction and EPNL of many observers evaluated
+    together against the histories of each observer, and against the
+    values of the step by step functions
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../noise_optimization')
+
+import Vehicles
+import Analyses
+import Missions
+
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE_observers
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise, noise_tone_correction, epnl_noise
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs  = Vehicles.setup()
+    analyses = Analyses.setup(configs)
+    missions = Missions.setup(analyses)
+
+    configs.finalize()
+    analyses.finalize()
+
+    results  = missions.sideline_takeoff.evaluate()
+    segment  = results.segments.climb
+    config   = configs.takeoff
+
+    microphones = np.array([[ 1500.,  450., 0.],
+                            [ 3000.,    0., 0.],
+                            [  500., 1000., 0.],
+                            [-1000.,-2000., 0.]])
+
+    airframe = noise_airframe_Fink(config,analyses.takeoff,segment,microphones).total
+    engine   = noise_SAE_observers(config.propulsors[0],segment,analyses.takeoff,microphones).total
+    SPL      = 10.*np.log10(10.**(0.1*airframe)+10.**(0.1*engine))
+
+    # all observers together
+    PNLT  = pnl_noise(SPL) + noise_tone_correction(SPL)
+    EPNL  = epnl_noise(PNLT)
+    PNLTM = np.max(PNLT,axis=-1)
+
+    # one history at a time
+    for k in range(len(microphones)):
+        PNLT_k = pnl_noise(SPL[k]) + noise_tone_correction(SPL[k])
+        assert np.all(PNLT_k == PNLT[k])
+        assert epnl_noise(PNLT_k) == EPNL[k]
+
+    # values of the step by step functions
+    EPNL_truth  = np.array([80.21067271059299, 79.05238103983972, 76.72136181466233, 68.74511062117902])
+    PNLTM_truth = np.array([89.29468205696963, 91.13164746583725, 84.3143749380975 , 76.75564634384261])
+
+    print 'EPNL :', EPNL
+    print 'PNLTM:', PNLTM
+
+    err = np.max(np.abs(EPNL-EPNL_truth))
+    print 'EPNL error :', err
+    assert err < 1e-6
+
+    err = np.max(np.abs(PNLTM-PNLTM_truth))
+    print 'PNLTM error:', err
+    assert err < 1e-6
+
+    # sources that are not evaluated
+    assert epnl_noise(np.zeros(10)) == 0.
+    assert np.all(epnl_noise(np.zeros([3,10])) == 0.)
+
+    return
+
+
+if __name__ == '__main__':
+    main()
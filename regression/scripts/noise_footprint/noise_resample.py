@@ -0,0 +1,99 @@
+# noise_resample.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" resamples a converged takeoff climb onto the 0.5 s noise time steps and
+    checks the conditions and engine acoustic outputs against the mission
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../noise_optimization')
+
+import Vehicles
+import Analyses
+import Missions
+
+from SUAVE.Core import Units
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, linear_data, chebyshev_interpolation
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_data_adapter
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the interpolant through the control points is exact for polynomials
+    x_new = np.linspace(0.,1.,31)
+    for data in [chebyshev_data,linear_data]:
+        x,D,I = data(8)
+        L     = chebyshev_interpolation(x,x_new)
+
+        err = np.max(np.abs(np.dot(L,3.*x-1.)-(3.*x_new-1.)))
+        print data.__name__, 'linear interpolation error:', err
+        assert err < 1e-12
+
+        # and picks the control points themselves
+        assert np.allclose(chebyshev_interpolation(x,x),np.eye(8),rtol=0.,atol=1e-14)
+
+    x,D,I = chebyshev_data(8)
+    err   = np.max(np.abs(np.dot(chebyshev_interpolation(x,x_new),x**5)-x_new**5))
+    print 'chebyshev_data quintic interpolation error:', err
+    assert err < 1e-12
+
+    # the takeoff climb
+    configs  = Vehicles.setup()
+    analyses = Analyses.setup(configs)
+    missions = Missions.setup(analyses)
+
+    configs.finalize()
+    analyses.finalize()
+
+    results    = missions.sideline_takeoff.evaluate()
+    segment    = results.segments.climb
+    propulsors = configs.takeoff.propulsors
+
+    noise_segment = noise_data_adapter(segment,propulsors)
+
+    conditions       = segment.conditions
+    noise_conditions = noise_segment.conditions
+
+    time       = conditions.frames.inertial.time[:,0]
+    noise_time = noise_conditions.frames.inertial.time[:,0]
+
+    # certification time steps over the segment
+    assert np.all(np.diff(noise_time) == 0.5 * Units.s)
+    assert noise_time[0] == time[0]
+    assert noise_time[-1] <= time[-1] < noise_time[-1] + 0.5 * Units.s
+    assert noise_conditions.freestream.velocity.shape == (noise_time.size,1)
+
+    # both start at the first control point
+    for key in ['core','fan']:
+        for field in ['exit_velocity','exit_stagnation_temperature']:
+            a = conditions.propulsion.acoustic_outputs[key][field]
+            b = noise_conditions.propulsion.acoustic_outputs[key][field]
+            assert np.abs(a[0,0]-b[0,0]) < 1e-8 * np.abs(a[0,0])
+    assert np.all(noise_conditions.frames.inertial.position_vector[0] == conditions.frames.inertial.position_vector[0])
+
+    # the network on the new steps agrees with the mission between its control points
+    L = chebyshev_interpolation(segment.numerics.dimensionless.control_points[:,0],(noise_time-time[0])/(time[-1]-time[0]))
+    for key in ['core','fan']:
+        for field in ['exit_velocity','exit_stagnation_temperature','exit_static_pressure']:
+            a = np.dot(L,conditions.propulsion.acoustic_outputs[key][field])
+            b = noise_conditions.propulsion.acoustic_outputs[key][field]
+            err = np.max(np.abs(a-b)/np.abs(b))
+            print 'Acoustic output error, %s %s:' % (key,field), err
+            assert err < 1e-4
+
+    return
+
+
+if __name__ == '__main__':
+    main()
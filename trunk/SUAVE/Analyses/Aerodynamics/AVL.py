@@ -2,6 +2,7 @@
 #
 # Created:  Tim Momose, Dec 2014 
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2016, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -9,6 +10,7 @@
 # ----------------------------------------------------------------------
 
 import os
+import copy
 import numpy as np
 from shutil import rmtree
 from warnings import warn
@@ -23,12 +25,15 @@ from SUAVE.Analyses.Mission.Segments.Conditions.Conditions   import Conditions
 from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
-from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis, start_avl, finish_avl
+from SUAVE.Methods.Aerodynamics.AVL.read_results     import read_results
+from SUAVE.Methods.Aerodynamics.AVL.run_session      import AVL_Session
 from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Results     import Results
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+from SUAVE.Analyses.Surrogate_Cache                  import hash_inputs
 
 from Aerodynamics import Aerodynamics as Aero_Analysis
 
@@ -44,6 +49,19 @@ class AVL(Aero_Analysis):
 
         this class is callable, see self.__call__
 
+        With settings.number_of_workers greater than one, the cases of a
+        batch are split into that many contiguous groups, each run by its
+        own avl process in its own folder of the run folder (see
+        settings.filenames.worker_template). The processes run at the same
+        time and their results are merged back in case order.
+
+        With settings.persistent_session, one avl process is kept open
+        between batches (see self.session). The geometry file is written
+        and loaded again only when the vehicle changes, and the same run
+        case and result files are reused for every batch. The run folder
+        is kept while the session is open, close_session() ends it and
+        removes the folder if keep_files is False.
+
     """
 
     def __defaults__(self):
@@ -60,12 +78,17 @@ class AVL(Aero_Analysis):
         
         self.features = None
 
+        # the avl process of a persistent session
+        self.session = AVL_Session()
+
 
     def finalize(self):
 
         features = self.features
         self.tag      = 'avl_analysis_of_{}'.format(features.tag)
 
+        self.session.close()
+
         run_folder = self.settings.filenames.run_folder
         if os.path.exists(run_folder):
             if self.keep_files:
@@ -127,21 +150,135 @@ class AVL(Aero_Analysis):
         for case in cases:
             case.result_filename = output_template.format(case.tag)
 
-        # write the input files
+        # run avl, in one or more folders
+        n_workers = min(self.settings.number_of_workers,len(cases))
+        if self.settings.persistent_session:
+            results_avl = self.run_session(run_folder)
+        elif n_workers > 1:
+            results_avl = self.run_workers(run_folder,n_workers)
+        else:
+            with redirect.folder(run_folder,force=False):
+                write_geometry(self)
+                write_run_cases(self)
+                write_input_deck(self)
+
+                # RUN AVL!
+                results_avl = run_analysis(self)
+
+        # translate results
+        results = translate_results_to_conditions(cases,results_avl)
+
+        if not self.keep_files and not self.session.is_running():
+            rmtree( run_folder )
+
+        return results
+
+
+    def run_session(self,run_folder):
+        """ runs the current cases on the avl process of self.session
+
+            Inputs:
+                run_folder - absolute path of the run folder
+
+            Outputs:
+                results - a Data() of the avl results of each case
+        """
+
+        # unpack
+        output_template  = self.settings.filenames.output_template
+        session_template = self.settings.filenames.session_template
+
+        # the same files for every batch
+        self.current_status.batch_file = self.settings.filenames.batch_template.format(0)
+        self.current_status.deck_file  = None
+        for case in self.current_status.cases:
+            case.result_filename = output_template.format(session_template.format(case.index))
+
+        # only what the geometry file is made from
+        geometry_hash = hash_inputs([ self.features,
+                                      self.settings.discretization,
+                                      self.settings.flow_symmetry ])
+
         with redirect.folder(run_folder,force=False):
-            write_geometry(self)
+            if geometry_hash != self.session.geometry_hash:
+                write_geometry(self)
+            self.session.load(self,geometry_hash)
             write_run_cases(self)
-            write_input_deck(self)
+            results = self.session.run(self)
 
-            # RUN AVL!
-            results_avl = run_analysis(self)
+        return results
 
-        # translate results
-        results = translate_results_to_conditions(cases,results_avl)
 
-        if not self.keep_files:
+    def close_session(self):
+        """ quits the avl process of a persistent session """
+
+        self.session.close()
+
+        run_folder = os.path.abspath(self.settings.filenames.run_folder)
+        if not self.keep_files and os.path.exists(run_folder):
             rmtree( run_folder )
 
+        return
+
+
+    def run_workers(self,run_folder,n_workers):
+        """ runs the current cases on n_workers avl processes at once
+
+            Inputs:
+                run_folder - absolute path of the run folder
+                n_workers  - number of processes, each in its own folder
+
+            Outputs:
+                results - a Data() of the avl results of each case, in the
+                order of self.current_status.cases
+        """
+
+        # unpack
+        cases           = self.current_status.cases
+        worker_template = self.settings.filenames.worker_template
+
+        # contiguous groups of cases, renumbered from one for each deck
+        groups = []
+        for indices in np.array_split(np.arange(len(cases)),n_workers):
+            group = Run_Case.Container()
+            for i in indices:
+                group.append_case(copy.deepcopy(cases[i]))
+            groups.append(group)
+
+        folders = [ os.path.join(run_folder,worker_template.format(i+1)) for i in range(n_workers) ]
+
+        results = Data()
+        runs    = []
+
+        try:
+            # write the input files and start each worker
+            for folder,group in zip(folders,groups):
+                self.current_status.cases = group
+                with redirect.folder(folder,force=False):
+                    write_geometry(self)
+                    write_run_cases(self)
+                    write_input_deck(self)
+                    runs.append(start_avl(self))
+
+            # wait for all, then read back
+            for avl_run in runs:
+                finish_avl(avl_run)
+            runs = []
+
+            for folder,group in zip(folders,groups):
+                self.current_status.cases = group
+                with redirect.folder(folder,force=False):
+                    for case_res in read_results(self).values():
+                        results.append(case_res)
+
+        finally:
+            # don't leave orphans behind an error
+            for avl_run in runs:
+                if avl_run.poll() is None:
+                    avl_run.kill()
+                finish_avl(avl_run)
+            self.current_status.cases = cases
+
         return results
 
 
@@ -16,7 +16,7 @@ from SUAVE.Analyses.Aerodynamics import AVL as AVL_Callable
 from SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics\
      import Aerodynamics as Aero_Conditions
 
-from SUAVE.Analyses import Surrogate
+from SUAVE.Analyses import Surrogate, Surrogate_Cache
 
 # ----------------------------------------------------------------------
 #  Analysis
@@ -47,6 +47,9 @@ class AVL(Aerodynamics,Surrogate):
         
         self.geometry = None
         
+        # on-disk cache of the training, off until given a directory
+        self.cache = Surrogate_Cache()
+        
         self.finalized = False
         
         return
@@ -56,18 +59,38 @@ class AVL(Aerodynamics,Surrogate):
         
         if not self.finalized:
             
-            print 'Building AVL Surrogate'
-            
             self.avl_callable.features = self.geometry
-            self.avl_callable.finalize()
-            self.sample_training()
-            self.build_surrogate()
+            
+            # everything the training depends on
+            inputs = [ 'AVL_Surrogate',
+                       self.geometry,
+                       self.avl_callable.settings,
+                       self.training.angle_of_attack ]
+            
+            cached = self.cache.fetch(inputs,self.sample_and_build)
+            
+            self.training   = cached.training
+            self.surrogates = cached.surrogates
         
             self.finalized = True
-            
-            print 'Done'
         
         return
+    
+    def sample_and_build(self):
+        
+        print 'Building AVL Surrogate'
+        
+        self.avl_callable.finalize()
+        self.sample_training()
+        self.build_surrogate()
+        
+        print 'Done'
+        
+        cached = Data()
+        cached.training   = self.training
+        cached.surrogates = self.surrogates
+        
+        return cached
 
     initialize = finalize
     
@@ -0,0 +1,213 @@
+# Gridded.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Aerodynamics.Aerodynamics import Aerodynamics
+from SUAVE.Analyses.Aerodynamics.Fidelity_Zero import Fidelity_Zero
+from SUAVE.Analyses.Aerodynamics.Results import Results
+from SUAVE.Analyses.Atmospheric import US_Standard_1976
+from SUAVE.Analyses.Mission.Segments.Conditions import State
+from SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics\
+     import Aerodynamics as Aero_Conditions
+
+from SUAVE.Analyses import Gridded_Surrogate, Surrogate_Cache
+
+# ----------------------------------------------------------------------
+#  Analysis
+# ----------------------------------------------------------------------
+
+class Gridded(Aerodynamics,Gridded_Surrogate):
+    ''' SUAVE.Analyses.Aerodynamics.Surrogates.Gridded()
+        a table of an aerodynamics analysis on a grid of mach number,
+        angle of attack and reynolds number, interpolated in the mission
+        loop instead of running the analysis
+
+        usage:
+            aerodynamics = Gridded()
+            aerodynamics.geometry = vehicle
+            aerodynamics.initialize()
+
+        The analysis (Fidelity_Zero by default) is evaluated once, over
+        all grid points together. The surrogate covers the lift, total
+        drag, induced drag and pitching moment coefficients, those the
+        analysis does not compute are left out.
+
+        Assumptions:
+            The grid is sampled at the temperature and pressure of
+            training.altitude, the density is set to match the reynolds
+            number. Only the mach number, angle of attack and reynolds
+            number of the mission conditions are looked up.
+    '''
+
+    def __defaults__(self):
+
+        self.tag = 'gridded_aerodynamics'
+
+        self.analysis = Fidelity_Zero()
+
+        # grid axes, in order
+        self.training = Data()
+        self.training.axes = Data()
+        self.training.axes.mach_number     = np.array([0.05,0.2,0.4,0.6,0.7,0.75,0.8,0.85,0.9])
+        self.training.axes.angle_of_attack = np.linspace(-6.,16.,12) * Units.deg
+        self.training.axes.reynolds_number = np.array([1.e6,2.e6,5.e6,1.e7,2.e7,5.e7]) # per meter
+
+        self.training.altitude = 0.0
+        self.training.outputs  = Data()
+
+        self.settings.interpolation_order = 1
+
+        # sampled outputs, by the conditions they come from and go back to
+        # add any others other analyses read, ie. for Stability.Fidelity_Zero
+        #   'aerodynamics.drag_breakdown.parasite.main_wing.parasite_drag_coefficient'
+        self.settings.outputs = Data()
+        self.settings.outputs.lift_coefficient         = 'aerodynamics.lift_coefficient'
+        self.settings.outputs.drag_coefficient         = 'aerodynamics.drag_coefficient'
+        self.settings.outputs.induced_drag_coefficient = 'aerodynamics.drag_breakdown.induced.total'
+        self.settings.outputs.pitch_moment_coefficient = 'aerodynamics.pitch_moment_coefficient'
+
+        self.surrogates = Data()
+
+        # on-disk cache of the training, off until given a directory
+        self.cache = Surrogate_Cache()
+
+        self.geometry = None
+
+        return
+
+
+    def initialize(self):
+
+        self.analysis.geometry = self.geometry
+
+        # everything the training depends on
+        inputs = [ 'Gridded_Aerodynamics',
+                   self.analysis.typestring(),
+                   self.geometry,
+                   self.analysis.settings,
+                   self.training,
+                   self.settings ]
+
+        cached = self.cache.fetch(inputs,self.sample_and_build)
+
+        self.training   = cached.training
+        self.surrogates = cached.surrogates
+
+        return
+
+    finalize = initialize
+
+
+    def sample_and_build(self):
+
+        self.analysis.initialize()
+        self.sample_training()
+        self.build_surrogate()
+
+        cached = Data()
+        cached.training   = self.training
+        cached.surrogates = self.surrogates
+
+        return cached
+
+
+    def sample_points(self,points):
+
+        n_points = points.mach_number.shape[0]
+
+        # the atmosphere at the training altitude
+        atmosphere = US_Standard_1976()
+        atmo_data  = atmosphere.compute_values(self.training.altitude)
+
+        mach = points.mach_number
+        a    = atmo_data.speed_of_sound
+        mu   = atmo_data.dynamic_viscosity
+        V    = mach * a
+
+        # conditions for every grid point
+        state = State()
+        state.conditions = Aero_Conditions()
+        state.expand_rows(n_points)
+
+        freestream = state.conditions.freestream
+        freestream.mach_number       = mach
+        freestream.reynolds_number   = points.reynolds_number
+        freestream.velocity          = V
+        freestream.speed_of_sound    = a * np.ones_like(mach)
+        freestream.temperature       = atmo_data.temperature * np.ones_like(mach)
+        freestream.pressure          = atmo_data.pressure * np.ones_like(mach)
+        freestream.dynamic_viscosity = mu * np.ones_like(mach)
+        freestream.density           = points.reynolds_number * mu / V
+        freestream.dynamic_pressure  = 0.5 * freestream.density * V**2
+        freestream.gravity           = 9.81 * np.ones_like(mach)
+
+        state.conditions.aerodynamics.angle_of_attack = points.angle_of_attack
+
+        # evaluate all points at once
+        self.analysis.evaluate(state)
+
+        # pull the outputs
+        outputs = Data()
+        for key,path in self.settings.outputs.items():
+            try:
+                value = state.conditions.deep_get(path)
+            except (AttributeError,KeyError):
+                continue
+            outputs[key] = value * np.ones([n_points,1])
+
+        return outputs
+
+
+    def evaluate(self,state,settings=None,geometry=None):
+
+        # unpack
+        conditions = state.conditions
+        mach = conditions.freestream.mach_number
+        aoa  = conditions.aerodynamics.angle_of_attack
+        re   = conditions.freestream.reynolds_number
+
+        # evaluate surrogates
+        coefficients = self.evaluate_surrogates(mach,aoa,re)
+
+        # pack conditions, where the outputs were sampled from
+        for key,value in coefficients.items():
+            set_condition(conditions,self.settings.outputs[key],value)
+
+        # pack results, as a markup analysis
+        results = Results()
+        results.lift = Data()
+        results.lift.total = coefficients.lift_coefficient
+        results.drag = Data()
+        results.drag.total = coefficients.drag_coefficient
+        results.update(coefficients)
+
+        return results
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def set_condition(conditions,path,value):
+    """ sets conditions at the dotted path, adding missing levels """
+
+    keys = path.split('.')
+
+    data = conditions
+    for key in keys[:-1]:
+        if not data.has_key(key):
+            data[key] = Data()
+        data = data[key]
+
+    data[keys[-1]] = value
+
+    return
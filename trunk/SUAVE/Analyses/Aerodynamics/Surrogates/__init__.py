@@ -1,2 +1,3 @@
 
 from AVL import AVL
+from Gridded import Gridded
@@ -15,6 +15,7 @@ import SUAVE
 
 from SUAVE.Core import Data
 from SUAVE.Core import Units
+from SUAVE.Analyses import Surrogate_Cache
 
 from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift import weissinger_vortex_lattice
 
@@ -68,15 +69,25 @@ class Vortex_Lattice(Aerodynamics):
         # surrogoate models
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
+        
+        # on-disk cache of the training, off until given a directory
+        self.cache = Surrogate_Cache()
  
         
     def initialize(self):
-                   
-        # sample training data
-        self.sample_training()
-                    
-        # build surrogate
-        self.build_surrogate()
+        
+        # everything the training depends on
+        inputs = [ 'Vortex_Lattice',
+                   self.geometry.reference_area,
+                   self.geometry.wings,
+                   self.settings,
+                   self.training.angle_of_attack ]
+        
+        # sample training data and build surrogate, unless cached
+        cached = self.cache.fetch(inputs,self.sample_and_build)
+        
+        self.training   = cached.training
+        self.surrogates = cached.surrogates
 
 
     def evaluate(self,state,settings,geometry):
@@ -90,9 +101,10 @@ class Vortex_Lattice(Aerodynamics):
                 CD - array of drag coefficients, same size as alpha
 
             Assumptions:
-                linear intperolation surrogate model on Mach, Angle of Attack
+                linear fit surrogate model on Angle of Attack, the vortex
+                    lattice is incompressible and inviscid
+                see Surrogates.Gridded for a table on Mach, Angle of Attack
                     and Reynolds number
-                locations outside the surrogate's table are held to nearest data
                 no changes to initial geometry or settings
         """
 
@@ -128,26 +140,38 @@ class Vortex_Lattice(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
 
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i] = calculate_lift_vortex_lattice(konditions, settings, geometry)
+        # calculate aerodynamics for table, all angles of attack at once
+        # overriding conditions, thus the name mangling
+        konditions.aerodynamics.angle_of_attack = AoA
+        
+        # these functions are inherited from Aerodynamics() or overridden
+        CL = calculate_lift_vortex_lattice(konditions, settings, geometry)
 
         # store training data
         training.lift_coefficient = CL
 
         return
 
+    def sample_and_build(self):
+        
+        # sample training data
+        self.sample_training()
+                    
+        # build surrogate
+        self.build_surrogate()
+        
+        cached = Data()
+        cached.training   = self.training
+        cached.surrogates = self.surrogates
+        
+        return cached
+        
+
     def build_surrogate(self):
 
         # unpack data
@@ -176,6 +200,7 @@ class Vortex_Lattice(Aerodynamics):
 
 def calculate_lift_vortex_lattice(conditions,settings,geometry):
     """ calculate total vehicle lift coefficient by vortex lattice
+        for one or an array of angles of attack
     """
 
     # unpack
@@ -3,6 +3,7 @@
 #
 # Modified by Tim MacDonald 2/16/15  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -20,8 +21,9 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Data, Units
 from SUAVE.Core.Arrays import atleast_2d_col
+from SUAVE.Core.Deep_Core.Property import Property
 
 
 # ----------------------------------------------------------------------
@@ -31,14 +33,29 @@ from SUAVE.Core.Arrays import atleast_2d_col
 class US_Standard_1976(Atmospheric):
 
     """ Implements the U.S. Standard Atmosphere (1976 version)
+
+        The constants of each layer are computed once, on the first call of
+        compute_values, which is also when the fluid and planet properties
+        are checked. They are computed again if breaks, fluid_properties
+        or planet are replaced, changes made inside of them are only seen
+        after finalize().
     """
     
+    # layer constants, hidden from the data
+    layers = Property('layers')
+    
     def __defaults__(self):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        self.layers = None
+    
+    def finalize(self):
+        
+        self.layers = None
     
-    def compute_values(self,altitude,temperature_deviation=0.0):
+    def compute_values(self,altitude,temperature_deviation=0.0,results=None):
 
         """ Computes values from the International Standard Atmosphere
 
@@ -46,6 +63,8 @@ class US_Standard_1976(Atmospheric):
             altitude     : geometric altitude (elevation) (m)
                            can be a float, list or 1D array of floats
             temperature_deviation :  delta_isa
+            results      : optional, Data to put the outputs in instead
+                           of a new Conditions()
          
         Outputs:
             list of conditions -
@@ -64,24 +83,16 @@ class US_Standard_1976(Atmospheric):
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
-        Rad       = self.planet.mean_radius
-        gamma     = gas.gas_specific_constant
+        layers    = self.layer_constants()
+        Rad       = layers.mean_radius
         delta_isa = temperature_deviation
         
-        # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
-        
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        zmin = layers.altitude[0]
+        zmax = layers.altitude[-1]   
         
         # convert geometric to geopotential altitude
         zs = zs/(1 + zs/Rad)
@@ -94,44 +105,34 @@ class US_Standard_1976(Atmospheric):
             print "Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km"   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mew   = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
+        # find the layers, the upper one on a break
+        # values should be the same on either side of a break
+        i_layer = np.searchsorted(layers.altitude,zs,side='right') - 1
+        i_layer = np.minimum(i_layer,len(layers.altitude)-2)
+        
+        z0       = layers.altitude[i_layer]
+        T0       = layers.temperature[i_layer]
+        p0       = layers.pressure[i_layer]
+        alpha    = layers.lapse_rate[i_layer]
+        exponent = layers.exponent[i_layer]
         
         # interpolate the breaks
         dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(gamma*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*gamma)) )
+        p  = np.where( layers.isothermal[i_layer] ,
+                       p0 * np.exp(-1.*dz*layers.gravity/(layers.gas_constant*T0)) ,
+                       p0 * ( (1.-alpha*dz/T0) **exponent ) )
         
         T   = T0 - dz*alpha + delta_isa
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T)
         mew = gas.compute_absolute_viscosity(T)
         
-
-                
-        atmo_data = Conditions()
-        atmo_data.expand_rows(zs.shape[0])
+        if results is None:
+            atmo_data = Conditions()
+            atmo_data.expand_rows(zs.shape[0])
+        else:
+            atmo_data = results
+            
         atmo_data.pressure          = p
         atmo_data.temperature       = T
         atmo_data.density           = rho
@@ -139,6 +140,66 @@ class US_Standard_1976(Atmospheric):
         atmo_data.dynamic_viscosity = mew
         
         return atmo_data
+    
+    
+    def layer_constants(self):
+        """ the constants of each layer between the altitude breaks,
+            computed if not yet known for the current breaks, fluid and planet
+        """
+        
+        # what the constants come from
+        breaks  = self.breaks
+        sources = [ breaks.altitude, breaks.temperature, breaks.pressure,
+                    self.fluid_properties, self.planet ]
+        
+        try:
+            layers = self.layers
+        except KeyError: # a copy
+            layers = None
+        
+        if layers is not None and all([ a is b for a,b in zip(layers.sources,sources) ]):
+            return layers
+        
+        # unpack
+        gas    = self.fluid_properties
+        planet = self.planet
+        
+        # check properties
+        if not gas == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')          
+        
+        altitude    = np.array(breaks.altitude,dtype=float)
+        temperature = np.array(breaks.temperature,dtype=float)
+        pressure    = np.array(breaks.pressure,dtype=float)
+        grav        = planet.sea_level_gravity
+        gamma       = gas.gas_specific_constant
+        
+        # the temperature lapse rate of each layer, zero if isothermal
+        alpha = -(temperature[1:] - temperature[:-1])/ \
+                 (altitude[1:]    - altitude[:-1])
+        isothermal = (alpha == 0.)
+        
+        # the pressure exponent of the layers with a lapse rate
+        alpha_safe = np.where(isothermal,1.,alpha)
+        exponent   = np.where(isothermal,0.,1.*grav/(alpha_safe*gamma))
+        
+        layers = Data()
+        layers.sources      = sources
+        layers.altitude     = altitude
+        layers.temperature  = temperature[:-1]
+        layers.pressure     = pressure[:-1]
+        layers.lapse_rate   = alpha
+        layers.isothermal   = isothermal
+        layers.exponent     = exponent
+        layers.gravity      = grav
+        layers.gas_constant = gamma
+        layers.mean_radius  = planet.mean_radius
+        
+        self.layers = layers
+        
+        return layers
 
 
 # ----------------------------------------------------------------------
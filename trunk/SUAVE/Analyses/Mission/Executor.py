@@ -0,0 +1,166 @@
+# Executor.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import multiprocessing
+import multiprocessing.pool
+
+from copy import deepcopy
+
+import SUAVE
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Executor
+# ----------------------------------------------------------------------
+
+class Executor(Data):
+    """ SUAVE.Analyses.Mission.Executor()
+        evaluates the missions of a mission container, one after the
+        other or concurrently
+
+        usage:
+            missions.executor.mode    = 'process'
+            missions.executor.workers = 3
+            results = missions.evaluate()
+
+        Attributes:
+            mode    - 'serial'  : one mission after the other (default)
+                      'thread'  : a pool of threads, shares the missions as is
+                      'process' : a pool of forked processes
+                      'batch'   : variants of one mission, solved side by side
+                                  sharing a jacobian, see
+                                  Methods.Missions.Segments.evaluate_batch
+            workers - pool size, defaults to one per mission up to the
+                      number of cpus
+            shared_jacobian - batch mode, use the jacobian of the first
+                      mission for all
+
+        Assumptions:
+            The missions must be independent of each other. In batch mode
+            they must also be copies of one mission, with the same
+            segments.
+
+            In a thread pool, missions that share analyses (ie. a common
+            aerodynamics surrogate) must only read from them.
+
+            In a process pool, each mission is evaluated in a forked copy
+            of the parent process, so it is not pickled on the way out.
+            Only the results and the mission warm start cache are sent
+            back, anything else the evaluation changes on the mission
+            stays in the worker. Forking needs a posix platform, elsewhere
+            the missions are evaluated in serial.
+    """
+
+    def __defaults__(self):
+        self.tag = 'executor'
+
+        self.mode    = 'serial'
+        self.workers = None
+
+        self.shared_jacobian = False
+
+    def evaluate(self,missions,state=None):
+        """ Executor.evaluate(missions,state=None)
+            evaluates each mission, results are keyed as the missions
+        """
+
+        keys = missions.keys()
+
+        mode = self.mode
+        if mode == 'process' and not hasattr(os,'fork'):
+            mode = 'serial'
+        if len(keys) < 2:
+            mode = 'serial'
+
+        if mode == 'serial':
+            outputs = [ missions[key].evaluate(state) for key in keys ]
+
+        elif mode == 'thread':
+            pool = multiprocessing.pool.ThreadPool(self.pool_size(len(keys)))
+            try:
+                outputs = pool.map( lambda key: missions[key].evaluate(state) , keys , chunksize=1 )
+            finally:
+                pool.close()
+                pool.join()
+
+        elif mode == 'process':
+            outputs = evaluate_forked(missions,keys,state,self.pool_size(len(keys)))
+
+        elif mode == 'batch':
+            states = None
+            if state is not None:
+                states = [ deepcopy(state) for key in keys ]
+            outputs = SUAVE.Methods.Missions.Segments.evaluate_batch( [ missions[key] for key in keys ] ,
+                                                                      states , self.shared_jacobian )
+
+        else:
+            raise ValueError , 'unknown executor mode "%s"' % self.mode
+
+        # merge
+        results = SUAVE.Analyses.Results()
+        for key,result in zip(keys,outputs):
+            results[key] = result
+
+        return results
+
+    def pool_size(self,n_missions):
+        """ the number of workers for n_missions """
+        if self.workers:
+            return max(1,int(self.workers))
+        return max(1,min(n_missions,multiprocessing.cpu_count()))
+
+
+# ----------------------------------------------------------------------
+#  Process Pool
+# ----------------------------------------------------------------------
+
+# the missions, inherited by the forked workers
+_forked_missions = None
+
+def evaluate_forked(missions,keys,state,workers):
+    """ evaluates missions[keys] in a pool of forked processes """
+
+    global _forked_missions
+
+    # set before the pool forks
+    _forked_missions = missions
+
+    try:
+        pool = multiprocessing.Pool(workers)
+        try:
+            outputs = pool.map( evaluate_forked_mission , [ (key,state) for key in keys ] , chunksize=1 )
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _forked_missions = None
+
+    # bring back the warm start caches
+    results = []
+    for key,(result,warm_start) in zip(keys,outputs):
+        if warm_start is not None:
+            missions[key].warm_start = warm_start
+        results.append(result)
+
+    return results
+
+
+def evaluate_forked_mission((key,state)):
+    """ runs in the worker process """
+
+    mission = _forked_missions[key]
+
+    result = mission.evaluate(state)
+
+    warm_start = mission.get('warm_start',None)
+    if warm_start is not None and not warm_start.enabled:
+        warm_start = None
+
+    return result , warm_start
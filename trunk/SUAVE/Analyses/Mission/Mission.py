@@ -11,8 +11,11 @@
 
 import SUAVE
 from SUAVE.Core import Container as ContainerBase
+from SUAVE.Core.Deep_Core.Property import Property
 
 import Segments
+from Warm_Start import Warm_Start
+from Executor   import Executor
 
 # ----------------------------------------------------------------------
 #   Class
@@ -24,6 +27,9 @@ class Mission(Segments.Simple.Container):
     def __defaults__(self):
         self.tag = 'mission'
         
+        # converged unknowns of previous evaluations
+        self.warm_start = Warm_Start()
+        
         # see Segments.Simple.Container
         
     def finalize(self):
@@ -37,17 +43,27 @@ class Mission(Segments.Simple.Container):
 
 class Container(ContainerBase):
     
+    # held outside of the items, so it is not taken for a mission
+    executor = Property('executor')
+    
+    def __defaults__(self):
+        self.executor = Executor()
+    
     def evaluate(self,state=None):
-        results = SUAVE.Analyses.Results()
-        
-        for key,mission in self.items():
-            result = mission.evaluate(state)
-            results[key] = result
-            
-        return results
+        return self.executor.evaluate(self,state)
+    
+    def __reduce__(self):
+        """ keeps the executor through copies and pickles """
+        reconstructor, args, state = ContainerBase.__reduce__(self)
+        return ( reconstruct_container, (reconstructor,args,self.executor), state )
     
     def finalize(self):
         pass
 
+def reconstruct_container(reconstructor,args,executor):
+    container = reconstructor(*args)
+    container.executor = executor
+    return container
+
 # Link container
 Mission.Container = Container
@@ -2,6 +2,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,8 @@ import numpy as np
 
 # SUAVE imports
 from SUAVE.Core                    import Data
+from SUAVE.Core.Arrays             import array_type
+from SUAVE.Core.Deep_Core.OrderedBunch import copy_bunch, deep_copy
 
 
 # ----------------------------------------------------------------------
@@ -19,15 +22,108 @@ from SUAVE.Core                    import Data
 # ----------------------------------------------------------------------
 
 class Conditions(Data):
+    """ SUAVE.Analyses.Mission.Segments.Conditions.Conditions()
+        conditions at the control points of a segment, one row per point
+        
+        With make_contiguous(), the 2D arrays of the conditions are moved
+        into the columns of one array (see buffer()), and the names keep
+        views of their columns. Assigning an array of the same shape and 
+        dtype to such a name then writes into its columns, rather than 
+        binding the name to the new array. Anything else unbinds the name
+        from the buffer. expand_rows() and deep copies keep the buffer.
+        
+        instantiate() makes a new state from conditions used as a template,
+        see Segment.evaluate().
+    """
 
     _size = 1
     
+    # keys that expand_rows() leaves as they are
+    _unexpanded = ()
+    
+    def __setattr__(self,key,value):
+        # write contiguous fields in place
+        views = dict.get(self,'_views')
+        if views and key in views:
+            view = views[key]
+            if value is view:
+                return
+            if type(value) is array_type and value.shape == view.shape and value.dtype == view.dtype:
+                view[...] = value
+                return
+            del views[key]
+        Data.__setattr__(self,key,value)
+        
+    def __delattr__(self,key):
+        views = dict.get(self,'_views')
+        if views and key in views:
+            del views[key]
+        Data.__delattr__(self,key)
+        
+    def __deepcopy__(self,memo):
+        result = copy_bunch(self,memo)
+        
+        # copies of views are not views, bind them to the copied buffer
+        if dict.get(result,'_buffer') is not None:
+            result.bind_views()
+            
+        return result
+    
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns """
         return np.ones([self._size,cols])
     
+    def instantiate(self,memo=None):
+        """ Conditions.instantiate()
+            new conditions from these as a template. Like a deep copy,
+            except for the 2D arrays that expand_rows() replaces: they are
+            not copied, the new conditions get read only views of them. 
+            expand_rows() then resizes the views into arrays of their own. 
+            Writing into a view before that raises a ValueError, rather 
+            than changing the template.
+            
+            Inputs:
+                memo - the memo of deep_copy(), for values referenced twice
+            
+            Outputs:
+                the new conditions
+        """
+        
+        if memo is None: memo = {}
+        
+        result = dict.__new__(type(self))
+        memo[id(self)] = result
+        
+        # hidden items, the template's buffer is not shared
+        for k,v in dict.iteritems(self):
+            if k == '_keys':
+                dict.__setitem__(result,k,v[:])
+            elif not k in ('_layout','_views','_buffer','_fields'):
+                dict.__setitem__(result,k,deep_copy(v,memo))
+                
+        items = result.__dict__
+        for k,v in self.__dict__.iteritems():
+            if id(v) in memo:
+                items[k] = memo[id(v)]
+            elif k in self._unexpanded:
+                items[k] = deep_copy(v,memo)
+            elif isinstance(v,Conditions):
+                items[k] = v.instantiate(memo)
+            elif type(v) is array_type and v.ndim == 2:
+                view = v.view()
+                view.flags.writeable = False
+                memo[id(v)] = view
+                items[k] = view
+            else:
+                items[k] = deep_copy(v,memo)
+                
+        return result
+    
     def expand_rows(self,rows):
         
+        # resize the buffer too
+        contiguous = dict.get(self,'_buffer') is not None
+        
         # store
         self._size = rows
         
@@ -44,6 +140,114 @@ class Conditions(Data):
             #: if type
         #: for each key,value
         
+        if contiguous:
+            self.make_contiguous()
+        
+        return
+    
+    def make_contiguous(self):
+        """ Conditions.make_contiguous()
+            moves the 2D float arrays of the conditions with a row per 
+            control point, of this and of the nested Conditions(), into the 
+            columns of one fortran ordered array. Each name keeps a view 
+            of its columns.
+            
+            Outputs:
+                the buffer array, control points by columns
+        """
+        
+        # find the fields
+        fields = []
+        self._find_fields(self._size,(),fields)
+        
+        # pack the buffer, column blocks in field order
+        n_cols = sum([ v.shape[1] for c,p,v in fields ])
+        buff   = np.empty([self._size,n_cols],order='F')
+        
+        layout = []
+        start  = 0
+        for container,path,value in fields:
+            stop = start + value.shape[1]
+            buff[:,start:stop] = value
+            layout.append( (container,path,start,stop) )
+            start = stop
+            
+        dict.__setitem__(self,'_buffer',buff)
+        dict.__setitem__(self,'_fields',layout)
+        
+        self.bind_views()
+        
+        return buff
+    
+    def _find_fields(self,rows,path,fields):
+        views = dict.get(self,'_views')
+        if views: views.clear()
+        for k,v in self.iteritems():
+            if isinstance(v,Conditions):
+                # nested buffers are merged into this one
+                dict.pop(v,'_buffer',None)
+                dict.pop(v,'_fields',None)
+                v._find_fields(rows,path+(k,),fields)
+            elif type(v) is array_type and v.ndim == 2 and v.shape[0] == rows and v.dtype == np.float64:
+                fields.append( (self,path+(k,),v) )
+    
+    def bind_views(self):
+        """ Conditions.bind_views()
+            binds the names of the contiguous fields to views of their
+            columns in the buffer
+        """
+        buff = dict.__getitem__(self,'_buffer')
+        
+        for container,path,start,stop in dict.__getitem__(self,'_fields'):
+            key  = path[-1]
+            view = buff[:,start:stop]
+            views = dict.get(container,'_views')
+            if views is None:
+                views = {}
+                dict.__setitem__(container,'_views',views)
+            views.pop(key,None)
+            Data.__setattr__(container,key,view)
+            views[key] = view
+            
+        return
+    
+    def buffer(self):
+        """ Conditions.buffer()
+            the array of the contiguous fields, after make_contiguous(). 
+            fields that were unbound since are copied back in first. 
+        """
+        buff = dict.get(self,'_buffer')
+        if buff is None:
+            return None
+        
+        for container,path,start,stop in dict.__getitem__(self,'_fields'):
+            views = dict.get(container,'_views')
+            if not views or not path[-1] in views:
+                return self.make_contiguous()
+            
+        return buff
+    
+    def fields(self):
+        """ Conditions.fields()
+            the contiguous fields after make_contiguous(), a list of
+            (path,start,stop), the keys to each field and its columns
+            in the buffer
+        """
+        if self.buffer() is None:
+            return None
+        return [ (path,start,stop) for c,path,start,stop in dict.__getitem__(self,'_fields') ]
+    
+    def snapshot(self):
+        """ Conditions.snapshot()
+            a copy of the contiguous fields, for restore()
+        """
+        return self.buffer().copy(order='F')
+    
+    def restore(self,snapshot):
+        """ Conditions.restore(snapshot)
+            sets the contiguous fields back to a snapshot()
+        """
+        self.buffer()[:,:] = snapshot
         return
 
     def compile(self):
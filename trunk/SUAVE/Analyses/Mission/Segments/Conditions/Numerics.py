@@ -2,6 +2,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -26,9 +27,13 @@ class Numerics(Conditions):
         self.discretization_method = chebyshev_data
         
         self.solver_jacobian                  = "none"
+        self.jacobian_evaluation              = None
         self.tolerance_solution               = 1e-8
         self.tolerance_boundary_conditions    = 1e-8        
         
+        # keep the 2D conditions in one array, see Conditions.make_contiguous()
+        self.contiguous_conditions            = False
+        
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
         self.dimensionless.differentiate  = np.empty([0,0])
@@ -2,6 +2,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,6 +19,7 @@ from Numerics   import Numerics
 
 import SUAVE
 from SUAVE.Core.Arrays import array_type
+from SUAVE.Core        import Data
 
 # ----------------------------------------------------------------------
 #  State
@@ -25,6 +27,9 @@ from SUAVE.Core.Arrays import array_type
 
 class State(Conditions):
     
+    # the initials and numerics are not per control point
+    _unexpanded = ('initials','numerics')
+    
     def __defaults__(self):
         
         self.unknowns   = Unknowns()
@@ -46,7 +51,7 @@ class State(Conditions):
         for k,v in self.iteritems():
             
             # don't expand initials or numerics
-            if k in ('initials','numerics'):
+            if k in self._unexpanded:
                 continue
             
             # recursion
@@ -68,18 +73,100 @@ class Container(State):
         
         state_out = State()
         
+        # contiguous conditions are stacked at once
+        conditions = merge_contiguous([ sub_state.conditions for sub_state in self.segments.values() ])
+        
         for i,(tag,sub_state) in enumerate(self.segments.items()):
             for key in ['unknowns','conditions','residuals']:
+                if key == 'conditions' and conditions is not None:
+                    continue
                 if i == 0:
                     state_out[key].update(sub_state[key])
                 else:
                     state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+                    
+        if conditions is not None:
+            state_out.conditions = conditions
             
         return state_out
         
 State.Container = Container
 
 
+def merge_contiguous(conditions):
+    """ merge_contiguous(conditions)
+        appends a list of contiguous conditions with the same fields, as 
+        Container.merged() would one by one. The buffers are stacked into
+        the buffer of the result, the other values are appended with 
+        append_array(). 
+        
+        Outputs:
+            the merged conditions, or None if the conditions are not 
+            contiguous with the same fields
+    """
+    
+    if len(conditions) < 2 or not all([ isinstance(c,Conditions) for c in conditions ]):
+        return None
+    
+    fields = conditions[0].fields()
+    if fields is None:
+        return None
+    for c in conditions[1:]:
+        if c.fields() != fields:
+            return None
+        
+    # stack the buffers
+    buffers = [ c.buffer() for c in conditions ]
+    n_rows  = sum([ b.shape[0] for b in buffers ])
+    buff    = np.empty([n_rows,buffers[0].shape[1]],order='F')
+    row = 0
+    for b in buffers:
+        buff[row:row+b.shape[0],:] = b
+        row += b.shape[0]
+        
+    # the rest
+    paths  = set([ path for path,start,stop in fields ])
+    merged = append_conditions(conditions,(),paths)
+    
+    layout = []
+    for path,start,stop in fields:
+        container = merged
+        for key in path[:-1]:
+            container = container[key]
+        layout.append( (container,path,start,stop) )
+    
+    merged._size = n_rows
+    dict.__setitem__(merged,'_buffer',buff)
+    dict.__setitem__(merged,'_fields',layout)
+    merged.bind_views()
+    
+    return merged
+
+
+def append_conditions(conditions,path,skip):
+    """ appends the values of a list of conditions, as do_recursive() 
+        with append_array(), except for the paths in skip 
+    """
+    
+    result = Conditions()
+    
+    for key,value in conditions[0].iteritems():
+        if not all([ c.has_key(key) for c in conditions[1:] ]):
+            continue
+        values = [ c[key] for c in conditions ]
+        if isinstance(value,Data):
+            result[key] = append_conditions(values,path+(key,),skip)
+        elif path+(key,) in skip:
+            result[key] = None
+        else:
+            for other in values[1:]:
+                value = append_array(value,other)
+            if value is not None:
+                result[key] = value
+            
+    return result
+    
+
 def append_array(A,B=None):
     if isinstance(A,array_type) and isinstance(B,array_type):
         return np.vstack([A,B])
@@ -2,14 +2,12 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
-# python imports
-from copy import deepcopy
-
 # SUAVE imports
 
 from SUAVE.Analyses import Analysis, Settings, Process
@@ -61,7 +59,7 @@ class Segment(Analysis):
                         
     def evaluate(self,state=None):
         if state is None:
-            state = deepcopy(self.state)
+            state = self.state.instantiate()
         self.process(self,state)
         return state
     
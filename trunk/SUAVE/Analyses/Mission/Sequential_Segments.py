@@ -8,11 +8,11 @@
 # ----------------------------------------------------------------------
 
 import SUAVE
-from SUAVE.Core import Container as ContainerBase
 
 from SUAVE.Methods import Missions as Methods
 
 from Mission import Mission
+from Mission import Container as ContainerBase
 """ Mission.py: Top-level mission class """
 # ----------------------------------------------------------------------
 #   Class
@@ -63,15 +63,6 @@ class Sequential_Segments(Mission):
 
 class Container(ContainerBase):
     
-    def evaluate(self,state=None):
-        results = SUAVE.Analyses.Results()
-        
-        for key,mission in self.items():
-            result = mission.evaluate(state)
-            results[key] = result
-            
-        return results
-    
     def finalize(self):
         pass
 
@@ -0,0 +1,172 @@
+# Warm_Start.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+
+# ----------------------------------------------------------------------
+#  Warm Start
+# ----------------------------------------------------------------------
+
+class Warm_Start(Data):
+    """ SUAVE.Analyses.Mission.Warm_Start()
+        a least recently used cache of converged segment unknowns
+
+        usage:
+            mission.warm_start.enabled = True
+
+        Each solved mission stores the converged unknowns of its segments,
+        by segment tag, against a fingerprint of the segment inputs and of
+        the vehicles seen by the segment analyses. The next evaluation starts
+        each segment from the entry with the nearest fingerprint, so a
+        slightly perturbed design starts next to its solution.
+
+        Attributes:
+            enabled         - turns the cache on
+            maximum_entries - least recently used entries beyond this are dropped
+            tolerance       - maximum relative fingerprint distance to warm start from
+            entries         - list of Data(fingerprint,unknowns)
+
+        Assumptions:
+            Segments whose initialize step overwrites their unknowns
+            (ie. ground segments) start from those values as before.
+    """
+
+    def __defaults__(self):
+        self.tag = 'warm_start'
+
+        self.enabled         = False
+        self.maximum_entries = 10
+        self.tolerance       = np.inf
+
+        self.entries = []
+
+    def lookup(self,segment):
+        """ Warm_Start.lookup(segment)
+            fingerprints the segment and returns the unknowns of the nearest
+            entry by sub segment tag, or None
+        """
+
+        fingerprint = self.fingerprint(segment)
+
+        nearest  = None
+        distance = self.tolerance
+
+        for entry in self.entries:
+            d = fingerprint_distance(fingerprint,entry.fingerprint)
+            if np.isfinite(d) and d <= distance:
+                nearest  = entry
+                distance = d
+
+        if nearest is None:
+            return None
+
+        # most recently used to the back
+        self.entries = [ e for e in self.entries if e is not nearest ] + [nearest]
+
+        return nearest.unknowns
+
+    def store(self,segment,state):
+        """ Warm_Start.store(segment,state)
+            keeps the converged unknowns of each sub segment in state
+        """
+
+        # after the solve, analyses may have added to the vehicles
+        fingerprint = self.fingerprint(segment)
+
+        entry = Data()
+        entry.fingerprint = fingerprint
+        entry.unknowns    = Data()
+
+        for tag,sub_state in state.segments.items():
+            entry.unknowns[tag] = deepcopy(sub_state.unknowns)
+
+        # replace an identical entry
+        self.entries = [ e for e in self.entries
+                         if fingerprint_distance(fingerprint,e.fingerprint) != 0. ]
+
+        self.entries.append(entry)
+
+        # evict the least recently used
+        while len(self.entries) > self.maximum_entries:
+            del self.entries[0]
+
+        return
+
+    def fingerprint(self,segment):
+        """ Warm_Start.fingerprint(segment)
+            a vector of the numerical inputs of the sub segments, and of
+            the vehicles found in their analyses
+        """
+
+        values   = []
+        vehicles = []
+
+        for tag,sub_segment in segment.segments.items():
+
+            # segment inputs
+            for key,value in sub_segment.items():
+                if isinstance(value,(int,float)) and not isinstance(value,bool):
+                    values.append(float(value))
+
+            # vehicles
+            for analysis in sub_segment.analyses.values():
+                if not isinstance(analysis,Data): continue
+                for key in ('geometry','vehicle'):
+                    vehicle = analysis.get(key,None)
+                    if isinstance(vehicle,Data) and not any([ vehicle is v for v in vehicles ]):
+                        vehicles.append(vehicle)
+
+        fingerprint = [ np.array(values) ]
+        for vehicle in vehicles:
+            fingerprint.append( vehicle.pack_array('vector') )
+
+        return np.hstack(fingerprint)
+
+    def reset(self):
+        """ forget all entries """
+        self.entries = []
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def fingerprint_distance(a,b):
+    """ largest elementwise relative difference, inf if not comparable """
+
+    if a.shape != b.shape:
+        return np.inf
+    if not a.size:
+        return 0.
+
+    scale = np.maximum( np.abs(a) , np.abs(b) )
+    scale[scale == 0.] = 1.
+
+    return np.max( np.abs(a-b) / scale )
+
+
+def apply_unknowns(unknowns,cached):
+    """ copies cached unknowns into unknowns in place, where the shapes match """
+
+    for key,value in unknowns.items():
+        if not cached.has_key(key): continue
+        other = cached[key]
+        if isinstance(value,Data):
+            apply_unknowns(value,other)
+        elif isinstance(value,array_type) and isinstance(other,array_type):
+            if value.shape == other.shape:
+                value[...] = other
+        elif isinstance(value,float) and isinstance(other,float):
+            unknowns[key] = other
+
+    return
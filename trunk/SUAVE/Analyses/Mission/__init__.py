@@ -1,8 +1,10 @@
 
 # classes
 from All_At_Once import All_At_Once
+from Executor import Executor
 from Mission import Mission
 from Sequential_Segments import Sequential_Segments
+from Warm_Start import Warm_Start
 
 # packages
 import Segments
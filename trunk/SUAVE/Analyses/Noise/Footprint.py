@@ -0,0 +1,219 @@
+# Footprint.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import multiprocessing
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from Noise import Noise
+
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE_observers
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import sel_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_data_adapter
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Analysis
+# ----------------------------------------------------------------------
+
+class Footprint(Noise):
+    """ SUAVE.Analyses.Noise.Footprint()
+        The noise footprint of a converged trajectory on a grid of ground observers: the EPNL, SEL
+        and maximum PNLT of every observer, and the ground areas inside their contours.
+
+        The geometry is the vehicle configuration flying the trajectory. The segments are resampled
+        onto the time step of the noise certification, with the networks of the vehicle evaluated on
+        the new steps. The observers are evaluated in chunks, so only the SPL histories of one chunk
+        are held at a time, optionally in a pool of forked processes.
+    """
+
+    def __defaults__(self):
+
+        self.tag        = 'noise_footprint'
+        self.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+        settings = self.settings
+
+        # ground grid, x along the track from the origin of the trajectory, y lateral [m]
+        settings.x_locations = np.linspace(-2000.,10000.,61)
+        settings.y_locations = np.linspace(-3000.,3000.,31)
+
+        # noise sources
+        settings.airframe_noise = True
+        settings.engine_noise   = True
+
+        # time step of the noise histories, None to use the control points of the segments
+        settings.time_step = 0.5 * Units.s
+
+        # observers evaluated together, and the number of processes evaluating them
+        settings.observers_per_chunk = 256
+        settings.workers             = 1
+
+        # contour levels, areas are found for each
+        settings.EPNL_levels = [80.,90.,100.]
+        settings.SEL_levels  = [80.,90.,100.]
+
+
+    def evaluate(self,segments):
+        """ SUAVE.Analyses.Noise.Footprint.evaluate(segments)
+            The footprint of one evaluated segment, or of a sequence of them (eg. results.segments) flown one
+            after the other.
+
+            Outputs:
+                x_locations, y_locations   - The ground grid [m]
+                EPNL                       - Effective Perceived Noise Level of each observer, [n_y,n_x] [EPNdB]
+                SEL                        - Sound Exposure Level of each observer, [n_y,n_x] [dBA]
+                PNLTM                      - Maximum tone corrected Perceived Noise Level, [n_y,n_x] [PNdB]
+                EPNL_contour_areas         - Ground area at or above each of the EPNL levels [m^2]
+                SEL_contour_areas          - Ground area at or above each of the SEL levels [m^2]
+        """
+
+        settings = self.settings
+
+        if 'conditions' in segments:
+            segments = [segments]
+        elif isinstance(segments,dict):
+            segments = segments.values()
+
+        # the segments on the noise time steps
+        if settings.time_step is not None:
+            propulsors = self.geometry.propulsors if settings.engine_noise else None
+            segments   = [ noise_data_adapter(segment,propulsors,settings.time_step) for segment in segments ]
+
+        # observers on the ground, row by row of the grid
+        x_locations = np.array(settings.x_locations,dtype=float)
+        y_locations = np.array(settings.y_locations,dtype=float)
+        X, Y        = np.meshgrid(x_locations,y_locations)
+
+        microphone_locations = np.zeros([X.size,3])
+        microphone_locations[:,0] = X.ravel()
+        microphone_locations[:,1] = Y.ravel()
+
+        chunk  = int(settings.observers_per_chunk)
+        chunks = [ microphone_locations[i:i+chunk] for i in range(0,X.size,chunk) ]
+
+        metrics = evaluate_chunks(self,segments,chunks,settings.workers)
+
+        EPNL  = np.reshape(np.concatenate([ m[0] for m in metrics ]),X.shape)
+        SEL   = np.reshape(np.concatenate([ m[1] for m in metrics ]),X.shape)
+        PNLTM = np.reshape(np.concatenate([ m[2] for m in metrics ]),X.shape)
+
+        # ground area of each observer, up to halfway to its neighbours
+        cell_areas = np.outer(cell_widths(y_locations),cell_widths(x_locations))
+
+        results = Data()
+        results.x_locations        = x_locations
+        results.y_locations        = y_locations
+        results.EPNL               = EPNL
+        results.SEL                = SEL
+        results.PNLTM              = PNLTM
+        results.EPNL_contour_areas = contour_areas(EPNL,cell_areas,settings.EPNL_levels)
+        results.SEL_contour_areas  = contour_areas(SEL,cell_areas,settings.SEL_levels)
+
+        return results
+
+
+# ----------------------------------------------------------------------
+#  Observers
+# ----------------------------------------------------------------------
+
+def evaluate_chunks(footprint,segments,chunks,workers=1):
+    #the metrics of the chunks of observers, in order
+
+    if workers <= 1:
+        return [ evaluate_observers(footprint,segments,microphone_locations) for microphone_locations in chunks ]
+
+    global _forked_footprint
+
+    #set before the pool forks, each worker then has its own copy
+    _forked_footprint = (footprint,segments)
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        metrics = pool.map(evaluate_forked_chunk,chunks)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+        _forked_footprint = None
+
+    return metrics
+
+
+# the footprint and the segments, inherited by the forked workers
+_forked_footprint = None
+
+def evaluate_forked_chunk(microphone_locations):
+    #runs in the worker process
+    footprint, segments = _forked_footprint
+    return evaluate_observers(footprint,segments,microphone_locations)
+
+
+def evaluate_observers(footprint,segments,microphone_locations):
+    #the EPNL, SEL and PNLTM of a chunk of observers, from their SPL histories along all the segments
+
+    settings = footprint.settings
+    config   = footprint.geometry
+
+    SPL  = []
+    time = []
+
+    for segment in segments:
+
+        # the sources, summed incoherently
+        energy = 0.
+        if settings.airframe_noise:
+            energy = energy + 10.**(0.1*noise_airframe_Fink(config,footprint,segment,microphone_locations).total)
+        if settings.engine_noise:
+            for propulsor in config.propulsors:
+                energy = energy + 10.**(0.1*noise_SAE_observers(propulsor,segment,footprint,microphone_locations).total)
+
+        segment_SPL  = 10.*np.log10(energy)
+        segment_time = segment.conditions.frames.inertial.time[:,0]
+
+        # a segment starts where the last one ended
+        if time and segment_time[0] == time[-1][-1]:
+            segment_SPL  = segment_SPL[:,1:,:]
+            segment_time = segment_time[1:]
+
+        SPL.append(segment_SPL)
+        time.append(segment_time)
+
+    SPL  = np.concatenate(SPL,axis=1)
+    time = np.concatenate(time)
+
+    PNLT  = pnl_noise(SPL) + noise_tone_correction(SPL)
+    PNLTM = np.max(PNLT,axis=-1)
+    EPNL  = epnl_noise(PNLT)
+    SEL   = sel_noise(SPL,time)
+
+    return EPNL, SEL, PNLTM
+
+
+# ----------------------------------------------------------------------
+#  Contours
+# ----------------------------------------------------------------------
+
+def cell_widths(locations):
+    #the width around each location, up to halfway to its neighbours
+
+    edges = np.hstack([ locations[0], (locations[1:]+locations[:-1])/2., locations[-1] ])
+
+    return np.diff(edges)
+
+
+def contour_areas(metric,cell_areas,levels):
+    #the ground area at or above each level
+
+    return np.array([ np.sum(cell_areas[metric>=level]) for level in levels ])
@@ -1,2 +1,3 @@
 from Noise           import  Noise
 from Fidelity_One    import Fidelity_One
+from Footprint       import Footprint
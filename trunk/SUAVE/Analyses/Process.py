@@ -2,11 +2,16 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+import inspect
+import weakref
+import numpy as np
+
 from SUAVE.Core import Container
 from Results import Results
 
@@ -16,11 +21,38 @@ from Results import Results
 # ----------------------------------------------------------------------
 
 class Process(Container):
+    """ SUAVE.Analyses.Process()
+        a container of steps, evaluated in order with the same arguments
+        
+        Incremental evaluation:
+            With Process.incremental set True, a step that declares the 
+            paths it reads and writes is skipped when none of them changed
+            since it last ran with the same arguments. A step declares them
+            as attributes of the function, dotted paths rooted at the names 
+            of its arguments, for example
+                update_atmosphere.reads  = ['state.conditions.freestream.altitude', ...]
+                update_atmosphere.writes = ['state.conditions.freestream.density', ...]
+            Arrays and numbers are compared by value, anything else by 
+            identity. The values are taken after the step runs, so a step 
+            that reads what it writes must give the same result when run 
+            again. Steps that declare nothing always run. Checking costs 
+            a few microseconds per path, only steps that cost much more 
+            are worth declaring.
+    """
     
     verbose = False
     
+    # skip declared steps whose inputs are unchanged
+    incremental = False
+    
+    # the Process_Profiler that is on, if any
+    profiler = None
+    
     def evaluate(self,*args,**kwarg):
         
+        if self.profiler is not None:
+            return self.profiler.evaluate(self,*args,**kwarg)
+        
         results = Results()
         
         if self.verbose:
@@ -33,12 +65,7 @@ class Process(Container):
             
             #if not callable(step): continue
             
-            if hasattr(step,'evaluate'): 
-                result = step.evaluate(*args,**kwarg)
-            else:
-                result = step(*args,**kwarg)
-                
-            results[tag] = result
+            results[tag] = self.evaluate_step(tag,step,args,kwarg)
         
         #: for each step
         
@@ -46,7 +73,167 @@ class Process(Container):
             print 'process end'        
         
         return results
+    
+    def evaluate_step(self,tag,step,args,kwarg):
+        """ evaluates one step, or skips it if incremental and its 
+            declared inputs and outputs are as it last left them
+        """
+        
+        if self.incremental and not isinstance(step,dict) and hasattr(step,'reads'):
+            
+            fingerprints = dict.get(self,'_fingerprints')
+            if fingerprints is None:
+                fingerprints = Fingerprints()
+                dict.__setitem__(self,'_fingerprints',fingerprints)
+            
+            last = fingerprints.get(tag)
+            if last is not None and last.holds(step,args,kwarg):
+                return last.result
+            
+            result = self.call_step(step,args,kwarg)
+            fingerprints[tag] = Fingerprint(step,args,kwarg,result)
+            
+            return result
+        
+        return self.call_step(step,args,kwarg)
+    
+    def call_step(self,step,args,kwarg):
+        
+        if hasattr(step,'evaluate'): 
+            return step.evaluate(*args,**kwarg)
+        else:
+            return step(*args,**kwarg)
         
     def __call__(self,*args,**kwarg):
         return self.evaluate(*args,**kwarg) 
+
+
+# ----------------------------------------------------------------------
+#  Fingerprints
+# ----------------------------------------------------------------------
+
+# a path that doesn't resolve
+_missing = object()
+
+class Fingerprints(dict):
+    """ the Fingerprint of each step of a process, by tag. kept in a hidden
+        item of the process, and not copied with it.
+    """
+    
+    def __deepcopy__(self,memo):
+        return None
+
+
+class Fingerprint(object):
+    """ the arguments a step last ran with, its result, and the values of 
+        the paths it declares, taken after it ran
+    """
+    
+    def __init__(self,step,args,kwarg,result):
+        self.args   = [ reference(a) for a in args ]
+        self.kwarg  = dict([ (k,reference(v)) for k,v in kwarg.items() ])
+        self.result = result
+        self.values = [ snapshot(value) for value in resolve_paths(step,args,kwarg) ]
+        
+    def holds(self,step,args,kwarg):
+        """ True if step would run with the same arguments on the same 
+            values
+        """
+        
+        if len(args) != len(self.args) or len(kwarg) != len(self.kwarg):
+            return False
+        for a,b in zip(args,self.args):
+            if a is not b():
+                return False
+        for k,v in kwarg.items():
+            if not k in self.kwarg or self.kwarg[k]() is not v:
+                return False
+        
+        values = resolve_paths(step,args,kwarg)
+        if len(values) != len(self.values):
+            return False
+        for value,last in zip(values,self.values):
+            if not same_value(value,last):
+                return False
+        
+        return True
+    
+
+def reference(value):
+    """ a weak reference to value if it can have one, so the arguments a
+        step last ran with are not kept alive by the process
+    """
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return lambda : value
+
+# the parsed paths of each step, by the declaring function
+_step_paths = {}
+
+def step_paths(step):
+    """ the paths a step reads, then those it writes, each as the name 
+        and index of the argument it starts from and the keys after it
+    """
+    
+    function = getattr(step,'evaluate',step)
+    
+    paths = _step_paths.get(function)
+    if paths is None:
+        
+        if inspect.ismethod(function):
+            names = inspect.getargspec(function).args[1:]
+        elif inspect.isfunction(function):
+            names = inspect.getargspec(function).args
+        else:
+            names = inspect.getargspec(function.__call__).args[1:]
+        
+        paths = []
+        for path in list(step.reads) + list(getattr(step,'writes',[])):
+            keys = path.split('.')
+            if not keys[0] in names:
+                raise KeyError , 'step has no argument "%s" for path "%s"' % (keys[0],path)
+            paths.append( (keys[0],names.index(keys[0]),keys[1:]) )
+        
+        _step_paths[function] = paths
+    
+    return paths
+
+def resolve_paths(step,args,kwarg):
+    """ the values at the paths a step reads, then those it writes """
+    
+    values = []
+    
+    for name,index,keys in step_paths(step):
+        if index < len(args):
+            value = args[index]
+        else:
+            value = kwarg.get(name,_missing)
+        for key in keys:
+            value = getattr(value,key,_missing)
+        values.append(value)
+    
+    return values
+
+class Array_Snapshot(tuple):
+    """ the shape, dtype and bytes of an array """
+    pass
+
+def snapshot(value):
+    """ what a value is compared by later """
+    if isinstance(value,np.ndarray) and not value.dtype.hasobject:
+        return Array_Snapshot( (value.shape,value.dtype,value.tobytes()) )
+    return value
+
+def same_value(value,last):
+    """ True if value is unchanged from the snapshot last """
+    
+    if type(last) is Array_Snapshot:
+        # the bytes, faster than comparing the elements of small arrays
+        return isinstance(value,np.ndarray) and value.shape == last[0] \
+               and value.dtype == last[1] and value.tobytes() == last[2]
+    elif isinstance(last,(bool,int,long,float,complex,str)):
+        return type(value) is type(last) and value == last
+    
+    return value is last
     
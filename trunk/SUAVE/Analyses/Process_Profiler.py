@@ -0,0 +1,273 @@
+# Process_Profiler.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import time
+
+from Results import Results
+from Process import Process
+
+
+# ----------------------------------------------------------------------
+#  Process Profiler
+# ----------------------------------------------------------------------
+
+class Process_Profiler(object):
+    """ SUAVE.Analyses.Process_Profiler()
+        wall time, call counts and memory of the steps of processes
+
+        usage:
+            profiler = Process_Profiler()
+            with profiler:
+                results = mission.evaluate()
+            print profiler.table()
+            profiler.save_collapsed('mission.folded')
+
+        While the profiler is on, every Process.evaluate() goes through
+        profiler.evaluate(), which times each step. Steps are keyed by a
+        dotted path: the owner of the process (the first argument of the
+        process, ie. a segment, found by its tag or under the segments of
+        its caller), the name of the process in the owner, then the step
+        tags. For example,
+            the_mission.segments.cruise.process.iterate.conditions.aerodynamics
+
+        Records, by dotted path:
+            calls  - number of calls
+            time   - wall time with the steps inside, seconds
+            self_time - wall time less the steps inside, seconds
+            memory - change of the resident memory of the process with the
+                     steps inside, bytes. Only on linux, zero elsewhere.
+                     Process_Profiler(memory=False) skips it, reading the
+                     memory is most of the cost of profiling.
+
+        Assumptions:
+            One profiler at a time, in one thread. A step that raises
+            is recorded up to the exception.
+    """
+
+    def __init__(self,memory=True):
+        self.memory  = memory and os.path.exists('/proc/self/statm')
+        self.records = {}
+        self.stacks  = {}
+        self._frames = []
+        self._paths  = {}
+        self._previous = None
+
+    # ------------------------------------------------------------------
+    #  Switching on and off
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """ profiles all processes from now on """
+        self._previous = Process.profiler
+        Process.profiler = self
+        return self
+
+    def stop(self):
+        """ stops profiling """
+        Process.profiler = self._previous
+        self._previous = None
+        return
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self,*exc_info):
+        self.stop()
+        return False
+
+    def clear(self):
+        """ forgets all records """
+        self.records = {}
+        self.stacks  = {}
+        return
+
+    # ------------------------------------------------------------------
+    #  Evaluation
+    # ------------------------------------------------------------------
+
+    def evaluate(self,process,*args,**kwarg):
+        """ Process.evaluate(), recording each step """
+
+        results = Results()
+
+        owner_path, path = self.process_path(process,args)
+
+        for tag,step in process.items():
+
+            # the step, or nothing if it is skipped
+            function = lambda *args,**kwarg: process.evaluate_step(tag,step,args,kwarg)
+
+            # a step that is a process has the path of the step
+            if isinstance(step,Process):
+                self._paths[id(step)] = (owner_path,path + '.' + tag)
+
+            results[tag] = self.call(path + '.' + tag,owner_path,function,args,kwarg)
+
+            self._paths.pop(id(step),None)
+
+        return results
+
+    def call(self,path,owner_path,function,args,kwarg):
+        """ calls function(*args,**kwarg) as the step at path """
+
+        frames = self._frames
+        frame  = [path,args[0] if args else None,0.,owner_path]
+        frames.append(frame)
+        depth  = len(frames)
+
+        memory = self.resident() if self.memory else 0
+        tic    = time.time()
+
+        try:
+            return function(*args,**kwarg)
+
+        finally:
+            elapsed = time.time() - tic
+            memory  = self.resident() - memory if self.memory else 0
+
+            # unwind anything left by an exception
+            del frames[depth-1:]
+
+            record = self.records.get(path)
+            if record is None:
+                record = self.records[path] = Results()
+                record.calls     = 0
+                record.time      = 0.
+                record.self_time = 0.
+                record.memory    = 0
+            record.calls     += 1
+            record.time      += elapsed
+            record.self_time += elapsed - frame[2]
+            record.memory    += memory
+
+            if frames:
+                frames[-1][2] += elapsed
+
+            stack = tuple([ f[0] for f in frames ]) + (path,)
+            self.stacks[stack] = self.stacks.get(stack,0.) + elapsed - frame[2]
+
+    def process_path(self,process,args):
+        """ the dotted paths of the owner of a process called with args,
+            and of the process
+        """
+
+        # a step of a process being profiled
+        paths = self._paths.pop(id(process),None)
+        if paths is not None:
+            return paths
+
+        owner = args[0] if args else None
+        name  = find_process(owner,process)
+
+        if name is None:
+            # called from a step, as part of it
+            if self._frames:
+                return self._frames[-1][3], self._frames[-1][0]
+            return 'process', 'process'
+
+        owner_path = self.owner_path(owner)
+
+        return owner_path, owner_path + '.' + name
+
+    def owner_path(self,owner):
+        """ the dotted path of the owner of a process """
+
+        # the owner of a calling step, or one of its segments
+        for frame in reversed(self._frames):
+            caller = frame[1]
+            if caller is None:
+                continue
+            if caller is owner:
+                return frame[3]
+            segments = getattr(caller,'segments',None)
+            if isinstance(segments,dict):
+                for key,segment in segments.items():
+                    if segment is owner:
+                        return frame[3] + '.segments.' + key
+            break
+
+        return getattr(owner,'tag',type(owner).__name__)
+
+    def resident(self):
+        """ the resident memory of this process, bytes """
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    # ------------------------------------------------------------------
+    #  Outputs
+    # ------------------------------------------------------------------
+
+    def table(self,sort='time',n_rows=None):
+        """ Process_Profiler.table(sort='time',n_rows=None)
+            a text table of the records, largest first
+
+            Inputs:
+                sort   - 'time', 'self_time', 'calls' or 'memory'
+                n_rows - number of rows, all if None
+        """
+
+        if not sort in ['time','self_time','calls','memory']:
+            raise ValueError , 'can not sort by "%s"' % sort
+
+        paths = sorted(self.records.keys(),key=lambda p:self.records[p][sort],reverse=True)
+        if n_rows is not None:
+            paths = paths[:n_rows]
+
+        lines = ['%10s %10s %8s %12s  %s' % ('time [s]','self [s]','calls','memory [kB]','step')]
+        for path in paths:
+            record = self.records[path]
+            lines.append( '%10.4f %10.4f %8i %12.1f  %s' % (record.time,record.self_time,record.calls,record.memory/1024.,path) )
+
+        return '\n'.join(lines)
+
+    def collapsed(self):
+        """ the call stacks of the steps in the collapsed stack format of
+            flame graph tools: one line per stack, frames separated by ';',
+            then the self time in microseconds. Each frame is its dotted
+            path less the path of the frame before it.
+        """
+
+        lines = []
+        for stack in sorted(self.stacks.keys()):
+            frames = [stack[0]]
+            for parent,path in zip(stack[:-1],stack[1:]):
+                if path.startswith(parent + '.'):
+                    path = path[len(parent)+1:]
+                frames.append(path)
+            lines.append( '%s %i' % (';'.join(frames),round(self.stacks[stack]*1e6)) )
+
+        return '\n'.join(lines) + '\n'
+
+    def save_collapsed(self,filename):
+        """ writes collapsed() to a file, for flamegraph.pl and the like """
+        with open(filename,'w') as output:
+            output.write(self.collapsed())
+        return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def find_process(owner,process):
+    """ the dotted name of process among the processes of owner, or None """
+
+    if not isinstance(owner,dict):
+        return None
+
+    for key,value in owner.items():
+        if value is process:
+            return key
+        if isinstance(value,Process):
+            name = find_process(value,process)
+            if name is not None:
+                return key + '.' + name
+
+    return None
@@ -8,8 +8,11 @@
 # ----------------------------------------------------------------------
 
 # imports
+import numpy as np
+from scipy.ndimage import spline_filter
 
 from SUAVE.Core import Data
+from SUAVE.Plugins.interpol import Intergrid
 from Analysis import Analysis
 
 
@@ -42,3 +45,185 @@ class Surrogate(Analysis):
         raise NotImplementedError
         return results
 
+
+# ----------------------------------------------------------------------
+#  Gridded Surrogate
+# ----------------------------------------------------------------------
+
+class Gridded_Surrogate(Surrogate):
+    ''' Gridded Surrogate Base Class
+        samples outputs on the full grid of the training axes, then
+        interpolates them, multilinear or cubic
+
+        Attributes:
+            training.axes     - Data() of 1d increasing arrays, one per
+                                input, in grid order
+            training.outputs  - Data() of sampled outputs, in the grid shape
+            settings.interpolation_order - 1 multilinear, 3 cubic spline
+
+        Subclasses implement sample_points(points), which gets a Data()
+        of flattened column inputs, one row per grid point, and returns
+        a Data() of outputs of the same rows.
+    '''
+
+    def __defaults__(self):
+        self.training.axes    = Data()
+        self.training.outputs = Data()
+        self.settings.interpolation_order = 1
+        return
+
+    def sample_training(self):
+
+        axes  = self.training.axes
+        shape = [ len(axis) for axis in axes.values() ]
+
+        # every grid point, as column vectors
+        grids  = np.meshgrid( *axes.values() , indexing='ij' )
+        points = Data()
+        for key,grid in zip(axes.keys(),grids):
+            points[key] = np.reshape(grid,[-1,1])
+
+        # sample all points at once
+        outputs = self.sample_points(points)
+
+        self.training.outputs = Data()
+        for key,value in outputs.items():
+            self.training.outputs[key] = np.reshape(value,shape)
+
+        return
+
+    def sample_points(self,points):
+        raise NotImplementedError
+
+    def build_surrogate(self):
+
+        axes  = self.training.axes.values()
+        order = self.settings.interpolation_order
+
+        for key,values in self.training.outputs.items():
+            self.surrogates[key] = Grid_Interpolation(axes,values,order)
+
+        return
+
+    def evaluate_surrogates(self,*inputs):
+        ''' evaluates each surrogate at inputs, given in the order of the axes '''
+
+        results = Data()
+        for key,surrogate in self.surrogates.items():
+            results[key] = surrogate(*inputs)
+
+        return results
+
+
+# ----------------------------------------------------------------------
+#  Grid Interpolation
+# ----------------------------------------------------------------------
+
+class Grid_Interpolation(object):
+    ''' Grid_Interpolation(axes,values,order=1)
+        vectorized interpolation on a rectangular, possibly non-uniform grid,
+        called as model(x1,x2,...) with arrays of any one shape
+
+        Inputs:
+            axes   - list of 1d increasing arrays
+            values - array of shape [len(axis) for axis in axes]
+            order  - 1 multilinear, 3 cubic spline
+
+        Assumptions:
+            inputs outside the grid are held to the nearest grid value
+            axes with a single value are ignored
+    '''
+
+    def __init__(self,axes,values,order=1):
+
+        axes   = [ np.array(axis,dtype=float).flatten() for axis in axes ]
+        values = np.array(values,dtype=float)
+
+        if values.shape != tuple([ len(axis) for axis in axes ]):
+            raise ValueError , 'values do not match the grid shape'
+        for axis in axes:
+            if np.any(np.diff(axis) <= 0.):
+                raise ValueError , 'grid axes must be increasing'
+
+        # drop single valued axes
+        self.active = [ len(axis) > 1 for axis in axes ]
+        axes   = [ axis for axis,active in zip(axes,self.active) if active ]
+        values = np.reshape( values , [ len(axis) for axis in axes ] )
+
+        # the kernel needs at least two dimensions
+        self.padded = len(axes) < 2
+        while len(axes) < 2:
+            axes.append( np.array([0.,1.]) )
+            values = np.repeat( values[...,None] , 2 , axis=-1 )
+
+        # inputs are held to the grid
+        self.lo = np.array([ axis[0]  for axis in axes ])
+        self.hi = np.array([ axis[-1] for axis in axes ])
+
+        # spline coefficients, once, with the spline boundaries moved
+        # out of the grid onto extrapolated nodes
+        if order > 1:
+            for k in range(len(axes)):
+                axes[k], values = extrapolate_axis(axes[k],values,k,order+1)
+            values = spline_filter(values,order=order)
+
+        lo = np.array([ axis[0]  for axis in axes ])
+        hi = np.array([ axis[-1] for axis in axes ])
+
+        self.kernel = Intergrid( values, lo=lo, hi=hi, maps=axes,
+                                 verbose=0, order=order, prefilter=False )
+
+    def __call__(self,*inputs):
+
+        inputs = [ np.asarray(x,dtype=float) for x in inputs ]
+        if len(inputs) != len(self.active):
+            raise ValueError , 'expected %i inputs' % len(self.active)
+
+        shape = np.broadcast(*inputs).shape
+        X = [ np.broadcast_to(x,shape).flatten()
+              for x,active in zip(inputs,self.active) if active ]
+        if self.padded:
+            X = X + [ np.zeros(int(np.prod(shape))) ] * (2-len(X))
+
+        X = np.clip( np.column_stack(X) , self.lo , self.hi )
+
+        Y = self.kernel(X)
+
+        return np.reshape(Y,shape)
+
+
+def extrapolate_axis(axis,values,k,n_nodes):
+    """ adds n_nodes to each end of axis k of the grid, mirrored in spacing,
+        with values extrapolated by a cubic through the end nodes, in the
+        index space the spline is fit in
+    """
+
+    n      = len(axis)
+    n_pad  = min(n_nodes,n-1)
+    degree = min(3,n-1)
+
+    # grid lines along the axis
+    lines = np.reshape( np.rollaxis(values,k) , [n,-1] )
+
+    index  = np.arange(degree+1,dtype=float)
+    fit_lo = np.polyfit( index , lines[:degree+1]  , degree )
+    fit_hi = np.polyfit( index , lines[-degree-1:] , degree )
+
+    ghosts_lo = -np.arange(n_pad,0,-1,dtype=float)
+    ghosts_hi = degree + np.arange(1,n_pad+1,dtype=float)
+
+    lines = np.vstack([ np.dot( np.vander(ghosts_lo,degree+1) , fit_lo ) ,
+                        lines ,
+                        np.dot( np.vander(ghosts_hi,degree+1) , fit_hi ) ])
+
+    # back to the grid
+    shape    = list(np.rollaxis(values,k).shape)
+    shape[0] = lines.shape[0]
+    values   = np.rollaxis( np.reshape(lines,shape) , 0 , k+1 )
+
+    # the mirrored coordinates keep the axis increasing
+    axis = np.hstack([ 2.*axis[0]  - axis[n_pad:0:-1] ,
+                       axis ,
+                       2.*axis[-1] - axis[-2:-n_pad-2:-1] ])
+
+    return axis, values
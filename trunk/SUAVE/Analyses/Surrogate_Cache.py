@@ -0,0 +1,172 @@
+# Surrogate_Cache.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Core.filelock import filelock
+from SUAVE.Core.Input_Output import load_pickle, save_pickle
+
+
+# ----------------------------------------------------------------------
+#  Surrogate Cache
+# ----------------------------------------------------------------------
+
+class Surrogate_Cache(Data):
+    """ SUAVE.Analyses.Surrogate_Cache()
+        an on-disk cache of surrogate training data, addressed by a hash
+        of everything the training depends on
+
+        usage:
+            analysis.cache.directory = 'surrogate_cache'
+
+        Attributes:
+            directory    - where the cache files go, None disables the cache
+            lock_timeout - seconds to wait for another process building
+                           the same entry
+            hits, misses - counters for this instance
+
+        Assumptions:
+            Inputs are hashed by value: Data by sorted keys, arrays by
+            dtype, shape and contents, numbers and strings by repr. Other
+            objects only contribute their type, so they must not change
+            the training.
+
+            An entry that exists is loaded without locking: entries are
+            written aside and renamed into place, so a reader never sees
+            a partial file. While one process builds a missing entry,
+            others asking for the same entry wait on its lock file and
+            then load the result. A lock file left by a killed process has
+            to be removed by hand.
+    """
+
+    def __defaults__(self):
+        self.tag = 'surrogate_cache'
+
+        self.directory    = None
+        self.lock_timeout = 3600.
+
+        self.hits   = 0
+        self.misses = 0
+
+    def fetch(self,inputs,build):
+        """ Surrogate_Cache.fetch(inputs,build)
+            returns the cached data for inputs, or calls build() and
+            caches what it returns
+
+            Inputs:
+                inputs - anything hashable by hash_inputs()
+                build  - a function of no arguments returning picklable data
+
+            Outputs:
+                data   - the built or loaded data
+        """
+
+        if self.directory is None:
+            return build()
+
+        directory = os.path.abspath(self.directory)
+        if not os.path.exists(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                pass # made by another process
+
+        file_name = os.path.join(directory,hash_inputs(inputs) + '.pkl')
+
+        # entries are complete once they exist
+        if os.path.exists(file_name):
+            self.hits += 1
+            return load_entry(file_name)
+
+        # one build per entry, across processes
+        with filelock(file_name + '.build',timeout=self.lock_timeout):
+
+            # built while waiting for the lock
+            if os.path.exists(file_name):
+                self.hits += 1
+                return load_entry(file_name)
+
+            self.misses += 1
+            data = build()
+            save_entry(data,file_name)
+
+        return data
+
+
+# ----------------------------------------------------------------------
+#  Entries
+# ----------------------------------------------------------------------
+
+def load_entry(file_name):
+    """ the data of a cache entry, in the format of load_data() """
+    return load_pickle(file_name)['python_data']
+
+
+def save_entry(data,file_name):
+    """ writes a cache entry next to its place and renames it there """
+
+    temp_name = '%s.%i.tmp' % (file_name,os.getpid())
+    try:
+        save_pickle(temp_name,{'python_data':data})
+        os.rename(temp_name,file_name)
+    finally:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Hashing
+# ----------------------------------------------------------------------
+
+def hash_inputs(inputs):
+    """ a sha1 hex digest of the value of inputs """
+
+    digest = hashlib.sha1()
+    update_hash(digest,inputs)
+
+    return digest.hexdigest()
+
+
+def update_hash(digest,value):
+    """ feeds value into digest, recursively """
+
+    if isinstance(value,dict):
+        digest.update('{')
+        for key in sorted(value.keys()):
+            digest.update(repr(key))
+            update_hash(digest,value[key])
+        digest.update('}')
+
+    elif isinstance(value,(list,tuple)):
+        digest.update('[')
+        for item in value:
+            update_hash(digest,item)
+        digest.update(']')
+
+    elif isinstance(value,np.ndarray):
+        value = np.ascontiguousarray(value)
+        digest.update('%s%s' % (value.dtype.str,value.shape))
+        if value.dtype != object:
+            digest.update(value.tostring())
+        else:
+            for item in value.flat:
+                update_hash(digest,item)
+
+    elif value is None or isinstance(value,(bool,int,long,float,complex,str,unicode,np.number)):
+        digest.update(repr(value))
+
+    else:
+        digest.update(type(value).__name__)
+
+    return
@@ -1,9 +1,11 @@
 
 from Analysis  import Analysis
 from Sizing    import Sizing
-from Surrogate import Surrogate
+from Surrogate import Surrogate, Gridded_Surrogate, Grid_Interpolation
+from Surrogate_Cache import Surrogate_Cache
 from Results   import Results
 from Process   import Process
+from Process_Profiler import Process_Profiler
 from Settings  import Settings
 from Vehicle   import Vehicle
      
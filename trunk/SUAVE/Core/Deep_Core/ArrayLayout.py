@@ -0,0 +1,209 @@
+# ArrayLayout.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from arrays import array_type, matrix_type
+
+
+# ----------------------------------------------------------------------
+#   Array Layout
+# ----------------------------------------------------------------------
+
+# kinds of entries
+_SKIP   = 0
+_SCALAR = 1
+_ARRAY  = 2
+_DATA   = 3
+
+# an item that doesn't exist
+_missing = object()
+
+class ArrayLayout(object):
+    """ ArrayLayout(data)
+
+        the layout of OrderedBunch.pack_array(data,'vector'), walked once:
+        where each value of the nested data goes in the packed vector,
+        and the type and shape it must keep for the layout to hold.
+
+        pack() and unpack() then loop over a flat list of entries into
+        one preallocated vector, instead of walking the data again. They
+        return None if the data no longer has the structure the layout
+        was made from (keys, types, shapes or dtypes changed), the layout
+        should then be rebuilt.
+
+        Assumptions:
+            all nested dictionaries are OrderedBunch(), the layout is not
+            supported otherwise (see supported)
+    """
+
+    def __init__(self,data):
+
+        self.entries    = []    # (items, key, kind, type, shape, dtype, start, stop)
+        self.containers = []    # (data, keys)
+        self.size       = 0
+        self.dtype      = None
+        self.supported  = True
+
+        self.build(data)
+
+        if self.supported:
+            dtypes = [ e[5] for e in self.entries if e[2] in (_SCALAR,_ARRAY) ]
+            self.dtype = np.result_type(*dtypes) if dtypes else np.dtype(float)
+
+    def __deepcopy__(self,memo):
+        # a copy of the data has its own structure
+        return None
+
+    def build(self,data):
+        """ walks data in the order of pack_array """
+
+        from OrderedDict import OrderedDict
+
+        keys = dict.get(data,'_keys')
+        if keys is None:
+            self.supported = False
+            return
+
+        self.containers.append( (data,keys[:]) )
+        items = data.__dict__
+
+        for key in keys:
+            v = items[key]
+            t = type(v)
+
+            # nested data
+            if isinstance(v,OrderedDict):
+                self.entries.append( (items,key,_DATA,t,v,None,0,0) )
+                self.build(v) # recursion!
+                continue
+
+            # not packed
+            elif not isinstance(v,(int,float,array_type,matrix_type)) or np.ndim(v) > 2:
+                self.entries.append( (items,key,_SKIP,t,None,None,0,0) )
+                continue
+
+            # packed
+            start = self.size
+            if isinstance(v,(int,float)):
+                self.entries.append( (items,key,_SCALAR,t,None,np.array([v]).dtype,start,start+1) )
+                self.size += 1
+            elif t is array_type and v.ndim > 0 and not v.dtype.hasobject:
+                self.entries.append( (items,key,_ARRAY,t,v.shape,v.dtype,start,start+v.size) )
+                self.size += v.size
+            else:
+                self.supported = False
+
+        return
+
+    def holds(self):
+        """ True if the keys of the data are those of the layout """
+        for data,keys in self.containers:
+            if dict.get(data,'_keys') != keys:
+                return False
+        return True
+
+    def pack(self,data):
+        """ ArrayLayout.pack(data)
+            the vector of data.pack_array('vector'), or None if data no
+            longer has this layout
+        """
+
+        if not self.supported or not self.holds():
+            return None
+
+        M = np.empty(self.size,dtype=self.dtype)
+
+        for items,key,kind,t,shape,dtype,start,stop in self.entries:
+            v = items.get(key,_missing)
+            if type(v) is not t:
+                return None
+            elif kind == _ARRAY:
+                if v.shape != shape or v.dtype != dtype:
+                    return None
+                M[start:stop] = v.ravel(order='F')
+            elif kind == _SCALAR:
+                M[start] = v
+            elif kind == _DATA:
+                if v is not shape:
+                    return None
+
+        return M
+
+    def unpack(self,data,M):
+        """ ArrayLayout.unpack(data,M)
+            unpacks the vector M into data as data.unpack_array(M),
+            returns data, or None if data no longer has this layout or M
+            is not a vector of its size
+        """
+
+        if not self.supported or np.ndim(M) != 1 or M.shape[0] != self.size or not self.holds():
+            return None
+
+        # check first, so the data is not left half unpacked
+        for items,key,kind,t,shape,dtype,start,stop in self.entries:
+            v = items.get(key,_missing)
+            if type(v) is not t:
+                return None
+            elif kind == _ARRAY:
+                if v.shape != shape:
+                    return None
+            elif kind == _DATA:
+                if v is not shape:
+                    return None
+
+        for items,key,kind,t,shape,dtype,start,stop in self.entries:
+            if kind == _ARRAY:
+                if len(shape) == 1:
+                    items[key][:] = M[start:stop]
+                else:
+                    items[key][:,:] = np.reshape( M[start:stop], shape, order='F' )
+            elif kind == _SCALAR:
+                # the type it was packed from, so the layout still holds,
+                # an int takes the float it is given as unpack_array does
+                items[key] = t(M[start]) if issubclass(t,float) else float(M[start])
+
+        return data
+
+
+# ----------------------------------------------------------------------
+#   Module Tests
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    from DataBunch import DataBunch
+    from OrderedDict import OrderedDict
+
+    ones = np.ones([4,1])
+
+    d = DataBunch()
+    d.tag = 'unknowns'
+    d.throttle = ones * 0.5
+    d.angles = DataBunch()
+    d.angles.body = ones * 0.1
+    d.angles.grid = np.arange(6.).reshape([3,2])
+    d.value = 1.0
+
+    layout = ArrayLayout(d)
+    V = layout.pack(d)
+
+    print V
+    print np.all( V == OrderedDict.pack_array(d) )
+
+    layout.unpack(d,V*10.)
+    print d
+
+    # the scalar comes back a float, the layout still holds
+    print type(d.value) is float
+    print np.all( layout.pack(d) == V*10. )
+
+    # a new key, the layout no longer holds
+    d.angles.path = ones
+    print layout.pack(d)
@@ -2,12 +2,14 @@
 #
 # Created:  Aug 2015, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
 # ----------------------------------------------------------------------
 
 from IndexableBunch import IndexableBunch 
+from OrderedBunch   import deep_copy
 
 import numpy as np
 
@@ -16,6 +18,12 @@ import numpy as np
 #   Data Dictionary
 # ----------------------------------------------------------------------
 
+# defaulted instances to copy new data from, by class
+_templates = {}
+
+# classes whose defaults can't be copied
+_uncached = set()
+
 class DataBunch(IndexableBunch):
     """ DataBunch()
         
@@ -24,11 +32,19 @@ class DataBunch(IndexableBunch):
         will recursively search for defaults of base classes
         current class defaults overide base class defaults
 
+        the defaults of a class are run once, for its first instance, 
+        and kept as a template. later instances are copies of the 
+        template, which is much faster for classes with deep defaults. 
+        classes whose defaults must run every time (for example, if they 
+        depend on global state) set _cache_defaults = False
+
         Methods:
             __defaults__(self)      : sets the defaults of 
             find_instances(datatype)
     """
     
+    _cache_defaults = True
+    
     def __defaults__(self):
         pass
     
@@ -36,9 +52,13 @@ class DataBunch(IndexableBunch):
         """ supress use of args or kwarg for defaulting
         """
         
+        # copy the defaults of an earlier instance
+        template = _templates.get(cls)
+        if template is not None:
+            return deep_copy(template,{})
+        
         # initialize data, no inputs
         self = super(DataBunch,cls).__new__(cls)
-        super(DataBunch,self).__init__()
         
         # get base class list
         klasses = self.get_bases()
@@ -47,9 +67,12 @@ class DataBunch(IndexableBunch):
         for klass in klasses[::-1]:
             klass.__defaults__(self)
         
-        ## ensure local copies
-        #for k,v in self.iteritems():
-            #self[k] = deepcopy(v)
+        # keep a template of the defaults
+        if cls._cache_defaults and not cls in _uncached:
+            try:
+                _templates[cls] = deep_copy(self,{})
+            except Exception:
+                _uncached.add(cls)
             
         return self
     
@@ -58,10 +81,11 @@ class DataBunch(IndexableBunch):
         """
         
         # handle input data (ala class factory)
-        input_data = DataBunch.__base__(*args,**kwarg)
-        
-        # update this data with inputs
-        self.update(input_data)
+        if args or kwarg:
+            input_data = DataBunch.__base__(*args,**kwarg)
+            
+            # update this data with inputs
+            self.update(input_data)
         
         # call over-ridable post-initialition setup
         self.__check__()
@@ -212,6 +236,7 @@ if __name__ == '__main__':
     
     # speed test
     from time import time, sleep
+    from copy import deepcopy
     t0 = time()
     for i in range(100000):
         v = d.options.half
@@ -228,5 +253,36 @@ if __name__ == '__main__':
     t2 = time()-t0
     
     print 'Bunch:       %.6f' % (t1)
-    print 'SimpleBunch: %.6f' % (t2)    
+    print 'SimpleBunch: %.6f' % (t2)
+    
+    # item access, by key and by index
+    t0 = time()
+    for i in range(100000):
+        v = d['options']['half']
+        v = d[0]
+    t3 = time()-t0
+    
+    # creation from defaults
+    class DefaultBunch(DataBunch):
+        def __defaults__(self):
+            self.tag = 'defaults'
+            self.rates = DataBunch()
+            self.rates.angle = ones * 0.
+            self.rates.slope = ones * 0.
+            self.options = DataBunch()
+            self.options.field = 'of greens'
+            self.options.half  = 0.5
+    t0 = time()
+    for i in range(10000):
+        v = DefaultBunch()
+    t4 = time()-t0
+    
+    t0 = time()
+    for i in range(10000):
+        v = deepcopy(m)
+    t5 = time()-t0
+    
+    print 'Items:       %.6f' % (t3)
+    print 'Creation:    %.6f' % (t4)
+    print 'Deepcopy:    %.6f' % (t5)    
     
\ No newline at end of file
@@ -2,6 +2,7 @@
 #
 # Created:  Aug 2015, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -19,6 +20,14 @@ import numpy as np
 
 class DiffedDataBunch(DataBunch):
     """ DiffedDataBunch()
+        
+        a copy of a base, and the difference from it (see store_diff)
+        
+        pull_base() updates this with the base and then the difference. 
+        values that are not dictionaries are shared with the base and the 
+        difference, not copied, so the values that are the same objects 
+        as in the base are skipped by the next diff and pull_base, 
+        which only compare the values that changed.
     """
     
     def __defaults__(self):
@@ -39,8 +48,8 @@ class DiffedDataBunch(DataBunch):
     def pull_base(self):
         try: self._base.pull_base()
         except AttributeError: pass
-        self.update(self._base)
-        self.update(self._diff)
+        pull(self,self._base)
+        pull(self,self._diff)
     
     def __str__(self,indent=''):
         try: 
@@ -58,6 +67,17 @@ class DiffedDataBunch(DataBunch):
 
 def diff(A,B):
     
+    result = _diff(A,B)
+    
+    if result is None:
+        result = type(A)()
+        result.clear()
+        
+    return result
+
+def _diff(A,B):
+    """ the diff of A from B, or None if there is none """
+    
     keys = set([])
     keys.update( A.keys() )
     keys.update( B.keys() )
@@ -66,21 +86,61 @@ def diff(A,B):
         keys.remove('_base')
         keys.remove('_diff')
     
-    result = type(A)()
-    result.clear()
+    result = None
     
     for key in keys:
         va = A.get(key,None)
         vb = B.get(key,None)
+        
+        # shared since the last pull_base
+        if va is vb:
+            continue
+        
         if isinstance(va,DataBunch) and isinstance(vb,DataBunch):
-            sub_diff = diff(va,vb)
-            if sub_diff:
-                result[key] = sub_diff
+            delta = _diff(va,vb)
+            if delta is None:
+                continue
         
         elif isinstance(va,DataBunch) or isinstance(vb,DataBunch):
-            result[key] = va
+            delta = va
             
         elif not np.all(va == vb):
-            result[key] = va
+            delta = va
+            
+        else:
+            continue
         
-    return result    
\ No newline at end of file
+        if result is None:
+            result = type(A)()
+            result.clear()
+        result[key] = delta
+        
+    return result
+
+
+def pull(A,B):
+    """ updates A with B as Dict.update(), skipping the values of B 
+        that A already has
+    """
+    
+    for k,v in B.iteritems():
+        if k.startswith('_'):
+            continue
+        a = A.get(k,_missing)
+        if a is v:
+            continue
+        if isinstance(a,DataBunch) and isinstance(v,dict):
+            pull(a,v)
+        elif a is not _missing and hasattr(a,'update'):
+            try:
+                a.update(v)
+            except:
+                A[k] = v
+        else:
+            A[k] = v
+        
+    return
+
+
+# a value that doesn't exist
+_missing = object()    
\ No newline at end of file
@@ -2,6 +2,7 @@
 #
 # Created:  Aug 2015, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -18,7 +19,19 @@ from IndexableDict import IndexableDict
 class IndexableBunch(IndexableDict,OrderedBunch):
     """ An ordered indexable dictionary that provides attribute-style access.
     """
-    pass
+    
+    def __getitem__(self,k):
+        # items are attributes, indices are positions in the key order
+        if isinstance(k,int):
+            return self.__dict__[ dict.__getitem__(self,'_keys')[k] ]
+        try:
+            return self.__dict__[k]
+        except (KeyError,TypeError):
+            return IndexableDict.__getitem__(self,k)
+    
+    # iterate on values, not keys
+    def __iter__(self):
+        return iter(self.values())
 
 # ----------------------------------------------------------------------
 #   Module Tests
@@ -2,6 +2,7 @@
 #
 # Created:  Aug 2015, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -10,6 +11,10 @@
 from Bunch import Bunch
 from OrderedDict import OrderedDict
 from Property import Property
+from ArrayLayout import ArrayLayout
+
+from copy import deepcopy
+import numpy as np
     
 # ----------------------------------------------------------------------
 #   Ordered Bunch
@@ -17,44 +22,36 @@ from Property import Property
 
 class OrderedBunch(Bunch,OrderedDict):
     """ An ordered dictionary that provides attribute-style access.
+        
+        The values are the instance attributes, the order of the keys
+        is kept in a hidden list.
     """
     
-    _root = Property('_root')
-    _map  = Property('_map')
+    _keys = Property('_keys')
     
     def __new__(klass,*args,**kwarg):
 
         self = Bunch.__new__(klass)
         
-        try:
-            self._root
-        except:
-            root = [] # sentinel node
-            root[:] = [root, root, None]
-            dict.__setitem__(self,'_root',root)
-            dict.__setitem__(self,'_map' ,{})
+        if not dict.__contains__(self,'_keys'):
+            dict.__setitem__(self,'_keys',[])
         
         return self
 
     def __setattr__(self, key, value):
         """od.__setitem__(i, y) <==> od[i]=y"""
-        # Setting a new item creates a new link which goes at the end of the linked
-        # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
-            root = dict.__getitem__(self,'_root')
-            last = root[0]
-            map  = dict.__getitem__(self,'_map')
-            last[1] = root[0] = map[key] = [last, root, key]
+        # Setting a new item appends its key to the key list, class 
+        # attributes and properties are not items.
+        if not key in self.__dict__ and not hasattr(self.__class__,key):
+            dict.__getitem__(self,'_keys').append(key)
         Bunch.__setattr__(self,key, value)
 
     def __delattr__(self, key):
         """od.__delitem__(y) <==> del od[y]"""
-        # Deleting an existing item uses self._map to find the link which is
-        # then removed by updating the links in the predecessor and successor nodes.
         Bunch.__delattr__(self,key)
-        link_prev, link_next, key = self._map.pop(key)
-        link_prev[1] = link_next
-        link_next[0] = link_prev
+        keys = dict.__getitem__(self,'_keys')
+        if key in keys:
+            keys.remove(key)
         
     def __setitem__(self,k,v):
         self.__setattr__(k,v)
@@ -64,30 +61,16 @@ class OrderedBunch(Bunch,OrderedDict):
 
     def __iter__(self):
         """od.__iter__() <==> iter(od)"""
-        root = self._root
-        curr = root[1]
-        while curr is not root:
-            yield curr[2]
-            curr = curr[1]
+        # over a copy, items can be deleted on the way
+        return iter(dict.__getitem__(self,'_keys')[:])
 
     def __reversed__(self):
         """od.__reversed__() <==> reversed(od)"""
-        root = self._root
-        curr = root[0]
-        while curr is not root:
-            yield curr[2]
-            curr = curr[0]
+        return reversed(dict.__getitem__(self,'_keys')[:])
 
     def clear(self):
         """od.clear() -> None.  Remove all items from od."""
-        try:
-            for node in self._map.itervalues():
-                del node[:]
-            root = self._root
-            root[:] = [root, root, None]
-            self._map.clear()
-        except AttributeError:
-            pass
+        del dict.__getitem__(self,'_keys')[:]
         Bunch.clear(self)
 
     def popitem(self, last=True):
@@ -96,22 +79,18 @@ class OrderedBunch(Bunch,OrderedDict):
         '''
         if not self:
             raise KeyError('dictionary is empty')
-        root = self._root
+        keys = dict.__getitem__(self,'_keys')
         if last:
-            link = root[0]
-            link_prev = link[0]
-            link_prev[1] = root
-            root[0] = link_prev
+            key = keys.pop()
         else:
-            link = root[1]
-            link_next = link[1]
-            root[1] = link_next
-            link_next[0] = root
-        key = link[2]
-        del self._map[key]
+            key = keys.pop(0)
         value = Bunch.pop(self,key)
         return key, value
         
+    def __deepcopy__(self,memo):
+        """ copy.deepcopy(od), see deep_copy() """
+        return deep_copy(self,memo)
+        
     def __reduce__(self):
         """Return state information for pickling"""
         items = [( k, OrderedBunch.__getitem__(self,k) ) for k in OrderedBunch.iterkeys(self)]
@@ -167,15 +146,17 @@ class OrderedBunch(Bunch,OrderedDict):
     
     def keys(self):
         """OrderedDict.keys() -> list of keys in the dictionary"""
-        return list(self.__iter())
+        return dict.__getitem__(self,'_keys')[:]
     
     def values(self):
         """OrderedDict.values() -> list of values in the dictionary"""
-        return [self[key] for key in self.__iter()]
+        items = self.__dict__
+        return [items[key] for key in dict.__getitem__(self,'_keys')]
     
     def items(self):
         """OrderedDict.items() -> list of (key, value) pairs in the dictionary"""
-        return [(key, self[key]) for key in self.__iter()]
+        items = self.__dict__
+        return [(key, items[key]) for key in dict.__getitem__(self,'_keys')]
     
     def iterkeys(self):
         """OrderedDict.iterkeys() -> an iterator over the keys in the dictionary"""
@@ -183,20 +164,122 @@ class OrderedBunch(Bunch,OrderedDict):
     
     def itervalues(self):
         """OrderedDict.itervalues -> an iterator over the values in the dictionary"""
+        items = self.__dict__
         for k in self.__iter():
-            yield self[k]
+            yield items[k]
     
     def iteritems(self):
         """od.iteritems -> an iterator over the (key, value) items in the dictionary"""
+        items = self.__dict__
         for k in self.__iter():
-            yield (k, self[k])    
-
+            yield (k, items[k])    
+            
+    def pack_array(self,output='vector'):
+        """ OrderedDict.pack_array(output='vector'), see OrderedDict
+            vectors are packed with a cached ArrayLayout of self
+        """
+        if output == 'vector':
+            M = self.array_layout().pack(self)
+            if M is None:
+                M = self.array_layout(rebuild=True).pack(self)
+            if M is not None:
+                return M
+        return OrderedDict.pack_array(self,output)
+    
+    def unpack_array(self,M):
+        """ OrderedDict.unpack_array(array), see OrderedDict
+            vectors are unpacked with a cached ArrayLayout of self
+        """
+        if np.ndim(M) == 1:
+            if self.array_layout().unpack(self,M) is not None:
+                return self
+            if self.array_layout(rebuild=True).unpack(self,M) is not None:
+                return self
+        return OrderedDict.unpack_array(self,M)
     
+    def array_layout(self,rebuild=False):
+        """ the ArrayLayout of the vector packing of self, made the first 
+            time it is needed and kept in a hidden item. the pack and unpack 
+            of the layout check that it still holds.
+        """
+        layout = dict.get(self,'_layout')
+        if layout is None or rebuild:
+            layout = ArrayLayout(self)
+            dict.__setitem__(self,'_layout',layout)
+        return layout
+
+
 # for rebuilding dictionaries with attributes
 def _reconstructor(klass,items):
     self = OrderedBunch.__new__(klass)
     OrderedBunch.__init__(self,items)
     return self
+
+
+# values that are not copied
+_atomic_types = ( type(None), bool, int, long, float, complex, str, unicode,
+                  type, type(len), type(_reconstructor) )
+
+def deep_copy(value,memo):
+    """ a deep copy of value, like copy.deepcopy(value,memo) but without
+        rebuilding each OrderedBunch through __new__ and __init__.
+        
+        The attributes and the hidden items (key order, properties) of an 
+        OrderedBunch are copied directly into a bare instance of its class. 
+        Numeric arrays, lists and dicts are copied here, anything else 
+        goes to copy.deepcopy. Subclasses of OrderedBunch that 
+        override __deepcopy__ are copied with it, see copy_bunch().
+    """
+    
+    t = type(value)
+    
+    if t in _atomic_types:
+        return value
+    
+    i = id(value)
+    if i in memo:
+        return memo[i]
+    
+    if isinstance(value,OrderedBunch):
+        # subclasses may extend the copy
+        if t.__deepcopy__.im_func is not _bunch_deepcopy:
+            return t.__deepcopy__(value,memo)
+        result = copy_bunch(value,memo)
+            
+    elif t is np.ndarray and value.dtype.hasobject is False:
+        result = value.copy(order='K')
+        memo[i] = result
+        
+    elif t is list:
+        result = []
+        memo[i] = result
+        result.extend([ deep_copy(v,memo) for v in value ])
+        
+    elif t is dict:
+        result = {}
+        memo[i] = result
+        for k,v in value.iteritems():
+            result[deep_copy(k,memo)] = deep_copy(v,memo)
+            
+    else:
+        result = deepcopy(value,memo)
+        
+    return result
+
+def copy_bunch(value,memo):
+    """ the deep copy of an OrderedBunch by deep_copy(), for subclasses 
+        that extend __deepcopy__ 
+    """
+    result = dict.__new__(type(value))
+    memo[id(value)] = result
+    for k,v in dict.iteritems(value):
+        dict.__setitem__(result,k,deep_copy(v,memo))
+    items = result.__dict__
+    for k,v in value.__dict__.iteritems():
+        items[k] = deep_copy(v,memo)
+    return result
+
+_bunch_deepcopy = OrderedBunch.__deepcopy__.im_func
         
         
 
@@ -2,6 +2,7 @@
 #
 # Created:  Aug 2015, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2016, SUAVE Team
 
 from make_hashable import make_hashable
 
@@ -17,6 +18,7 @@ from Bunch          import Bunch
 from OrderedBunch   import OrderedBunch
 from IndexableBunch import IndexableBunch
 from Property       import Property
+from ArrayLayout    import ArrayLayout
 
 from DataBunch       import DataBunch
 from DiffedDataBunch import DiffedDataBunch
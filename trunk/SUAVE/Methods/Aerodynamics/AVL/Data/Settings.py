@@ -2,6 +2,7 @@
 # 
 # Created:  Dec 2014, T. Momose
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -25,6 +26,12 @@ class Settings(Data):
 		
 		self.num_control_surfaces = 0
 		
+		# avl processes run at once, each on its share of the cases of a batch
+		self.number_of_workers = 1
+		
+		# keep one avl process open between batches
+		self.persistent_session = False
+		
 		self.discretization.defaults = Data()
 		self.discretization.surfaces = Data()
 		self.discretization.defaults.wing = AVL_Discretization_Settings()
@@ -43,6 +50,8 @@ class Settings(Data):
 		self.filenames.case_template   = 'case_{0:03d}_{1:02d}'
 		self.filenames.log_filename    = 'avl_log.txt'
 		self.filenames.err_filename    = 'avl_err.txt'
+		self.filenames.worker_template = 'worker_{0:02d}' # folders in the run folder, for more than one worker
+		self.filenames.session_template = 'session_{0:03d}' # case tags of the reused result files of a persistent session
 		
 		#------------------------------------------
 		# 1:  Symmetry about the plane
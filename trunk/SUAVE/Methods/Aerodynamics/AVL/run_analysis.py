@@ -2,12 +2,14 @@
 # 
 # Created:  Oct 2014, T. Momose
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import os
+import sys
 from SUAVE.Methods.Aerodynamics.AVL.read_results import read_results
 from SUAVE.Methods.Aerodynamics.AVL.purge_files  import purge_files
 from SUAVE.Core import redirect
@@ -23,36 +25,69 @@ def run_analysis(avl_object):
 
 def call_avl(avl_object):
 
-    import sys
+    avl_run = start_avl(avl_object)
+    exit_status = finish_avl(avl_run)
+
+    return exit_status
+
+
+def start_avl(avl_object):
+    """ launches avl on the current input deck, in the current folder,
+        and returns without waiting for it to finish. 
+        
+        Outputs:
+            avl_run - the running process, with its log files attached,
+                      to be passed to finish_avl()
+    """
+
     import time
     import subprocess
 
     log_file = avl_object.settings.filenames.log_filename
     err_file = avl_object.settings.filenames.err_filename
     if isinstance(log_file,str):
-        purge_files(log_file)
+        purge_files([log_file])
+        log_file = open(log_file,'a')
     if isinstance(err_file,str):
-        purge_files(err_file)
+        purge_files([err_file])
+        err_file = open(err_file,'a')
+    log_file = log_file or sys.stdout
+    err_file = err_file or sys.stderr
     avl_call = avl_object.settings.filenames.avl_bin_name
     geometry = avl_object.settings.filenames.features
     in_deck  = avl_object.current_status.deck_file
 
-    with redirect.output(log_file,err_file):
+    ctime = time.ctime() # Current date and time stamp
+    log_file.write("Log File of System stdout from AVL Run \n{}\n\n".format(ctime))
+    err_file.write("Log File of System stderr from AVL Run \n{}\n\n".format(ctime))
+    log_file.flush()
+    err_file.flush()
 
-        ctime = time.ctime() # Current date and time stamp
-        sys.stdout.write("Log File of System stdout from AVL Run \n{}\n\n".format(ctime))
-        sys.stderr.write("Log File of System stderr from AVL Run \n{}\n\n".format(ctime))
+    with open(in_deck,'r') as commands:
+        avl_run = subprocess.Popen([avl_call,geometry],stdout=log_file,stderr=err_file,stdin=subprocess.PIPE)
+        for line in commands:
+            avl_run.stdin.write(line)
+    avl_run.stdin.close()
 
-        with open(in_deck,'r') as commands:
-            avl_run = subprocess.Popen([avl_call,geometry],stdout=sys.stdout,stderr=sys.stderr,stdin=subprocess.PIPE)
-            for line in commands:
-                avl_run.stdin.write(line)
-        avl_run.wait()
+    avl_run.log_file = log_file
+    avl_run.err_file = err_file
 
-        exit_status = avl_run.returncode
-        ctime = time.ctime()
-        sys.stdout.write("\nProcess finished: {0}\nExit status: {1}\n".format(ctime,exit_status))
-        sys.stderr.write("\nProcess finished: {0}\nExit status: {1}\n".format(ctime,exit_status))        
+    return avl_run
+
+
+def finish_avl(avl_run):
+    """ waits for an avl process from start_avl() and closes its log files """
+
+    import time
+
+    avl_run.wait()
+
+    exit_status = avl_run.returncode
+    ctime = time.ctime()
+    for stream in [avl_run.log_file,avl_run.err_file]:
+        stream.write("\nProcess finished: {0}\nExit status: {1}\n".format(ctime,exit_status))
+        if stream not in [sys.stdout,sys.stderr]:
+            stream.close()
 
     return exit_status
 
@@ -0,0 +1,186 @@
+# run_session.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import time
+import subprocess
+
+from SUAVE.Methods.Aerodynamics.AVL.read_results     import read_results
+from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import make_case_command
+
+
+# ----------------------------------------------------------------------
+#  AVL Session
+# ----------------------------------------------------------------------
+
+class AVL_Session(object):
+    """ SUAVE.Methods.Aerodynamics.AVL.AVL_Session()
+        one avl process kept open between batches of run cases
+
+        usage:
+            session = AVL_Session()
+            session.load(avl_object,geometry_hash)  # in the run folder
+            results = session.run(avl_object)      # current_status.cases
+            session.close()
+
+        Commands are written to the stdin of avl as they would be typed.
+        After each top level command, the session waits for the top level
+        prompt of avl on its stdout, so the result files of a batch are
+        complete once run() returns. Everything avl prints goes to the
+        log file of the settings.
+
+        Assumptions:
+            The process is started in the folder current when load() is
+            first called, and the files named later are relative to it.
+            Copies of a session, and sessions loaded from a pickle, are not
+            started, they start their own process when loaded.
+    """
+
+    prompt = 'AVL   c>'
+
+    def __init__(self):
+        self.process       = None
+        self.geometry_hash = None
+        self.log_file      = None
+        self.err_file      = None
+
+    def __deepcopy__(self,memo):
+        return AVL_Session()
+
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self,state):
+        self.__init__()
+
+    def __del__(self):
+        self.close()
+
+    def is_running(self):
+        """ True if the avl process is alive """
+        return self.process is not None and self.process.poll() is None
+
+    def load(self,avl_object,geometry_hash):
+        """ starts avl on the geometry file, or loads the geometry file into
+            the running avl if geometry_hash changed since the last load.
+            the geometry file must already be written.
+        """
+
+        geometry = avl_object.settings.filenames.features
+
+        if not self.is_running():
+            self.start(avl_object)
+        elif geometry_hash != self.geometry_hash:
+            self.command('LOAD {}\n'.format(geometry))
+
+        self.geometry_hash = geometry_hash
+
+        return
+
+    def start(self,avl_object):
+        """ starts the avl process on the geometry file """
+
+        self.close()
+
+        filenames = avl_object.settings.filenames
+
+        self.log_file = open(filenames.log_filename,'w')
+        self.err_file = open(filenames.err_filename,'w')
+
+        ctime = time.ctime()
+        self.log_file.write("Log File of System stdout from AVL Session \n{}\n\n".format(ctime))
+        self.err_file.write("Log File of System stderr from AVL Session \n{}\n\n".format(ctime))
+        self.log_file.flush()
+        self.err_file.flush()
+
+        self.process = subprocess.Popen([filenames.avl_bin_name,filenames.features],
+                                        stdin=subprocess.PIPE,stdout=subprocess.PIPE,stderr=self.err_file)
+        self.geometry_hash = None
+
+        # the geometry is loaded once avl asks for a command
+        self.wait()
+
+        return
+
+    def run(self,avl_object):
+        """ runs the cases of avl_object.current_status from its batch
+            file, and reads back the results
+        """
+
+        batch = avl_object.current_status.batch_file
+
+        self.command('CASE {}\n'.format(batch))
+
+        commands = ['OPER\n']
+        for case in avl_object.current_status.cases:
+            commands.append(make_case_command(avl_object,case))
+        commands.append('\n') # back to the top level
+
+        self.command(''.join(commands))
+
+        return read_results(avl_object)
+
+    def command(self,text):
+        """ sends text to avl and waits for the top level prompt """
+
+        if not self.is_running():
+            raise IOError , 'avl session is not running'
+
+        self.process.stdin.write(text)
+        self.process.stdin.flush()
+
+        self.wait()
+
+        return
+
+    def wait(self):
+        """ reads the avl output up to the next top level prompt """
+
+        stdout = self.process.stdout.fileno()
+        output = ''
+
+        while self.prompt not in output:
+            chunk = os.read(stdout,4096)
+            if not chunk:
+                self.log_file.write(output)
+                exit_status = self.process.wait()
+                self.close()
+                raise IOError , 'avl session ended, exit status {}'.format(exit_status)
+            output = output + chunk
+
+        self.log_file.write(output)
+        self.log_file.flush()
+
+        return
+
+    def close(self):
+        """ quits avl and closes the log files """
+
+        process = self.process
+        self.process       = None
+        self.geometry_hash = None
+
+        if process is not None:
+            if process.poll() is None:
+                try:
+                    process.stdin.write('\nQUIT\n')
+                    process.stdin.close()
+                except IOError:
+                    pass
+            output = process.stdout.read()
+            if self.log_file is not None and not self.log_file.closed:
+                self.log_file.write(output)
+            process.stdout.close()
+            process.wait()
+
+        for stream in [self.log_file,self.err_file]:
+            if stream is not None and not stream.closed:
+                stream.close()
+
+        return
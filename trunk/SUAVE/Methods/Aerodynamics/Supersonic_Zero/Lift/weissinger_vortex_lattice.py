@@ -1,7 +1,8 @@
 # weissinger_vortex_lattice.py
-# 
+#
 # Created:  Dec 2013, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -9,6 +10,7 @@
 
 # package imports
 import numpy as np
+import scipy.linalg
 
 # ----------------------------------------------------------------------
 #  Weissinger Vortex Lattice
@@ -21,11 +23,16 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
         Inputs:
             wing - geometry dictionary with fields:
                 Sref - reference area
+            conditions.aerodynamics.angle_of_attack - a scalar, or an array
+                of angles of attack solved together
 
         Outputs:
+            Cl, Cd - same shape as the angle of attack
 
         Assumptions:
-        
+            The influence matrix is built and factored once per call,
+            all angles of attack are solved as columns of the right hand side.
+
     """
 
     #unpack
@@ -46,148 +53,93 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
 
     # conditions
     aoa = conditions.aerodynamics.angle_of_attack
-    
+
+    if orientation != False :
+        return 0.0 * aoa, 0.0 * aoa
+
+    shape = np.shape(aoa)
+    aoa   = np.reshape(aoa,[1,-1])
+
     # chord difference
     dchord=(root_chord-tip_chord)
     if sym_para is True :
         span=span/2
     deltax=span/n
 
-    if orientation == False :
-
-        section_length = np.empty(n)
-        area_section   = np.empty(n)
-        sl             = np.empty(n)
-        xpos           = np.empty(n)
-        ya             = np.empty(n)
-        yb             = np.empty(n)
-        xa             = np.empty(n)
-        yab            = np.empty(n)
-        ybb            = np.empty(n)
-        y2             = np.empty(n)   
-        x              = np.empty(n)
-        y              = np.empty(n)
-        twist_distri   = np.empty(n)
-        xloc_leading   = np.empty(n)
-        xloc_trailing  = np.empty(n)  
-        RHS            = np.empty([n,1])
-        w              = np.empty([n,n])
-        wb             = np.empty([n,n])
-        A              = np.empty([n,n])
-        L              = np.empty(n)
-        T              = np.empty(n)
-        A_v            = np.empty([n,n])
-        v              = np.empty(n)
-        Lfi            = np.empty(n)
-        Lfk            = np.empty(n)
-        Lft            = np.empty(n)
-        Dg             = np.empty(n)   
-        D              = np.empty(n)    
-    
-        # discretizing the wing sections into panels
-        for i in xrange(n):
-    
-            section_length[i] = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
-            area_section[i]   = section_length[i]*deltax
-            sl[i]             = section_length[i]
-            twist_distri[i]   = twist_rc + i/float(n)*(twist_tc-twist_rc)
-            xpos[i]           = (i)*deltax
-    
-            ya[i] = (i)*deltax
-            yb[i] = (i+1)*deltax
-            xa[i] = ((i+1)*deltax-deltax/2)*np.tan(sweep)+ 0.25*sl[i]
-    
-            x[i] = ((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*sl[i]
-            y[i] = ((i+1)*deltax-deltax/2)
-            
-            xloc_leading[i]  = ((i+1)*deltax)*np.tan(sweep)
-            xloc_trailing[i] = ((i+1)*deltax)*np.tan(sweep)+sl[i]
-    
-    
-        # Influence coefficient computation
-        for i in xrange(n):
-    
-            RHS[i,0] = np.sin(twist_distri[i]+aoa)
-    
-            for j in range(0,n):
-    
-                yad = y[i]-ya[j]
-                xd  = x[i]-xa[j]
-                ybd = y[i]-yb[j]
-    
-                yadd = y[i]-yab[j]
-                ybdd = y[i]-ybb[j]
-    
-                A[i,j] = whav(x[i],y[i],xa[j],ya[j])-whav(x[i],y[i],xa[j],yb[j])\
-                    -whav(x[i],y[i],xa[j],-ya[j])+whav(x[i],y[i],xa[j],-yb[j])
-                A[i,j] = A[i,j]*0.25/np.pi
-    
-        # Vortex strength computation by matrix inversion
-        T = np.linalg.solve(A,RHS)
-        
-        # Calculating the effective velocty 
-        for i in xrange(n):
-            v[i] = 0.0      
-            for j in range(0,n):
-    
-                A_v[i,j] = whav(xa[i],y[i],xa[j],ya[j])-whav(xa[i],y[i],xa[j],yb[j])\
-                    -whav(xa[i],y[i],xa[j],-ya[j])+whav(xa[i],y[i],xa[j],-yb[j])
-                
-                A_v[i,j] = A[i,j]*0.25/np.pi*T[j]
-                v[i]     = v[i]+A_v[i,j]
-            
-            Lfi[i] = -T[i]*(np.sin(twist_tc)-v[i])
-            Lfk[i] = T[i]*np.cos(twist_tc)        
-    
-            Lft[i] = (-Lfi[i]*np.sin(twist_tc)+Lfk[i]*np.cos(twist_tc))
-            Dg[i]  = (Lfi[i]*np.cos(twist_tc)+Lfk[i]*np.sin(twist_tc))
-    
-        # Lift computation from elements
-        LT    = 0.0
-        DT    = 0.0
-        arsec =0.0
-    
-        for i in xrange(n):
-    
-            L[i] = deltax*Lft[i] 
-            D[i] = deltax*Dg[i]    
-    
-            LT = LT+L[i]
-            DT = DT+D[i]
-    
-            arsec=arsec+area_section[i] 
-    
-        Cl = 2*LT/(0.5*Sref)
-        Cd = 2*DT/(0.5*Sref)     
-    
-    else:
-        
-        Cl = 0.0
-        Cd = 0.0         
-
-    return Cl, Cd
+    # discretizing the wing sections into panels
+    i = np.arange(n)
+
+    section_length = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
+    twist_distri   = twist_rc + i/float(n)*(twist_tc-twist_rc)
+
+    ya = (i)*deltax
+    yb = (i+1)*deltax
+    xa = ((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.25*section_length
+
+    x  = ((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length
+    y  = ((i+1)*deltax-deltax/2)
+
+    # Influence coefficient computation, control points down the rows
+    xi = x[:,None]
+    yi = y[:,None]
+    xj = xa[None,:]
+
+    A = whav(xi,yi,xj,ya[None,:]) - whav(xi,yi,xj,yb[None,:]) \
+      - whav(xi,yi,xj,-ya[None,:]) + whav(xi,yi,xj,-yb[None,:])
+    A = A*0.25/np.pi
+
+    # one angle of attack per column
+    RHS = np.sin(twist_distri[:,None] + aoa)
+
+    # Vortex strength computation by lu factorization
+    T = scipy.linalg.lu_solve(scipy.linalg.lu_factor(A),RHS)
+
+    # Calculating the effective velocty
+    v = np.dot(A*0.25/np.pi,T)
+
+    Lfi = -T*(np.sin(twist_tc)-v)
+    Lfk = T*np.cos(twist_tc)
+
+    Lft = (-Lfi*np.sin(twist_tc)+Lfk*np.cos(twist_tc))
+    Dg  = (Lfi*np.cos(twist_tc)+Lfk*np.sin(twist_tc))
+
+    # Lift computation from elements
+    LT = np.sum(deltax*Lft,axis=0)
+    DT = np.sum(deltax*Dg ,axis=0)
+
+    Cl = 2*LT/(0.5*Sref)
+    Cd = 2*DT/(0.5*Sref)
+
+    # back to the shape of the angle of attack
+    if shape == ():
+        return Cl[0], Cd[0]
+
+    return np.reshape(Cl,shape), np.reshape(Cd,shape)
 
 # ----------------------------------------------------------------------
 #   Helper Functions
 # ----------------------------------------------------------------------
 def whav(x1,y1,x2,y2):
-    """ Helper function of vortex lattice method      
+    """ Helper function of vortex lattice method
         Inputs:
             x1,x2 -x coordinates of bound vortex
             y1,y2 -y coordinates of bound vortex
+            any shapes that broadcast together
 
-        Sref - reference area for non dimensionalization
         Outpus:
-            Cl_comp - lift coefficient
-            Cd_comp - drag  coefficient       
+            whv - induced velocity factor, broadcast shape of the inputs
 
         Assumptions:
             if needed
 
-    """  
-    if x1==x2:
-        whv=1/(y1-y2)
-    else:  
-        whv=1/(y1-y2)*(1+ (np.sqrt((x1-x2)**2+(y1-y2)**2)/(x1-x2)))
+    """
+    dx = x1-x2
+    dy = y1-y2
+
+    # guard the division where the points are aligned
+    same_x  = (dx == 0.)
+    dx_safe = np.where(same_x,1.,dx)
+
+    whv = np.where(same_x, 1/dy, 1/dy*(1+ (np.sqrt(dx**2+dy**2)/dx_safe)))
 
-    return whv
\ No newline at end of file
+    return whv
@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -69,6 +70,16 @@ def update_atmosphere(segment,state):
     conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
     
     return
+
+# for incremental evaluation, see SUAVE.Analyses.Process
+update_atmosphere.reads  = ['state.conditions.freestream.altitude',
+                            'segment.temperature_deviation',
+                            'segment.analyses.atmosphere']
+update_atmosphere.writes = ['state.conditions.freestream.pressure',
+                            'state.conditions.freestream.temperature',
+                            'state.conditions.freestream.density',
+                            'state.conditions.freestream.speed_of_sound',
+                            'state.conditions.freestream.dynamic_viscosity']
     
     
 # ----------------------------------------------------------------------
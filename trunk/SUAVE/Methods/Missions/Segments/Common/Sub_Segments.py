@@ -2,12 +2,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
-
-# ----------------------------------------------------------------------
-#  Imports
-# ----------------------------------------------------------------------
-
-from copy import deepcopy
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
@@ -16,15 +11,22 @@ from copy import deepcopy
 def expand_sub_segments(segment,state):
     
     from SUAVE.Analyses import Process
+    from SUAVE.Analyses.Mission.Warm_Start import apply_unknowns
     
     last_tag = None
     
+    # converged unknowns from a nearby solution
+    warm_start = segment.get('warm_start',None)
+    solution   = None
+    if warm_start and warm_start.enabled:
+        solution = warm_start.lookup(segment)
+    
     for tag,sub_segment in segment.segments.items():
         
         if Process.verbose:
             print 'segment start :' , tag
         
-        sub_state = deepcopy( sub_segment.state )
+        sub_state = sub_segment.state.instantiate()
         
         if last_tag:
             sub_state.initials = state.segments[last_tag]
@@ -32,6 +34,9 @@ def expand_sub_segments(segment,state):
         
         sub_segment.initialize(sub_state)
         
+        if solution and solution.has_key(tag):
+            apply_unknowns(sub_state.unknowns,solution[tag])
+        
         state.segments[tag]     = sub_state
         state.unknowns[tag]     = sub_state.unknowns
         state.conditions[tag]   = sub_state.conditions
@@ -62,6 +67,11 @@ def finalize_sub_segments(segment,state):
     for tag,sub_segment in segment.segments.items():
         sub_segment.finalize(state.segments[tag])
         state.segments[tag].initials = Conditions()
+        
+    # keep the converged unknowns
+    warm_start = segment.get('warm_start',None)
+    if warm_start and warm_start.enabled:
+        warm_start.store(segment,state)
 
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
@@ -0,0 +1,325 @@
+# Newton_Root.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy.linalg
+
+from SUAVE.Core import Data
+
+from converge_root import difference_steps
+
+# ----------------------------------------------------------------------
+#  Newton Root
+# ----------------------------------------------------------------------
+
+class Newton_Root(Data):
+    """ SUAVE.Methods.Missions.Segments.Newton_Root()
+        a quasi-newton root finder for mission segments, a drop in
+        replacement for scipy.optimize.fsolve in converge_root
+
+        usage:
+            segment.settings.root_finder = Newton_Root()
+
+        The jacobian is factorized once and reused, both across iterations
+        and across repeated evaluations of the same segment object. Each
+        accepted step applies a Broyden rank-one correction (or none, for a
+        chord iteration). The jacobian is only recomputed when the residual
+        stops dropping, or after maximum_updates corrections.
+
+        Attributes:
+            jacobian_update    - 'broyden' or 'chord'
+            reuse_jacobian     - keep the jacobian between evaluations
+            maximum_iterations - iteration limit per solve
+            maximum_updates    - rank-one corrections before a refresh
+            stall_ratio        - refresh the jacobian when the residual
+                                 norm drops by less than this ratio
+            residual_tolerance - residual norm that counts as converged,
+                                 otherwise an accepted step within xtol
+            verbose            - print the residual norm per iteration
+            history            - Data() per segment tag of
+                                   iterations, function_evaluations,
+                                   jacobian_evaluations, residual_norms,
+                                   converged and sub segment residual
+                                   norms
+    """
+
+    def __defaults__(self):
+        self.tag = 'newton_root'
+
+        self.jacobian_update    = 'broyden'
+        self.reuse_jacobian     = True
+        self.maximum_iterations = 100
+        self.maximum_updates    = 30
+        self.stall_ratio        = 0.5
+        self.residual_tolerance = 1e-8
+        self.verbose            = False
+
+        self.history = Data()
+        self._jacobians = Data()
+
+    def __call__(self,func,x0,args=(),xtol=1.49012e-08,fprime=None):
+        """ Newton_Root.__call__(func,x0,args=(),xtol=1.49012e-08,fprime=None)
+            same calling convention as scipy.optimize.fsolve
+
+            Inputs:
+                func   - residual function, func(x,*args)
+                x0     - initial unknowns
+                args   - converge_root passes [segment,state]
+                xtol   - relative change in x that counts as converged
+                fprime - optional jacobian function, fprime(x,*args)
+
+            Outputs:
+                x      - the converged unknowns, the state is left
+                         evaluated at x
+        """
+
+        if not isinstance(args,tuple): args = (args,)
+
+        key     = self.cache_key(args)
+        segment = cached_segment(args)
+
+        # the residual function, counted
+        counts = Data()
+        counts.function_evaluations = 0
+        counts.jacobian_evaluations = 0
+
+        def residuals(x):
+            counts.function_evaluations += 1
+            return np.asarray(func(x,*args),dtype=float)
+
+        def refresh(x,f):
+            counts.jacobian_evaluations += 1
+            if fprime is None:
+                J = jacobian_finite_difference(residuals,x,f)
+            else:
+                J = np.atleast_2d(fprime(x,*args))
+            return Jacobian(J)
+
+        # start
+        x = np.array(x0,dtype=float)
+        f = residuals(x)
+        norms = [np.linalg.norm(f)]
+
+        jacobian = None
+        if self.reuse_jacobian and self._jacobians.has_key(key):
+            jacobian = self._jacobians[key]
+            # only the same segment, another one may share its tag
+            if jacobian.segment is not segment or jacobian.size != len(x) or len(f) != len(x):
+                jacobian = None
+
+        at_x      = True  # the last evaluation was at x
+        converged = norms[0] <= self.residual_tolerance
+        fresh     = False
+        iteration = 0
+
+        while not converged and iteration < self.maximum_iterations:
+
+            # a new jacobian
+            if jacobian is None:
+                jacobian = refresh(x,f)
+                fresh = True
+
+            iteration += 1
+
+            step = newton_step(residuals,jacobian,x,f,norms[-1],xtol,fresh,
+                               broyden            = self.jacobian_update == 'broyden',
+                               maximum_updates    = self.maximum_updates,
+                               stall_ratio        = self.stall_ratio,
+                               residual_tolerance = self.residual_tolerance)
+
+            at_x = step.accepted
+            if step.accepted:
+                x = step.x
+                f = step.f
+                norms.append(step.norm)
+
+            if self.verbose:
+                print '%s iteration %i : residual norm %.6e' % (key,iteration,norms[-1])
+
+            converged = step.converged
+            if converged or step.failed: break
+
+            # stalled, rebuild the jacobian
+            if step.refresh:
+                jacobian = None
+            fresh = False
+
+        # leave the state evaluated at the solution
+        if not at_x:
+            f = residuals(x)
+
+        if self.reuse_jacobian and jacobian is not None:
+            jacobian.segment = segment
+            self._jacobians[key] = jacobian
+
+        if not converged:
+            print "Warning: Newton_Root did not converge %s, residual norm %.6e after %i iterations" % (key,norms[-1],iteration)
+
+        # report
+        history = Data()
+        history.iterations           = iteration
+        history.function_evaluations = counts.function_evaluations
+        history.jacobian_evaluations = counts.jacobian_evaluations
+        history.residual_norms       = np.array(norms)
+        history.converged            = bool(converged)
+        history.segments             = segment_residual_norms(args)
+        self.history[key] = history
+
+        return x
+
+    def cache_key(self,args):
+        """ jacobians and history are stored by the segment tag """
+        try:
+            return args[0][0].tag
+        except (AttributeError,IndexError,KeyError,TypeError):
+            return 'segment'
+
+    def reset(self):
+        """ forget the stored jacobians """
+        self._jacobians = Data()
+
+
+# ----------------------------------------------------------------------
+#  Jacobian
+# ----------------------------------------------------------------------
+
+class Jacobian(object):
+    """ an lu factored jacobian with a list of rank-one corrections to its inverse,
+        H_k = (I + u_k s_k') ... (I + u_1 s_1') inv(J)
+    """
+
+    def __init__(self,J):
+        self.size    = J.shape[1]
+        self.lu      = scipy.linalg.lu_factor(J)
+        self.u       = []
+        self.s       = []
+        self.segment = None  # the segment it was built for
+
+    @property
+    def updates(self):
+        return len(self.s)
+
+    def solve(self,f):
+        z = scipy.linalg.lu_solve(self.lu,f)
+        for u,s in zip(self.u,self.s):
+            z = z + u * np.dot(s,z)
+        return z
+
+    def broyden(self,dx,df):
+        """ good broyden update of the inverse jacobian """
+        Hdf   = self.solve(df)
+        denom = np.dot(dx,Hdf)
+        if denom == 0. or not np.isfinite(denom): return
+        self.u.append( (dx - Hdf) / denom )
+        self.s.append( dx.copy() )
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def newton_step(residuals,jacobian,x,f,norm,xtol,fresh,broyden=True,
+                maximum_updates=30,stall_ratio=0.5,residual_tolerance=1e-8):
+    """ one quasi-newton step from x, f = residuals(x) with norm |f|,
+        backtracking on overshoot. Newton_Root and converge_batch both
+        iterate with it.
+
+        Inputs:
+            jacobian - Jacobian() at x, given a Broyden update if the
+                       step is accepted and broyden is True
+            fresh    - the jacobian was just computed
+
+        Outputs:
+            step - Data() of
+                     x, f, norm - where the step ended, only taken if
+                                  accepted
+                     accepted   - the residual norm dropped
+                     converged  - an accepted step within xtol, or a
+                                  residual norm within residual_tolerance
+                     failed     - no progress on a fresh jacobian
+                     refresh    - stalled, the jacobian should be rebuilt
+    """
+
+    # newton step
+    dx = -jacobian.solve(f)
+    step_norm = np.linalg.norm(dx)
+    x_new = x + dx
+    f_new = residuals(x_new)
+    norm_new = np.linalg.norm(f_new)
+
+    # backtrack on overshoot
+    for i in range(4):
+        if norm_new < norm: break
+        dx    = dx / 2.
+        x_new = x + dx
+        f_new = residuals(x_new)
+        norm_new = np.linalg.norm(f_new)
+
+    step = Data()
+    step.x        = x_new
+    step.f        = f_new
+    step.norm     = norm_new
+    step.accepted = norm_new < norm
+
+    norm_end = norm_new if step.accepted else norm
+
+    # accept
+    if step.accepted and broyden and jacobian.updates < maximum_updates:
+        jacobian.broyden(dx,f_new-f)
+
+    # a small newton step only counts once the residual drops with it
+    step.converged = bool( ( step.accepted and step_norm <= xtol * (np.linalg.norm(x_new) + xtol) ) or \
+                           norm_end <= residual_tolerance )
+
+    # stalled, rebuild the jacobian
+    stalled = not step.accepted or norm_new > stall_ratio * norm or \
+              jacobian.updates >= maximum_updates
+    step.failed  = not step.converged and stalled and fresh and not step.accepted
+    step.refresh = not step.converged and stalled and not fresh
+
+    return step
+
+
+def jacobian_finite_difference(residuals,x,f):
+    """ forward difference jacobian of residuals(x), f = residuals(x) """
+
+    steps = difference_steps(x)
+    J = np.zeros([len(f),len(x)])
+
+    for j in xrange(len(x)):
+        xj = x.copy()
+        xj[j] += steps[j]
+        J[:,j] = ( residuals(xj) - f ) / steps[j]
+
+    return J
+
+
+def cached_segment(args):
+    """ the segment being solved, the stored jacobians belong to it """
+    try:
+        return args[0][0]
+    except (IndexError,KeyError,TypeError):
+        return None
+
+
+def segment_residual_norms(args):
+    """ the final residual norm of each sub segment, if any """
+
+    norms = Data()
+
+    try:
+        segment,state = args[0]
+        sub_states = state.segments
+    except (AttributeError,KeyError,TypeError,ValueError):
+        return norms
+
+    for tag,sub_state in sub_states.items():
+        norms[tag] = np.linalg.norm(sub_state.residuals.pack_array())
+
+    return norms
@@ -1,6 +1,8 @@
 
 from converge_root import converge_root
+from Newton_Root   import Newton_Root
 from expand_state  import expand_state
+from evaluate_batch import evaluate_batch
 
 import Common
 import Cruise
@@ -10,6 +10,9 @@
 # Scipy
 import scipy
 import scipy.optimize
+import numpy as np
+
+from copy import deepcopy
 
 from SUAVE.Core.Arrays import array_type
 
@@ -26,10 +29,23 @@ def converge_root(segment,state):
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
-    unknowns = root_finder( iterate,
-                            unknowns,
-                            args = [segment,state],
-                            xtol = state.numerics.tolerance_solution)
+    # pick the jacobian evaluation
+    jacobian = get_jacobian_function(state)
+
+    if jacobian is None:
+        unknowns = root_finder( iterate,
+                                unknowns,
+                                args = [segment,state],
+                                xtol = state.numerics.tolerance_solution)
+    else:
+        unknowns = root_finder( iterate,
+                                unknowns,
+                                args   = [segment,state],
+                                xtol   = state.numerics.tolerance_solution,
+                                fprime = jacobian)
+
+        # the last evaluation may have been a jacobian column
+        iterate(unknowns,[segment,state])
     
     return
     
@@ -50,3 +66,203 @@ def iterate(unknowns,(segment,state)):
         
     return residuals 
 
+
+def get_jacobian_function(state):
+    """ get_jacobian_function(state)
+        selects the jacobian evaluation from state.numerics.solver_jacobian
+
+        Inputs:
+            state.numerics.solver_jacobian -
+                "none"         - no jacobian, the root finder differences on its own
+                "block_sparse" - segment block structured finite differences
+                "function"     - user supplied, state.numerics.jacobian_evaluation
+
+        Outputs:
+            a function of (unknowns,(segment,state)), or None
+    """
+
+    method = state.numerics.get('solver_jacobian','none')
+
+    if method in ('none',None):
+        return None
+    elif method == 'block_sparse':
+        return jacobian_block_sparse
+    elif method == 'function':
+        return jacobian_function
+    else:
+        raise ValueError , 'unknown solver_jacobian "%s"' % method
+
+
+def jacobian_function(unknowns,(segment,state)):
+    """ jacobian_function(unknowns,(segment,state))
+        updates the state to the unknowns and calls the user supplied
+        analytic jacobian, state.numerics.jacobian_evaluation(segment,state)
+    """
+
+    iterate(unknowns,(segment,state))
+
+    jacobian = state.numerics.jacobian_evaluation(segment,state)
+
+    return np.atleast_2d(jacobian)
+
+
+def jacobian_finite_difference(unknowns,(segment,state)):
+    """ jacobian_finite_difference(unknowns,(segment,state))
+        dense forward difference jacobian, one full iteration per unknown
+    """
+
+    unknowns = np.array(unknowns,dtype=float)
+
+    residuals = iterate(unknowns,(segment,state))
+
+    steps = difference_steps(unknowns)
+
+    jacobian = np.zeros([len(residuals),len(unknowns)])
+
+    for j in xrange(len(unknowns)):
+        x = unknowns.copy()
+        x[j] += steps[j]
+        jacobian[:,j] = ( iterate(x,(segment,state)) - residuals ) / steps[j]
+
+    # restore the state at the unknowns
+    iterate(unknowns,(segment,state))
+
+    return jacobian
+
+
+def jacobian_block_sparse(unknowns,(segment,state)):
+    """ jacobian_block_sparse(unknowns,(segment,state))
+        block structured finite difference jacobian for containers of segments
+
+        Assumptions:
+            The unknowns and residuals of a segment only couple to that segment
+            and to its successor, through the initials. Longer range coupling
+            (ie. the vehicle mass carried through several segments) is left
+            for the root finder's own jacobian updates.
+
+            Column j of every segment is perturbed in the same sweep, so
+            the cost is two sweeps over the segments per unknown of the
+            largest segment, rather than one full iteration per unknown.
+
+            If the state is not a container of segments, or it has unknowns
+            or residuals of its own, this falls back to dense differencing.
+
+            Sub segments may supply the analytic diagonal block through
+            numerics.solver_jacobian = "function".
+    """
+
+    unknowns = np.array(unknowns,dtype=float)
+
+    # baseline
+    residuals = iterate(unknowns,(segment,state))
+
+    # check the block structure
+    if not state.has_key('segments') or not state.segments:
+        return jacobian_finite_difference(unknowns,(segment,state))
+
+    tags = state.segments.keys()
+
+    unknown_keys  = [ k for k in state.unknowns.keys()  if k != 'tag' ]
+    residual_keys = [ k for k in state.residuals.keys() if k != 'tag' ]
+
+    if unknown_keys != tags or residual_keys != tags:
+        return jacobian_finite_difference(unknowns,(segment,state))
+
+    sub_segments = [ segment.segments[tag] for tag in tags ]
+    sub_states   = [ state.segments[tag]   for tag in tags ]
+
+    # block sizes and offsets
+    x_blocks = [ sub_state.unknowns.pack_array()  for sub_state in sub_states ]
+    r_blocks = [ sub_state.residuals.pack_array() for sub_state in sub_states ]
+
+    x_offsets = np.cumsum([0] + [ len(x) for x in x_blocks ])
+    r_offsets = np.cumsum([0] + [ len(r) for r in r_blocks ])
+
+    if x_offsets[-1] != len(unknowns) or r_offsets[-1] != len(residuals):
+        return jacobian_finite_difference(unknowns,(segment,state))
+
+    # baseline conditions to hand off as initials
+    from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+    snapshots = []
+    for sub_state in sub_states:
+        snapshot = Conditions()
+        snapshot.conditions = deepcopy(sub_state.conditions)
+        snapshots.append(snapshot)
+
+    initials = [ sub_state.initials for sub_state in sub_states ]
+
+    jacobian = np.zeros([len(residuals),len(unknowns)])
+
+    n_blocks = len(tags)
+
+    # analytic diagonal blocks
+    analytic = [ sub_state.numerics.get('solver_jacobian','none') == 'function'
+                 for sub_state in sub_states ]
+
+    for i in xrange(n_blocks):
+        if not analytic[i]: continue
+        jac = sub_states[i].numerics.jacobian_evaluation(sub_segments[i],sub_states[i])
+        jacobian[ r_offsets[i]:r_offsets[i+1] , x_offsets[i]:x_offsets[i+1] ] = jac
+
+    # sweep the unknown columns
+    n_columns = max([ len(x) for x in x_blocks ])
+
+    for j in xrange(n_columns):
+
+        perturbed = [ j < len(x) for x in x_blocks ]
+        steps     = [ difference_steps(x[j:j+1])[0] if p else 0. for x,p in zip(x_blocks,perturbed) ]
+
+        # diagonal blocks, baseline initials
+        for i in xrange(n_blocks):
+            if not perturbed[i]: continue
+
+            x = x_blocks[i].copy()
+            x[j] += steps[i]
+            sub_states[i].unknowns.unpack_array(x)
+
+            if i > 0: sub_states[i].initials = snapshots[i-1]
+
+            r = update_sub_segment(sub_segments[i],sub_states[i])
+
+            if not analytic[i]:
+                jacobian[ r_offsets[i]:r_offsets[i+1] , x_offsets[i]+j ] = ( r - r_blocks[i] ) / steps[i]
+
+        # sub diagonal blocks, perturbed initials
+        # backwards, so each predecessor still holds its perturbed solution
+        for i in reversed(xrange(n_blocks-1)):
+            if not perturbed[i]: continue
+
+            sub_states[i+1].unknowns.unpack_array(x_blocks[i+1])
+            sub_states[i+1].initials = sub_states[i]
+
+            r = update_sub_segment(sub_segments[i+1],sub_states[i+1])
+
+            jacobian[ r_offsets[i+1]:r_offsets[i+2] , x_offsets[i]+j ] = ( r - r_blocks[i+1] ) / steps[i]
+
+    # restore the state at the unknowns
+    for sub_state,initial in zip(sub_states,initials):
+        sub_state.initials = initial
+    iterate(unknowns,(segment,state))
+
+    return jacobian
+
+
+def update_sub_segment(sub_segment,sub_state):
+    """ runs one sub segment in isolation, returns the packed residuals """
+
+    sub_segment.initialize(sub_state)
+    sub_segment.iterate(sub_state)
+    sub_segment.finalize(sub_state)
+
+    return sub_state.residuals.pack_array()
+
+
+def difference_steps(unknowns):
+    """ forward difference step sizes, scaled to the unknowns as in minpack """
+
+    eps = np.sqrt(np.finfo(float).eps)
+
+    steps = eps * np.abs(unknowns)
+    steps[steps == 0.] = eps
+
+    return steps
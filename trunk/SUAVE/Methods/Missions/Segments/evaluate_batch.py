@@ -0,0 +1,222 @@
+# evaluate_batch.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy.optimize
+
+from converge_root import converge_root
+from Newton_Root   import Jacobian, newton_step, jacobian_finite_difference
+from Common.Sub_Segments import sequential_sub_segments
+
+# ----------------------------------------------------------------------
+#  Evaluate Batch
+# ----------------------------------------------------------------------
+
+def evaluate_batch(segments,states=None,shared_jacobian=False):
+    """ SUAVE.Methods.Missions.Segments.evaluate_batch(segments,states=None,shared_jacobian=False)
+        evaluates variants of one segment or mission side by side
+
+        Inputs:
+            segments        - list of segments or missions with the same
+                              processes and sub segments, ie. copies of one
+                              mission with different inputs
+            states          - their states, instantiated from the segments
+                              if None
+            shared_jacobian - use the jacobian of the first variant for all
+
+        Outputs:
+            states          - the evaluated states, in the order of segments
+
+        The steps of the processes are run in order, each step for one
+        variant after another; the variants are not stacked into one state.
+        Where the variants converge with converge_root, converge_batch()
+        iterates them side by side with the quasi-newton steps of
+        Newton_Root. Sequential missions are batched segment by segment.
+
+        With shared_jacobian, the jacobian of the first variant is the
+        starting jacobian of every variant, Broyden updates correct it.
+        This saves the finite differences of the others, and suits
+        variants that are close to each other.
+
+        Assumptions:
+            The variants do not share the objects they write to, their
+            analyses only have to be read. The tolerance of the first
+            variant is used for all, their root finder settings are not
+            used.
+    """
+
+    if states is None:
+        states = [ segment.state.instantiate() for segment in segments ]
+
+    process = segments[0].process
+
+    for tag,step in process.items():
+
+        # converge the variants together
+        if tag == 'converge' and batchable(step):
+            converge_batch(segments,states,shared_jacobian)
+
+        # segment by segment
+        elif tag == 'converge' and step is sequential_sub_segments:
+            for sub_tag in segments[0].segments.keys():
+                evaluate_batch( [ segment.segments[sub_tag] for segment in segments ] ,
+                                [ state.segments[sub_tag]   for state   in states   ] ,
+                                shared_jacobian )
+
+        # one variant at a time
+        else:
+            for segment,state in zip(segments,states):
+                step = segment.process[tag]
+                if hasattr(step,'evaluate'):
+                    step.evaluate(segment,state)
+                else:
+                    step(segment,state)
+
+    return states
+
+
+def batchable(step):
+    """ True if the converge step of a process is only converge_root """
+
+    if step is converge_root:
+        return True
+
+    try:
+        return step.values() == [converge_root]
+    except AttributeError:
+        return False
+
+
+# ----------------------------------------------------------------------
+#  Converge Batch
+# ----------------------------------------------------------------------
+
+def converge_batch(segments,states,shared_jacobian=False,maximum_iterations=100,
+                   maximum_updates=30,stall_ratio=0.5,residual_tolerance=1e-8):
+    """ SUAVE.Methods.Missions.Segments.converge_batch(segments,states,shared_jacobian=False, ...)
+        solves the unknowns of variants of a segment side by side
+
+        Each variant iterates with the quasi-newton step of Newton_Root,
+        newton_step(), on its own lu factored jacobian with Broyden updates,
+        and stops on its own. The variants are evaluated one after another
+        through their processes. With shared_jacobian, the first variant is
+        differenced once and its jacobian seeds all of them. A variant that
+        makes no progress on a fresh jacobian, or is not converged after
+        maximum_iterations, is then solved on its own by
+        scipy.optimize.fsolve from its initial unknowns.
+
+        Inputs:
+            segments, states   - the variants, initialized
+            shared_jacobian    - start every variant from the jacobian of
+                                 the first
+            maximum_iterations - iteration limit
+            maximum_updates    - rank-one corrections before a refresh
+            stall_ratio        - refresh a jacobian when the residual norm
+                                 of its variant drops by less than this
+            residual_tolerance - residual norm that counts as converged,
+                                 otherwise an accepted step within xtol
+
+        Outputs:
+            the states are left evaluated at their solutions
+    """
+
+    blocks = Blocks(segments,states)
+    n      = len(blocks)
+    xtol   = states[0].numerics.tolerance_solution
+
+    x  = [ state.unknowns.pack_array() for state in states ]
+    x0 = [ x_i.copy() for x_i in x ]
+    f  = [ blocks.iterate(i,x[i]) for i in xrange(n) ]
+
+    norms     = [ np.linalg.norm(f_i) for f_i in f ]
+    converged = [ norm <= residual_tolerance for norm in norms ]
+    failed    = [ False ] * n
+    at_x      = [ True ] * n
+    fresh     = [ False ] * n
+
+    # the first jacobians
+    if shared_jacobian and n > 1 and all([ len(x_i) == len(x[0]) and len(f_i) == len(f[0]) for x_i,f_i in zip(x,f) ]):
+        J = jacobian_finite_difference(blocks.residuals(0),x[0],f[0])
+        jacobian = [ Jacobian(J) for i in xrange(n) ]
+    else:
+        jacobian = [ None ] * n
+
+    iteration = 0
+
+    while not all(converged) and iteration < maximum_iterations:
+
+        iteration += 1
+
+        for i in xrange(n):
+            if converged[i]: continue
+
+            # a new jacobian
+            if jacobian[i] is None:
+                jacobian[i] = Jacobian(jacobian_finite_difference(blocks.residuals(i),x[i],f[i]))
+                fresh[i]    = True
+
+            step = newton_step(blocks.residuals(i),jacobian[i],x[i],f[i],norms[i],xtol,fresh[i],
+                               maximum_updates    = maximum_updates,
+                               stall_ratio        = stall_ratio,
+                               residual_tolerance = residual_tolerance)
+
+            at_x[i] = step.accepted
+            if step.accepted:
+                x[i]     = step.x
+                f[i]     = step.f
+                norms[i] = step.norm
+
+            converged[i] = step.converged
+            if step.failed:
+                failed[i] = converged[i] = True # no progress on a fresh jacobian
+
+            # stalled, rebuild the jacobian
+            if step.refresh:
+                jacobian[i] = None
+            fresh[i] = False
+
+    # variants the newton steps could not solve, on their own from the
+    # start, as converge_root would
+    for i in xrange(n):
+        if failed[i] or not converged[i]:
+            x[i] = scipy.optimize.fsolve( blocks.residuals(i), x0[i], xtol=xtol )
+            at_x[i] = False
+
+    # leave the states evaluated at the solutions
+    for i in xrange(n):
+        if not at_x[i]:
+            blocks.iterate(i,x[i])
+
+    return
+
+
+class Blocks(object):
+    """ the variants of a batch """
+
+    def __init__(self,segments,states):
+        self.segments = segments
+        self.states   = states
+
+    def __len__(self):
+        return len(self.segments)
+
+    def iterate(self,i,x):
+        """ iterates variant i at its unknowns x, returns its residuals """
+
+        segment = self.segments[i]
+        state   = self.states[i]
+
+        state.unknowns.unpack_array(x)
+        segment.process.iterate(segment,state)
+
+        return state.residuals.pack_array()
+
+    def residuals(self,i):
+        """ the residual function of variant i """
+        return lambda x: self.iterate(i,x)
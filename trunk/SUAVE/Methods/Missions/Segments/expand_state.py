@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Expand State
@@ -13,5 +14,8 @@ def expand_state(segment,state):
     
     state.expand_rows(n_points)
     
+    if state.numerics.get('contiguous_conditions',False):
+        state.conditions.make_contiguous()
+    
     return
     
\ No newline at end of file
@@ -1,5 +1,6 @@
 # Packages
 from noise_airframe_Fink import noise_fidelity_one
+from noise_airframe_Fink import noise_airframe_Fink
 
 from noise_clean_wing import noise_clean_wing
 
@@ -2,6 +2,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -22,6 +23,7 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric_observers
 
 import numpy as np
 
@@ -73,41 +75,6 @@ def noise_fidelity_one(config, analyses, noise_segment,ioprint = 0, filename=0):
                 Correlation based."""
 
 
-    # ==============================================
-        # Unpack
-    # ==============================================
-    wing = config.wings
-
-    Sw      =       wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
-    bw      =       wing.main_wing.spans.projected / Units.ft                    #wing span, ft
-    Sht     =       wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
-    bht     =       wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
-    Svt     =       wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
-    bvt     =       wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
-    deltaf  =       wing.main_wing.flaps.angle                                   #flap delection, rad
-    Sf      =       wing.main_wing.flaps.area  / (Units.ft)**2                   #flap area, sq.ft        
-    cf      =       wing.main_wing.flaps.chord_dimensional  / Units.ft           #flap chord, ft
-    Dp      =       config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
-    Hp      =       config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
-    Dn      =       config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
-    Hn      =       config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
-    gear    =       config.landing_gear.gear_condition                           #Gear up or gear down
-    
-    nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
-    main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
-    main_units     =   config.landing_gear.main_units                            #Number of main units   
-    velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) 
-    altitude       =   noise_segment.conditions.freestream.altitude[:,0] 
-    time           =   noise_segment.conditions.frames.inertial.time     
-
-    # determining flap slot number
-    if wing.main_wing.flaps.type   == 'single_sloted':
-        slots = 1
-    elif wing.main_wing.flaps.type == 'double_sloted':
-        slots = 2
-    elif wing.main_wing.flaps.type == 'triple_sloted':
-        slots = 3
-    
     # Calls the function noise_geometric to calculate all the distance and emission angles
     geometric = noise_geometric(noise_segment,analyses,config)
     
@@ -115,112 +82,36 @@ def noise_fidelity_one(config, analyses, noise_segment,ioprint = 0, filename=0):
     angle = geometric[:][1]
     phi   = geometric[:][2]
     
-        
-    # Number of points on the discretize segment   
-    nsteps=len(time)
-    
-    # Preparing matrix for noise calculation
-    sound_speed = np.zeros(nsteps)
-    density     = np.zeros(nsteps)
-    viscosity   = np.zeros(nsteps)
-    temperature = np.zeros(nsteps)
-    M           = np.zeros(nsteps)
-    deltaw      = np.zeros(nsteps)
-    
-    # ==============================================
-    #         Computing atmospheric conditions
-    # ==============================================
-    
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
-        
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
-        
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
-    
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
+    # One microphone
+    spectra = airframe_spectra(config,analyses,noise_segment,distance_vector[None,:],angle[None,:],phi[None,:])
     
-
-    #Units conversion - knots to ft/s
-    kt2fts = 1.6878098571 
-
-    #Generate array with the One Third Octave Band Center Frequencies
-    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
-            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
-
-
-    # Velocity in fts
-    velocity_fst = velocity * Units.knot
+    velocity  = spectra.velocity
+    altitude  = noise_segment.conditions.freestream.altitude[:,0] 
+    time      = noise_segment.conditions.frames.inertial.time     
+    M         = spectra.mach_number
+    frequency = spectra.frequency
     
     #number of positions of the aircraft to calculate the noise
+    nsteps = len(time)
     nrange = len(angle) 
-    i=0
-    SPL_wing_history = np.zeros((nrange,24))
-    SPLht_history    = np.zeros((nrange,24))
-    SPLvt_history    = np.zeros((nrange,24))
-    SPL_flap_history = np.zeros((nrange,24))
-    SPL_slat_history = np.zeros((nrange,24))
-    SPL_main_landing_gear_history = np.zeros((nrange,24))
-    SPL_nose_landing_gear_history = np.zeros((nrange,24))
-    SPL_total_history = np.zeros((nrange,24))
     
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nrange,24))    
+    SPL_total_history = spectra.total[0]
+    SPL_wing_history  = spectra.wing[0]
+    SPLht_history     = spectra.horizontal_tail[0]
+    SPLvt_history     = spectra.vertical_tail[0]
+    SPL_flap_history  = spectra.flap[0]
+    SPL_slat_history  = spectra.slat[0]
+    SPL_main_landing_gear_history = spectra.main_landing_gear[0]
+    SPL_nose_landing_gear_history = spectra.nose_landing_gear[0]
     
-    #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(0,nrange-1):
-        #Emission angle theta   
-        theta = angle[i] 
-        #Distance from airplane to observer, evaluated at retarded time
-        distance = distance_vector[i]    
-       
-         #Atmospheric attenuation
-        delta_atmo=atmospheric_attenuation(distance)
-
-        #Call each noise source model
-        SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo    #Wing Noise
-        SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-        SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
- 
-        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i],viscosity[i],M[i],phi[i],theta,distance,frequency) -delta_atmo        #Slat leading edge
- 
-        if (deltaf==0):
-            SPL_flap = np.zeros(24)
-        else:
-            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
- 
-        if gear=='up': #0
-            SPL_main_landing_gear = np.zeros(24)
-            SPL_nose_landing_gear = np.zeros(24)
-        else:
-            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-        if main_units>1: #Incoherent summation of each main landing gear unit
-            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
- 
- 
-         #Total Airframe Noise
-        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear)) - delta_atmo
-             
-        #Included 02nd September 2015
-        SPLt_dBA = dbA_noise(SPL_total)       
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-            
-        SPL_total_history[i][:] = SPL_total[:]
-        SPL_wing_history[i][:]  = SPL_wing[:]
-        SPLvt_history[i][:]     = SPLvt[:]
-        SPLht_history[i][:]     = SPLht[:]
-        SPL_flap_history[i][:]  = SPL_flap[:]
-        SPL_slat_history[i][:]  = SPL_slat[:]
-        SPL_nose_landing_gear_history[i][:] = SPL_nose_landing_gear[:]
-        SPL_main_landing_gear_history[i][:] = SPL_main_landing_gear[:]
+    #The last position of the aircraft is left out of the noise history
+    for SPL_history in [SPL_total_history,SPL_wing_history,SPLht_history,SPLvt_history,SPL_flap_history, \
+                        SPL_slat_history,SPL_main_landing_gear_history,SPL_nose_landing_gear_history]:
+        SPL_history[-1,:] = 0.
+    
+    #Noise history in dBA
+    SPLt_dBA_history = dbA_noise(SPL_total_history)
+    SPLt_dBA_history[-1,:] = 0.
        
        
    #Calculation of dBA based on the sound pressure time history
@@ -344,4 +235,149 @@ def noise_fidelity_one(config, analyses, noise_segment,ioprint = 0, filename=0):
     
         fid.close
     
-    return (EPNL_total,SPL_total_history)
\ No newline at end of file
+    return (EPNL_total,SPL_total_history)
+
+
+# ----------------------------------------------------------------------
+#  Noise Airframe Fink
+# ----------------------------------------------------------------------
+
+def noise_airframe_Fink(config, analyses, noise_segment, microphone_locations):
+    """ SUAVE.Methods.Noise.Fidelity_One.noise_airframe_Fink(config, analyses, noise_segment, microphone_locations):
+            Computes the 1/3 octave band SPL time history of the airframe at any number of observers, all in one
+            array evaluation.
+
+            Inputs:
+                config                     - SUAVE type vehicle, as in noise_fidelity_one
+                analyses                   - SUAVE type analyses, with the atmosphere
+                noise_segment              - SUAVE type segment, evaluated
+                microphone_locations       - Observer positions in the inertial frame, [n_mics,3] [meters]
+
+            Outputs: One Third Octave Band SPL [dB], [n_mics,n_steps,24]
+                total                            - Sound Pressure Level of the airframe
+                wing                             - Sound Pressure Level of the clean wing
+                horizontal_tail                  - Sound Pressure Level of the horizontal tail
+                vertical_tail                    - Sound Pressure Level of the vertical tail
+                flap                             - Sound Pressure Level of the flaps trailing edge
+                slat                             - Sound Pressure Level of the slat leading edge
+                main_landing_gear                - Sound Pressure Level of the main landing gear
+                nose_landing_gear                - Sound Pressure Level of the nose landing gear
+
+            Assumptions:
+                Correlation based."""
+
+    distance, theta, phi = noise_geometric_observers(noise_segment,microphone_locations)
+
+    return airframe_spectra(config,analyses,noise_segment,distance,theta,phi)
+
+
+def airframe_spectra(config, analyses, noise_segment, distance, theta, phi):
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_Fink.airframe_spectra(config, analyses, noise_segment, distance, theta, phi):
+            The airframe noise components at observers of distance, polar angle theta and azimuthal angle phi, all
+            [n_mics,n_steps] arrays. The components are [n_mics,n_steps,24]."""
+
+    # ==============================================
+        # Unpack
+    # ==============================================
+    wing = config.wings
+
+    Sw      =       wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
+    bw      =       wing.main_wing.spans.projected / Units.ft                    #wing span, ft
+    Sht     =       wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
+    bht     =       wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
+    Svt     =       wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
+    bvt     =       wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
+    deltaf  =       wing.main_wing.flaps.angle                                   #flap delection, rad
+    Sf      =       wing.main_wing.flaps.area  / (Units.ft)**2                   #flap area, sq.ft        
+    cf      =       wing.main_wing.flaps.chord_dimensional  / Units.ft           #flap chord, ft
+    Dp      =       config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
+    Hp      =       config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
+    Dn      =       config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
+    Hn      =       config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
+    gear    =       config.landing_gear.gear_condition                           #Gear up or gear down
+    
+    nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
+    main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
+    main_units     =   config.landing_gear.main_units                            #Number of main units   
+    velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) 
+    altitude       =   noise_segment.conditions.freestream.altitude[:,0] 
+
+    # determining flap slot number
+    if wing.main_wing.flaps.type   == 'single_sloted':
+        slots = 1
+    elif wing.main_wing.flaps.type == 'double_sloted':
+        slots = 2
+    elif wing.main_wing.flaps.type == 'triple_sloted':
+        slots = 3
+    
+    # Number of points on the discretize segment   
+    nsteps = len(altitude)
+    
+    # ==============================================
+    #         Computing atmospheric conditions
+    # ==============================================
+    
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+    
+    # time steps in the rows, against the frequency bands
+    viscosity   = np.reshape(atmo_data.dynamic_viscosity,[nsteps,1])*10.7639 #units converstion - m2 to ft2
+    temperature = np.reshape(atmo_data.temperature,[nsteps,1])
+    
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
+    
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
+
+    #Generate array with the One Third Octave Band Center Frequencies
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    # microphones and time steps, against the frequency bands
+    distance = distance[:,:,None]
+    theta    = theta[:,:,None]
+    phi      = phi[:,:,None]
+
+    #Atmospheric attenuation
+    delta_atmo = atmospheric_attenuation(distance)
+
+    #Call each noise source model
+    SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+
+    SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw,viscosity,M,phi,theta,distance,frequency) -delta_atmo        #Slat leading edge
+
+    if (deltaf==0):
+        SPL_flap = np.zeros_like(SPL_wing)
+    else:
+        SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+
+    if gear=='up': #0
+        SPL_main_landing_gear = np.zeros_like(SPL_wing)
+        SPL_nose_landing_gear = np.zeros_like(SPL_wing)
+    else:
+        SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M,velocity,phi,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M,velocity,phi,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if main_units>1: #Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
+
+    #Total Airframe Noise
+    SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+         10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear)) - delta_atmo
+
+    #pack
+    spectra = Data()
+    spectra.total             = SPL_total
+    spectra.wing              = SPL_wing
+    spectra.horizontal_tail   = SPLht
+    spectra.vertical_tail     = SPLvt
+    spectra.flap              = SPL_flap
+    spectra.slat              = SPL_slat
+    spectra.main_landing_gear = SPL_main_landing_gear
+    spectra.nose_landing_gear = SPL_nose_landing_gear
+    spectra.frequency         = frequency
+    spectra.velocity          = velocity
+    spectra.mach_number       = M[:,0]
+
+    return spectra
@@ -2,6 +2,7 @@
 # 
 # Created:  Jun 2015, Carlos
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -42,6 +43,9 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
                 SPL                              - Sound Pressure Level of the clean wing [dB]
                 OASPL                            - Overall Sound Pressure Level of the clean wing [dB]
 
+            The angles, distance and flight conditions may be arrays, as long as they
+            broadcast against the frequency in the last axis, eg. [n_mics,n_steps,1].
+
             Assumptions:
                 Correlation based."""
 
@@ -55,17 +59,16 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
     elif IsHorz==0:
         DIR = np.sin(phi)
 
+    fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta)))
+    fmaxw = 0.1*(velocity/Units.ft)/deltaw
 
-    if DIR==0:
-        SPL = np.zeros(24)
-    else:
-
-        fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta)))
-        fmaxw = 0.1*(velocity/Units.ft)/deltaw
-
+    with np.errstate(divide='ignore',invalid='ignore'):
         OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
             20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
 
         SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmaxw)-1))**1.5
 
+    # no noise where the surface has no directivity
+    SPL = np.where(DIR==0,0.,SPL)
+
     return(SPL);
@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2015, Carlos
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -34,13 +35,15 @@ def noise_leading_edge_slat (SPL_wing,Sw,bw,velocity,deltaw,viscosity,M,phi,thet
             Outputs: One Third Octave Band SPL [dB]
                 SPL                              - Sound Pressure Level of the slat leading edge [dB]
 
+            The inputs may be arrays, broadcast against the frequency in the last axis.
+
             Assumptions:
                 Correlation based."""
 
     #Process
     SPLslat1   = SPL_wing+3.0
     SPLslat2   = noise_clean_wing(0.15*Sw,bw,1,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)
-    peakfactor = 3+max(SPL_wing)-max(SPLslat2)
+    peakfactor = 3+np.max(SPL_wing,axis=-1,keepdims=True)-np.max(SPLslat2,axis=-1,keepdims=True)
     SPLslat2   = SPLslat2+peakfactor
 
     SPL        = 10.*np.log10(10.0**(0.1*SPLslat1)+10.0**(0.1*SPLslat2))
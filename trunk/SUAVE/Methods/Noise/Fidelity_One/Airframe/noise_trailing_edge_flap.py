@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2015, Carlos
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -33,39 +34,33 @@ def noise_trailing_edge_flap (Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,f
             Outputs: One Third Octave Band SPL [dB]
                 SPL                              - Sound Pressure Level of the flap trailing edge [dB]
 
+            The inputs may be arrays, broadcast against the frequency in the last axis.
+
             Assumptions:
                 Correlation based."""
 
     #Process
-    G      = np.zeros(24)
     kt2fts = 1.6878098571
 
     test   = frequency*cf/(velocity/Units.ft*(1-M*np.cos(theta)))
+    log_test = np.log10(test)
 
     if (slots==1 or slots==2):
-        for i in range (0,24):
-            if (test[i]<2):
-                G[i] = 99+10*np.log10(test[i])
-            elif (test[i]<20):
-                G[i] = 103.82-6*np.log10(test[i])
-            else:
-                G[i] = 135.04-30*np.log10(test[i])
+        G = np.where(test<2 , 99+10*log_test    ,
+            np.where(test<20, 103.82-6*log_test ,
+                              135.04-30*log_test))
 
     elif slots==3:
-        for i in range(0,24):
-            if(test[i]<2):
-                G[i] = 99+10*np.log10(test[i])
-            elif (test[i]<75):
-                G[i] = 102.61-2*np.log10(test[i])
-            else:
-                G[i] = 158.11-30*np.log10(test[i])
-
-    G = np.transpose(G)
-    
-    if theta+deltaf>=np.pi:
-        directivity = 0.0
-    else:     
+        G = np.where(test<2 , 99+10*log_test    ,
+            np.where(test<75, 102.61-2*log_test ,
+                              158.11-30*log_test))
+
+    else:
+        G = np.zeros_like(test)
+
+    with np.errstate(divide='ignore',invalid='ignore'):
         directivity = 20.0*np.log10(np.sin(theta)* (np.cos(phi))**2 * np.sin(theta+deltaf))
+    directivity = np.where(theta+deltaf>=np.pi,0.0,directivity)
 
     SPL = G+10*np.log10(Sf*(np.sin(deltaf))**2/(distance**2))+ \
         60*np.log10((velocity/Units.kts)/100.0)+directivity
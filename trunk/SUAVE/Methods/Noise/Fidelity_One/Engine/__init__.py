@@ -1,2 +1,3 @@
 
-from noise_SAE import noise_SAE
\ No newline at end of file
+from noise_SAE import noise_SAE
+from noise_SAE import noise_SAE_observers
\ No newline at end of file
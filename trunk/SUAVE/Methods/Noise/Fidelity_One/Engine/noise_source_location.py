@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -13,104 +14,68 @@ import numpy as np
 #   Noise Source Location
 # ----------------------------------------------------------------------   
 
-def noise_source_location (B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
-    
+def noise_source_location (Xo,zk,Diameter_primary,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
+    """This function calculates the emission angles of the primary, secondary and mixed jet noise sources,
+    theta_p, theta_s and theta_m, for all time steps and frequency bands at once.
+
+    Values per time step are columns [n_steps,1], the Strouhal numbers are [n_steps,24]. The source
+    locations are iterated from theta = pi/2, each element until its own location converges."""
+
+    theta_start = np.ones(np.shape(Str_m))*np.pi/2
+
     #Primary jet source location
-    XJ = np.zeros(24)
-    
-    for i in xrange(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        #Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
-            *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
-
-        #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
-            (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-            *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
-
-    return(theta_p,theta_s,theta_m)
\ No newline at end of file
+    XJ_primary = lambda theta_p: (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p/np.pi)-9.)+(Area_secondary/Area_primary))
+
+    theta_p = source_location(XJ_primary(theta_start),XJ_primary,Diameter_primary,Diameter_primary/200.,Xo,theta,distance_microphone)
+
+    #Secondary jet source location
+    XJ_secondary = lambda theta_s,Diameter: (zk*Diameter)*(2.+1.6*np.arctan((4.5*theta_s/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s)) \
+        *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
+
+    theta_s = source_location(XJ_secondary(theta_start,Diameter_secondary),lambda theta_s: XJ_secondary(theta_s,Diameter_mixed),
+                              Diameter_secondary,Diameter_mixed/200.,Xo,theta,distance_microphone)
+
+    #Mixed jet source location
+    XJ_mixed = lambda theta_m: (zk*Diameter_mixed)*(3.+np.exp(-Str_m)+(2.+1.1*np.arctan((18.*theta_m/np.pi)-13.))+ \
+        (1.+0.5/np.sqrt(Str_m)))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
+        (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
+
+    theta_m = source_location(XJ_mixed(theta_start),XJ_mixed,Diameter_mixed,Diameter_mixed/200.,Xo,theta,distance_microphone)
+
+    return(theta_p,theta_s,theta_m)
+
+
+def source_location(XJ,XJ_function,residual_start,tolerance,Xo,theta,distance_microphone):
+    """The emission angle of a jet noise source, from a first source location XJ: the angle and the location
+    XJ_function(angle) are iterated, averaging the new angle with the last, until the location changes by
+    less than the tolerance."""
+
+    theta_j = emission_angle(XJ,Xo,theta,distance_microphone)
+    XJ      = XJ_function(theta_j)
+
+    residual = np.ones(np.shape(XJ))*residual_start
+    active   = residual>tolerance
+
+    while np.any(active):
+        XJ_old = XJ
+        theta1 = theta_j
+        theta2 = emission_angle(XJ,Xo,theta,distance_microphone)
+
+        theta_new = (theta1+theta2)/2.
+        XJ_new    = XJ_function(theta_new)
+
+        #only the elements still iterating move
+        theta_j  = np.where(active,theta_new,theta_j)
+        XJ       = np.where(active,XJ_new,XJ)
+        residual = np.where(active,np.abs(XJ_old-XJ_new),residual)
+        active   = residual>tolerance
+
+    return theta_j
+
+
+def emission_angle(XJ,Xo,theta,distance_microphone):
+    """The emission angle of a source at XJ downstream of the nozzle exit"""
+
+    B = (1./np.sin(theta))*(((Xo+XJ)/distance_microphone)+np.cos(theta))
+
+    return np.where(B>=0.,np.arcsin(((B)**2.+1.)**(-0.5)),np.pi-np.arcsin(((B)**2.+1.)**(-0.5)))
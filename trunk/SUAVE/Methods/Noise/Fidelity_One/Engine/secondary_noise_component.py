@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -13,7 +14,7 @@ import numpy as np
 #   Secondary Noise Component
 # ---------------------------------------------------------------------- 
 
-def secondary_noise_component (SPL_s,Velocity_primary,theta_s,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s):
+def secondary_noise_component (Velocity_primary,theta_s,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s):
     """This function calculates the noise contribution of the secondary jet component"""
 
     #Calculation of the velocity exponent
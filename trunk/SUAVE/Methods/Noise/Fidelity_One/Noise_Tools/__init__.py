@@ -1,4 +1,4 @@
-from flight_trajectory import flight_trajectory
+from noise_data_adapter import noise_data_adapter
 from pnl_noise	import pnl_noise
 from epnl_noise import epnl_noise
 from atmospheric_attenuation import atmospheric_attenuation
@@ -6,3 +6,5 @@ from noise_tone_correction import noise_tone_correction
 from dbA_noise import dbA_noise
 from noise_geometric import noise_geometric
 from noise_certification_limits import noise_certification_limits
+from noise_geometric_observers import noise_geometric_observers
+from sel_noise import sel_noise
@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -18,50 +19,48 @@ def epnl_noise(PNLT):
      (Perceived Noise Level with Tone Correction).
 
         Inputs:
-                    PNLT                     - Perceived Noise Level with Tone Correction
+                    PNLT                     - Perceived Noise Level with Tone Correction, [...,n_steps]
 
                 Outputs: 
-                    EPNL                     - Effective Perceived Noise Level in EPNdB"""
-                    
-                    
+                    EPNL                     - Effective Perceived Noise Level in EPNdB, [...]"""
+
+    PNLT = np.asarray(PNLT,dtype=float)
+
     #Maximum PNLT on the time history data    
-    PNLT_max = np.max(PNLT)
+    PNLT_max = np.max(PNLT,axis=-1)
     
     #Calculates the number of discrete points on the trajectory
-    nsteps   = len(PNLT)    
+    nsteps   = np.shape(PNLT)[-1]
+    steps    = np.arange(nsteps)
     
-    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
-    if all(PNLT==0):
-        EPNL = 0
-        return(EPNL)
-
     #Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-    i = 0
-    while PNLT[i]<=(PNLT_max-10) and i<=nsteps:
-        i = i+1
-    t1 = i #t1 is the first time interval
-    i  = i+1
-
+    PNLT_down = (PNLT_max-10)[...,None]
+    
+    #t1 is the first time interval above the maximum PNLT - 10 dB
+    t1 = np.argmax(PNLT>PNLT_down,axis=-1)
+    
+    #t2 is the last time interval, before the PNLT falls under the maximum PNLT - 10 dB again
+    below = (PNLT<PNLT_down) & (steps>t1[...,None])
+    t2    = np.argmax(below,axis=-1)-1
+    
     #Correction for PNLTM-10 when it falls outside the limit of the data
-    if PNLT[nsteps-1]>=(PNLT_max-10):
-        t2=nsteps-2
-    else:
-        while i<=nsteps and PNLT[i]>=(PNLT_max-10):
-            i = i+1
-        t2 = i-1 #t2 is the last time interval
-                
-    #The time duration where the noise is higher than the maximum PNLT - 10 dB is:
-    time_interval = (t2-t1)*0.5
+    t2 = np.where(PNLT[...,-1]>=(PNLT_max-10), nsteps-2, t2)
     
-    #Calculates the integral of the PNLT which between t1 and t2 points
-    sumation = 0
-    for i in range (t1-1,t2+1):
-        sumation = 10**(PNLT[i]/10)+sumation
-        
-   #Duration Correction calculation
-    duration_correction = 10*np.log10(sumation)-PNLT_max-13
+    #Calculates the integral of the PNLT which between t1 and t2 points, summed in step order. The
+    #interval starts a step before t1, at the first step that is the last of the history
+    window  = (steps>=t1[...,None]-1) & (steps<=t2[...,None])
+    first   = np.where(t1==0, 10**(PNLT[...,-1]/10), 0.)
+    terms   = np.where(window, 10**(PNLT/10), 0.)
+    sumation = np.cumsum(np.concatenate([first[...,None],terms],axis=-1),axis=-1)[...,-1]
+    
+    #Duration Correction calculation
+    with np.errstate(divide='ignore'):
+        duration_correction = 10*np.log10(sumation)-PNLT_max-13
                 
     #Final EPNL calculation
     EPNL = PNLT_max+duration_correction
     
-    return (EPNL)    
\ No newline at end of file
+    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
+    EPNL = np.where(np.all(PNLT==0,axis=-1), 0., EPNL)
+    
+    return (EPNL[()])
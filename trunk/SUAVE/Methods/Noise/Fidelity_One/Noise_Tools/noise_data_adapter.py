@@ -0,0 +1,76 @@
+# noise_data_adapter.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Core import Units
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_interpolation
+
+# ----------------------------------------------------------------------
+#   Noise Data Adapter
+# ----------------------------------------------------------------------
+
+def noise_data_adapter(segment,propulsors=None,time_step=0.5*Units.s):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_data_adapter(segment,propulsors=None,time_step=0.5*Units.s):
+            Resamples the conditions of a converged mission segment onto the time grid of the noise certification
+            procedure, in place of simulating the noise trajectory again.
+
+            Inputs:
+                segment                - SUAVE type segment, evaluated by the mission
+                propulsors             - Optional, the networks flying the segment. Each is evaluated once on the
+                                         new time steps, which gives their acoustic outputs there
+                time_step              - Time step of the noise calculation, 0.5 s for certification [s]
+
+            Outputs:
+                noise_segment          - SUAVE type segment state, with the conditions of the segment at each time step
+                                         from its start, for the noise functions
+
+            Assumptions:
+                The conditions are interpolated through the control points of the segment with the interpolant of
+                their differentiation matrix. The last time step falls on or before the end of the segment."""
+
+    conditions = segment.conditions
+    x          = segment.numerics.dimensionless.control_points[:,0]
+    time       = conditions.frames.inertial.time[:,0]
+
+    # the noise time steps, and where they are on the segment
+    t0      = time[0]
+    tf      = time[-1]
+    n_steps = int(np.floor((tf-t0)/time_step + 1e-9)) + 1
+    t_noise = t0 + time_step*np.arange(n_steps)
+
+    L = chebyshev_interpolation(x,(t_noise-t0)/(tf-t0))
+
+    # the fields of the conditions, as the columns of one array
+    source = deepcopy(conditions)
+    buff   = source.make_contiguous()
+
+    noise_conditions = source.instantiate()
+    noise_conditions.expand_rows(n_steps)
+
+    for path,start,stop in source.fields():
+        container = noise_conditions
+        for key in path[:-1]:
+            container = container[key]
+        container[path[-1]] = np.dot(L,buff[:,start:stop])
+
+    noise_conditions.frames.inertial.time[:,0] = t_noise
+
+    noise_segment = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    noise_segment.conditions = noise_conditions
+    noise_segment.expand_rows(n_steps)
+
+    # the networks on all the time steps at once
+    if propulsors is not None:
+        for propulsor in propulsors:
+            propulsor.evaluate_thrust(noise_segment)
+
+    return noise_segment
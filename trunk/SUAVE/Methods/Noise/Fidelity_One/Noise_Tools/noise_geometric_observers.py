@@ -0,0 +1,46 @@
+# noise_geometric_observers.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Noise Geometric Observers
+# ----------------------------------------------------------------------
+
+def noise_geometric_observers(noise_segment,microphone_locations):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_geometric_observers(noise_segment,microphone_locations):
+            Computes the distance and emission angles from the aircraft to any number of observers, as noise_geometric
+            does for the certification microphones.
+
+            Inputs:
+                noise_segment          - SUAVE type segment, with the inertial position vector of its time steps
+                microphone_locations   - Observer positions in the inertial frame, [n_mics,3] [meters]
+                                         (x along the track, y lateral, z downwards, 0 on the ground)
+
+            Outputs:
+                dist                   - Distance from the aircraft to each microphone, [n_mics,n_steps] [meters]
+                theta                  - Polar emission angle, from the flight direction, [n_mics,n_steps] [rad]
+                phi                    - Azimuthal emission angle, from the vertical plane of the track, [n_mics,n_steps] [rad]
+
+            Assumptions:
+                The aircraft flies along the x axis."""
+
+    position_vector = noise_segment.conditions.frames.inertial.position_vector
+    mics            = np.atleast_2d(microphone_locations)
+
+    # microphones in the rows, time steps in the columns
+    dx = mics[:,0,None] - position_vector[None,:,0]
+    dy = mics[:,1,None] - position_vector[None,:,1]
+    dz = mics[:,2,None] - position_vector[None,:,2]
+
+    dist  = np.sqrt(dx**2+dy**2+dz**2)
+    theta = np.arccos(dx/dist)
+    phi   = np.arctan2(np.abs(dy),dz)
+
+    return (dist,theta,phi)
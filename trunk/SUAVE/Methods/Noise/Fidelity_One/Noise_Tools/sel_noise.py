@@ -0,0 +1,35 @@
+# sel_noise.py
+# 
+# Created:  Oct 2016, SUAVE Team
+# Modified: 
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from dbA_noise import dbA_noise
+
+# ----------------------------------------------------------------------
+#  SEL Noise
+# ----------------------------------------------------------------------
+
+def sel_noise(SPL,time):
+    """This method calculates the Sound Exposure Level SEL, the A-weighted sound energy of a noise
+        event normalized to one second, from the 1/3 octave band time history.
+
+        Inputs:
+                    SPL     - Sound Pressure Level in 1/3 octave band, [...,n_steps,24]
+                    time    - Time of the steps [s], [n_steps]
+
+                Outputs: [dB]
+                    SEL     - Sound Exposure Level in dBA, [...]"""
+    
+    #A-weighted overall level of each time step
+    LA = 10.*np.log10(np.sum(10.**(0.1*dbA_noise(SPL)),axis=-1))
+    
+    #Integration of the sound energy over the event, reference time of 1 second
+    SEL = 10.*np.log10(np.trapz(10.**(0.1*LA),time,axis=-1))
+        
+    return (SEL)
@@ -2,14 +2,17 @@
 #
 # Created:  Apr 2014, T. Orra
 # Modified: Jan 2016, E. Botero
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import Units
+from SUAVE.Methods.Missions.Segments import evaluate_batch
 import time
 import numpy as np
+from copy import deepcopy
 
 # ----------------------------------------------------------------------
 #  Calculate vehicle Payload Range Diagram
@@ -37,6 +40,9 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
 
         Assumptions:
             Constante altitude cruise
+            The points are evaluated side by side, each with a copy of the
+            mission, by SUAVE.Methods.Missions.Segments.evaluate_batch.
+            The mission itself is not changed.
 
     """
     # elapsed time start
@@ -103,35 +109,40 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     if iprint:
         print('\n\n\n .......... PAYLOAD RANGE DIAGRAM CALCULATION ..........\n')
 
-    # loop for each point of Payload Range Diagram
+    # a copy of the mission for each point of Payload Range Diagram
+    points = [ deepcopy(mission) for i in range(len(TOW)) ]
     for i in range(len(TOW)):
-##    for i in [2]:
         if iprint:
             print('   EVALUATING POINT : ' + str(i+1))
 
         # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
+        points[i].segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
 
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[segmentNum]
+    # Evaluate the missions with their TOW
+    results = evaluate_batch(points,shared_jacobian=True)
 
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
+    # Distance convergency in order to have total fuel equal to target fuel
+    #
+    # User don't have the option of run a mission for a given fuel. So, we
+    # have to iterate distance in order to have total fuel equal to target fuel
+    #
 
-        maxIter = 10 # maximum iteration limit
-        tol = 1.     # fuel convergency tolerance
-        err = 9999.  # error to be minimized
-        iter = 0     # iteration count
+    maxIter = 10 # maximum iteration limit
+    tol = 1.     # fuel convergency tolerance
+    err = [9999.] * len(TOW)  # errors to be minimized
+    iter = 0     # iteration count
 
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
+    # the points still iterating
+    active = [ i for i in range(len(TOW)) if abs(err[i]) > tol ]
+
+    while active and iter < maxIter:
+        iter = iter + 1
+
+        for i in active:
+            segment = results[i].segments[segmentNum]
 
             # Current total fuel burned in mission
-            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
+            TotalFuel  = TOW[i] - results[i].segments[-1].conditions.weights.total_mass[-1,0]
 
             # Difference between burned fuel and target fuel
             missingFuel = FUEL[i] - TotalFuel - reserves
@@ -144,22 +155,26 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
 
             # Estimated distance that will result in total fuel burn = target fuel
             DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[segmentNum].distance = (CruiseDist + DeltaDist)
+            points[i].segments[segmentNum].distance = (CruiseDist + DeltaDist)
 
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[segmentNum]
+        # running missions with new distances
+        states = evaluate_batch([ points[i] for i in active ],shared_jacobian=True)
+        for i,state in zip(active,states):
+            results[i] = state
 
             # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+            err[i] = ( TOW[i] - results[i].segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
 
             if iprint:
-                print('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
+                print('     point: ' + str(i+1) + ' | iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
                   + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
-                  + str('%8.0F' % (err+FUEL[i]+reserves))+' (kg) | Error : '+str('%8.0F' % err))
+                  + str('%8.0F' % (err[i]+FUEL[i]+reserves))+' (kg) | Error : '+str('%8.0F' % err[i]))
 
-        # Allocating resulting range in ouput array.
-        R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+        active = [ i for i in active if abs(err[i]) > tol ]
+
+    # Allocating resulting range in ouput array.
+    for i in range(len(TOW)):
+        R[i] = ( results[i].segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
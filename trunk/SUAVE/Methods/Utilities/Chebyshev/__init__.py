@@ -1,3 +1,4 @@
 
 from chebyshev_data import chebyshev_data
-from linear_data import linear_data
\ No newline at end of file
+from linear_data import linear_data
+from chebyshev_interpolation import chebyshev_interpolation
\ No newline at end of file
@@ -0,0 +1,74 @@
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+def chebyshev_interpolation(x, x_new):
+    """ L = chebyshev_interpolation(x,x_new)
+        calculates the interpolation matrix from the control points
+        of chebyshev_data or linear_data to new points, with the
+        barycentric form of the interpolant their differentiation
+        matrix D is built on.
+
+        Inputs:
+            x     - N control points, in range [0,1]
+            x_new - M points to interpolate to, in range [0,1]
+
+        Outputs:
+            L - interpolation operation matrix, M by N
+
+        Usage Notes -
+            get interpolated values with f_new = np.dot(L,f)
+                where f is either a 1-d vector or 2-d column array
+            rows of L at a control point pick that point exactly
+
+        Example:
+            How to interpolate a segment to a finer grid
+
+            # get the data
+            x,D,I = chebyshev_data(16)
+
+            # the function
+            f = np.sin(x)
+
+            # interpolate
+            x_new = np.linspace(0,1,101)
+            L     = chebyshev_interpolation(x,x_new)
+            f_new = np.dot(L,f)
+
+    """
+
+    # setup
+    x     = np.ravel(x).astype(float)
+    x_new = np.ravel(x_new).astype(float)
+    N     = x.size
+    if N <= 0: raise RuntimeError , "N = %i, must be > 0" % N
+
+    # barycentric weights, the reciprocals of the coefficients of D
+    w = np.ones(N)
+    w[0] = w[-1] = 0.5
+    w = w * ( (-1.) ** np.arange(0,N) )
+
+    # --- Interpolation Operator
+
+    dA = x_new[:,None] - x[None,:]
+
+    # points landing on a control point
+    exact = dA == 0.
+    dA[exact] = 1.
+
+    # build operator
+    L = w / dA
+    L = L / np.sum(L,axis=1)[:,None]
+
+    # exact rows
+    on_node = np.any(exact,axis=1)
+    L[on_node] = exact[on_node]
+
+    # done!
+    return L
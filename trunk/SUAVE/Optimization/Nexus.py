@@ -2,6 +2,7 @@
 # 
 # Created:  Jul 2015, E. Botero 
 # Modified: Feb 2015, M. Vegh
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,9 +11,12 @@
 # suave imports
 import SUAVE 
 from SUAVE.Core import Data
+from SUAVE.Core.Deep_Core.OrderedBunch import copy_bunch
 from copy import deepcopy
 import helper_functions as help_fun
 import numpy as np
+import multiprocessing
+from multiprocessing.util import Finalize
 
 # ----------------------------------------------------------------------
 #  Nexus Class
@@ -30,6 +34,12 @@ class Nexus(Data):
         self.optimization_problem   = None
         self.last_inputs            = None
         self.evaluation_count       = 0
+        
+        # finite_difference()
+        self.finite_difference_settings         = Data()
+        self.finite_difference_settings.method  = 'forward' # 'forward', 'central' or 'complex'
+        self.finite_difference_settings.step    = 1e-8
+        self.finite_difference_settings.workers = 1
     
     def evaluate(self,x = None):
         
@@ -155,36 +165,126 @@ class Nexus(Data):
         pass     
 
     def finite_difference(self,x):
+        """ SUAVE.Optimization.Nexus.finite_difference(x)
+            the gradient of the objective and the jacobian of all the
+            constraints at the scaled inputs x
+            
+            Outputs:
+                grad_obj - [n_inputs]
+                jac_con  - [n_constraints,n_inputs]
+            
+            Settings, in finite_difference_settings:
+                method  - 'forward' : one perturbed point per input
+                          'central' : two, second order accurate
+                          'complex' : complex step, one per input, exact to
+                                      round off if the procedure carries
+                                      complex numbers through
+                step    - the perturbation of the scaled inputs
+                workers - the perturbed points are evaluated in a pool of
+                          this many forked processes, if more than 1
+            
+            The pool is forked once, with a copy of the nexus in each
+            worker, and kept for the next calls. Only the perturbed
+            inputs are sent to the workers. close_pool() stops it, it
+            must be called if the nexus is changed other than by its
+            inputs. The pool belongs to this nexus only, copies and
+            pickles of the nexus leave it out, and it is terminated if
+            the nexus is collected without close_pool().
+        """
+        
+        settings = self.finite_difference_settings
+        method   = settings.method
+        step     = settings.step
+        
+        x = np.asarray(x)*1.0
+        
+        inplen = len(self.optimization_problem.inputs)
+        
+        # the perturbed points
+        if method == 'forward':
+            obj = self.objective(x)
+            con = self.all_constraints(x)
+            points = [ x + step*e for e in np.eye(inplen) ]
+        elif method == 'central':
+            points = [ x + step*e for e in np.eye(inplen) ] + [ x - step*e for e in np.eye(inplen) ]
+        elif method == 'complex':
+            points = [ x + 1j*step*e for e in np.eye(inplen) ]
+        else:
+            raise ValueError , 'unknown finite difference method "%s"' % method
         
-        obj = self.objective(x)
-        con = self.all_constraints(x)
+        # evaluated here or in the pool
+        if settings.workers > 1:
+            values = self.pool().map(evaluate_forked_point,points)
+        else:
+            values = [ evaluate_point(self,point) for point in points ]
+            
+        dtype = complex if method == 'complex' else float
+        objs  = np.array([ np.ravel(v[0])[0] for v in values ],dtype=dtype)
+        cons  = np.array([ v[1] for v in values ],dtype=dtype).reshape([len(points),-1])
+        
+        if method == 'forward':
+            grad_obj = (objs - np.ravel(obj)[0])/step
+            jac_con  = (cons - con).T/step
+        elif method == 'central':
+            grad_obj = (objs[:inplen] - objs[inplen:])/(2.*step)
+            jac_con  = (cons[:inplen] - cons[inplen:]).T/(2.*step)
+        elif method == 'complex':
+            grad_obj = np.imag(objs)/step
+            jac_con  = np.imag(cons).T/step
+            # leave the nexus at the real inputs
+            self.evaluate(np.real(x))
         
-        inpu  = self.optimization_problem.inputs
-        const = self.optimization_problem.constraints
+        grad_obj = grad_obj.astype(float)
+        jac_con  = jac_con.astype(float)
         
-        inplen = len(inpu)
-        conlen = len(const)
+        return grad_obj, jac_con
+    
+    def pool(self):
+        """ the process pool of finite_difference(), forked on first use """
         
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
+        global _forked_nexus
         
-        con2 = (con*np.ones_like(jac_con))
+        workers = int(self.finite_difference_settings.workers)
         
-        for ii in xrange(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii]+ 1e-8
+        pool = dict.get(self,'_pool')
+        if pool is not None and pool._processes != workers:
+            self.close_pool()
+            pool = None
             
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+        if pool is None:
+            # set before the pool forks, each worker keeps its copy
+            _forked_nexus = self
+            try:
+                pool = multiprocessing.Pool(workers)
+            finally:
+                _forked_nexus = None
+            
+            # hidden items, not copied or pickled with the nexus
+            dict.__setitem__(self,'_pool',pool)
+            dict.__setitem__(self,'_pool_finalizer',Finalize(self,pool.terminate))
         
-        grad_obj = (grad_obj - obj)/(1e-8)
+        return pool
+    
+    def close_pool(self):
+        """ stops the process pool of finite_difference() """
         
-        jac_con = (jac_con - con2).T/(1e-8)
+        finalizer = dict.pop(self,'_pool_finalizer',None)
+        if finalizer is not None:
+            finalizer.cancel()
         
-        grad_obj = grad_obj.astype(float)
-        jac_con  = jac_con.astype(float)
-        
-        return grad_obj, jac_con
+        pool = dict.pop(self,'_pool',None)
+        if pool is not None:
+            pool.close()
+            pool.join()
+    
+    def __deepcopy__(self,memo):
+        # the pool stays with this nexus
+        hidden = [ (k,dict.pop(self,k)) for k in ('_pool','_pool_finalizer') if dict.__contains__(self,k) ]
+        try:
+            return copy_bunch(self,memo)
+        finally:
+            for k,v in hidden:
+                dict.__setitem__(self,k,v)
     
     
     def translate(self,x = None):
@@ -210,7 +310,23 @@ class Nexus(Data):
         print const_table
         
         return inpu,const_table
-                               
-        
+
+
+# ----------------------------------------------------------------------
+#  Finite Difference Points
+# ----------------------------------------------------------------------
+
+# the nexus, inherited by the forked workers
+_forked_nexus = None
+
+def evaluate_point(nexus,x):
+    """ the objective and constraints of nexus at the scaled inputs x """
+    
+    obj = nexus.objective(x)
+    con = nexus.all_constraints(x)
     
- 
+    return obj, con
+
+def evaluate_forked_point(x):
+    """ runs in the worker process """
+    return evaluate_point(_forked_nexus,x)
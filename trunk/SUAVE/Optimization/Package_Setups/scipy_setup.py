@@ -2,6 +2,7 @@
 # 
 # Created:  Aug 2015, E. Botero 
 # Modified: Feb 2016, M. Vegh
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,7 +16,13 @@ import scipy as sp
 #  Something that should become a class at some point
 # ----------------------------------------------------------------------
 
-def SciPy_Solve(problem,solver='SLSQP'):
+def SciPy_Solve(problem,solver='SLSQP',FD='single'):
+    """ FD - 'single'   : SLSQP differences the functions itself
+             'parallel' : the gradients of SLSQP come from
+                          problem.finite_difference(), in a pool of
+                          problem.finite_difference_settings.workers
+                          processes
+    """
     
     inp = problem.optimization_problem.inputs
     obj = problem.optimization_problem.objective
@@ -38,7 +45,15 @@ def SciPy_Solve(problem,solver='SLSQP'):
 
 
     # Finalize problem statement and run
-    if solver=='SLSQP':
+    if solver=='SLSQP' and FD=='parallel':
+        gradients = SciPy_Gradients(problem)
+        try:
+            outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,iter=200,
+                                             fprime=gradients.objective,fprime_eqcons=gradients.equality_constraint,fprime_ieqcons=gradients.inequality_constraint)
+        finally:
+            # the workers of the gradients
+            problem.close_pool()
+    elif solver=='SLSQP':
         outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,iter=200)
     else:
         outputs = sp.optimize.minimize(wrapper,x,method=solver)
@@ -56,3 +71,37 @@ def SciPy_Problem(problem,x):
 
     
     return obj
+
+
+class SciPy_Gradients(object):
+    """ the gradients of the objective and constraints for SLSQP, from one
+        call of problem.finite_difference() per point
+    """
+    
+    def __init__(self,problem):
+        self.problem = problem
+        self.x       = None
+        
+        # rows of all the constraints that are equalities and inequalities
+        con = problem.optimization_problem.constraints
+        self.equalities   = np.array([ c[1] == '=' for c in con ],dtype=bool)
+        self.inequalities = ~self.equalities
+        # inequality_constraint() flips the sign of upper bounds
+        self.signs = np.array([ -1. if c[1] == '<' else 1. for c in con ])
+        
+    def gradients(self,x):
+        if self.x is None or not np.all(self.x == x):
+            self.grad_obj, self.jac_con = self.problem.finite_difference(x)
+            self.x = np.array(x)*1.0
+        return self.grad_obj, self.jac_con
+    
+    def objective(self,x):
+        return self.gradients(x)[0]
+    
+    def equality_constraint(self,x):
+        jac_con = self.gradients(x)[1]
+        return jac_con[self.equalities,:]
+    
+    def inequality_constraint(self,x):
+        jac_con = self.gradients(x)[1]
+        return (self.signs[:,None]*jac_con)[self.inequalities,:]
@@ -1,12 +1,31 @@
 # carpet_plot.py
 #
-# Created : Feb 2016, M. Vegh 
+# Created : Feb 2016, M. Vegh
+# Modified: Oct 2016, SUAVE Team
+
+import os
+import multiprocessing
+
 from SUAVE.Core import Data
 import numpy as np
 import matplotlib.pyplot as plt
-def carpet_plot(problem, number_of_points, plot_obj=1, plot_const=0): 
+
+def carpet_plot(problem, number_of_points, plot_obj=1, plot_const=0, workers=1, table_file=None):
     #SUAVE.Optimization.carpet_plot(problem, ):
     #takes in an optimization problem and runs a carpet plot of the first 2 variables
+    #
+    #workers    - number of forked processes to evaluate the grid points,
+    #             each holds its own copy of the problem. 1 evaluates on
+    #             the problem itself
+    #table_file - every point is appended to this text table as soon as
+    #             it is done. if the file exists, the points in it are not
+    #             evaluated again, so an interrupted sweep can be resumed.
+    #             a table of another grid or problem raises a ValueError
+    #
+    #the points are visited in a serpentine order (along the second
+    #variable, back and forth), so each point follows a neighbour and
+    #warm started missions start close to their solution. a worker is
+    #handed one run of the serpentine at a time.
 
     #unpack
     opt_prob        = problem.optimization_problem
@@ -22,29 +41,44 @@ def carpet_plot(problem, number_of_points, plot_obj=1, plot_const=0):
     base_constraints= opt_prob.constraints
     constraint_names= base_constraints[:,0]
     constraint_scale= base_constraints[:,3]
-   
+
     #define inputs, output, and constraints for sweep
     inputs          = np.zeros([2,number_of_points])
     obj             = np.zeros([number_of_points,number_of_points])
     constraint_num  = np.shape(base_constraints)[0] # of constraints
     constraint_val  = np.zeros([constraint_num,number_of_points,number_of_points])
-    
-    
+
+
     #create inputs matrix
     inputs[0,:] = np.linspace(bnd[idx0][0], bnd[idx0][1], number_of_points)
     inputs[1,:] = np.linspace(bnd[idx1][0], bnd[idx1][1], number_of_points)
 
-    
+    #points already in the table
+    header = table_header(names[[idx0,idx1]], obj_name, constraint_names)
+    done   = read_table(table_file, inputs, header)
+    for (i,j),(obj_ij,constraints_ij) in done.items():
+        obj[j,i]             = obj_ij
+        constraint_val[:,j,i]= constraints_ij
+
+    #the runs of the serpentine left to evaluate
+    runs = []
+    for run in serpentine(number_of_points):
+        run = [ (i,j,inputs[0,i],inputs[1,j]) for i,j in run if not (i,j) in done ]
+        if run:
+            runs.append(run)
+
     #inputs defined; now run sweep
-    for i in range(0, number_of_points):
-        for j in range(0,number_of_points):
-            #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
-            opt_prob.inputs[:,1][idx0]= inputs[0,i]
-            opt_prob.inputs[:,1][idx1]= inputs[1,j]
-   
-            obj[j,i]             = problem.objective()*obj_scaling
-            constraint_val[:,j,i]= problem.all_constraints().tolist()
-  
+    table = open_table(table_file, header)
+    try:
+        for i,j,obj_ij,constraints_ij in sweep(problem, (idx0,idx1), runs, workers):
+            obj[j,i]             = obj_ij
+            constraint_val[:,j,i]= constraints_ij
+            if table is not None:
+                write_row(table, i, j, inputs[0,i], inputs[1,j], obj_ij, constraints_ij)
+    finally:
+        if table is not None:
+            table.close()
+
     if plot_obj==1:
         plt.figure(0)
         CS = plt.contourf(inputs[0,:],inputs[1,:], obj, linewidths=2)
@@ -52,10 +86,10 @@ def carpet_plot(problem, number_of_points, plot_obj=1, plot_const=0):
         cbar.ax.set_ylabel(obj_name)
         plt.xlabel(names[idx0])
         plt.ylabel(names[idx1])
-        
-       
+
+
     if plot_const==1:
-        
+
         for i in range(0, constraint_num): #constraint_num):
             plt.figure(i+1)
             CS_const=plt.contour(inputs[0,:],inputs[1,:], constraint_val[i,:,:])
@@ -63,14 +97,156 @@ def carpet_plot(problem, number_of_points, plot_obj=1, plot_const=0):
             cbar.ax.set_ylabel(constraint_names[i])
             plt.xlabel(names[idx0])
             plt.ylabel(names[idx1])
-    plt.show()      
-       
-        
+    plt.show()
+
+
     #pack outputs
     outputs= Data()
     outputs.inputs         = inputs
     outputs.objective      = obj
     outputs.constraint_val =constraint_val
     return outputs
-    
-    
\ No newline at end of file
+
+
+# ----------------------------------------------------------------------
+#  Sweep
+# ----------------------------------------------------------------------
+
+def serpentine(number_of_points):
+    #the grid indices (i,j) in runs along j, every other run reversed
+    runs = []
+    for i in range(0, number_of_points):
+        js = range(0, number_of_points)
+        if i % 2:
+            js.reverse()
+        runs.append([ (i,j) for j in js ])
+    return runs
+
+
+def sweep(problem, indices, runs, workers=1):
+    #yields (i, j, objective, constraints) of the points of runs, as they
+    #are evaluated. indices are the locations of the two swept variables
+
+    if workers <= 1:
+        for run in runs:
+            for i,j,x0,x1 in run:
+                obj_ij, constraints_ij = evaluate_point(problem, indices, x0, x1)
+                yield i, j, obj_ij, constraints_ij
+        return
+
+    global _forked_problem
+
+    #set before the pool forks, each worker then has its own copy
+    _forked_problem = (problem, indices)
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        for points in pool.imap_unordered(evaluate_forked_run, runs):
+            for point in points:
+                yield point
+        pool.close()
+    finally:
+        #left unfinished, ie. interrupted
+        pool.terminate()
+        pool.join()
+        _forked_problem = None
+
+    return
+
+
+def evaluate_point(problem, indices, x0, x1):
+    #the objective and constraints of the problem with the swept variables
+    #at indices set to x0 and x1
+
+    opt_prob   = problem.optimization_problem
+    idx0, idx1 = indices
+
+    #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
+    opt_prob.inputs[:,1][idx0]= x0
+    opt_prob.inputs[:,1][idx1]= x1
+
+    obj_scaling    = opt_prob.objective[0][1]
+    obj_ij         = problem.objective()*obj_scaling
+    constraints_ij = problem.all_constraints().tolist()
+
+    return obj_ij, constraints_ij
+
+
+# the problem and the swept indices, inherited by the forked workers
+_forked_problem = None
+
+def evaluate_forked_run(run):
+    #runs in the worker process
+    problem, indices = _forked_problem
+    points = []
+    for i,j,x0,x1 in run:
+        obj_ij, constraints_ij = evaluate_point(problem, indices, x0, x1)
+        points.append( (i, j, obj_ij, constraints_ij) )
+    return points
+
+
+# ----------------------------------------------------------------------
+#  Table
+# ----------------------------------------------------------------------
+
+def table_header(input_names, obj_name, constraint_names):
+    #the column names of a table
+    header = ['i','j'] + list(input_names) + [obj_name] + list(constraint_names)
+    return [ str(h) for h in header ]
+
+
+def open_table(table_file, header):
+    #the table to append points to, with a header if it is new
+
+    if table_file is None:
+        return None
+
+    new   = not os.path.exists(table_file) or os.path.getsize(table_file) == 0
+    table = open(table_file, 'a')
+    if new:
+        table.write('# ' + '\t'.join(header) + '\n')
+        table.flush()
+
+    return table
+
+
+def write_row(table, i, j, x0, x1, obj_ij, constraints_ij):
+    #one point, written out at once
+    values = [x0, x1] + np.ravel(obj_ij).tolist() + list(constraints_ij)
+    table.write('%i\t%i\t' % (i,j) + '\t'.join([ repr(float(v)) for v in values ]) + '\n')
+    table.flush()
+    os.fsync(table.fileno())
+    return
+
+
+def read_table(table_file, inputs, header):
+    #the points of a table, {(i,j):(objective, constraints)}. a last line
+    #cut short by an interruption is skipped
+
+    done = {}
+    if table_file is None or not os.path.exists(table_file):
+        return done
+
+    number_of_points = inputs.shape[1]
+
+    for line in open(table_file, 'r'):
+        if not line.endswith('\n'):
+            continue
+        if line.startswith('#'):
+            if line[2:-1].split('\t') != header:
+                raise ValueError , 'the columns of %s are not those of this problem' % table_file
+            continue
+        words = line.split()
+        if len(words) != len(header):
+            raise ValueError , 'the rows of %s are not those of this problem' % table_file
+
+        i, j   = int(words[0]), int(words[1])
+        values = [ float(w) for w in words[2:] ]
+
+        if i >= number_of_points or j >= number_of_points or \
+           values[0] != inputs[0,i] or values[1] != inputs[1,j]:
+            raise ValueError , 'the points of %s are not on this grid' % table_file
+
+        done[(i,j)] = (values[2], values[3:])
+
+    return done
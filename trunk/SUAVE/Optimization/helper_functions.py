@@ -2,6 +2,7 @@
 # 
 # Created:  May 2015, E. Botero
 # Modified: Feb 2015, M. Vegh
+#           Oct 2016, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -114,7 +115,11 @@ def get_values(dictionary,outputs,aliases):
     values = np.zeros(len(outputs))
     for ii in xrange(0,len(outputs)):
         splitstring = pointer[ii].split('.')
-        values[ii]  = eval('dictionary.'+'.'.join(splitstring[0:]))
+        value       = eval('dictionary.'+'.'.join(splitstring[0:]))
+        # complex step differences
+        if np.iscomplexobj(value) and not np.iscomplexobj(values):
+            values = values.astype(complex)
+        values[ii]  = value
     
     return values
 